@@ -1,3 +1,3 @@
 from . import providers  # NOQA: F401
 from . import utils  # NOQA: F401
-from .main import DKG  # NOQA: F401
+from .main import DKG, AsyncDKG  # NOQA: F401
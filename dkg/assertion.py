@@ -15,51 +15,100 @@
 # specific language governing permissions and limitations
 # under the License.
 
+import itertools
+import os
+from concurrent.futures import ProcessPoolExecutor
 from typing import Literal
 
+from dkg.dataclasses import PreparedAssertion
 from dkg.manager import DefaultRequestManager
 from dkg.module import Module
 from dkg.types import JSONLD, HexStr
-from dkg.utils.merkle import MerkleTree, hash_assertion_with_indexes
-from dkg.utils.metadata import generate_assertion_metadata
-from dkg.utils.rdf import format_content
+from dkg.utils import rdf
+from dkg.utils.rdf import format_content, prepare_content
 
 
 class Assertion(Module):
     def __init__(self, manager: DefaultRequestManager):
         self.manager = manager
 
-    def format_graph(self, content: dict[Literal["public", "private"], JSONLD]):
+    def format_graph(
+        self, content: dict[Literal["public", "private"], JSONLD] | PreparedAssertion
+    ):
+        if isinstance(content, PreparedAssertion):
+            return content.to_assertions()
+
         return format_content(content)
 
-    def get_public_assertion_id(
-        self, content: dict[Literal["public", "private"], JSONLD]
-    ) -> HexStr:
-        assertions = format_content(content)
+    def prepare(
+        self,
+        content: dict[Literal["public", "private"], JSONLD],
+        content_type: Literal["JSON-LD", "N-Quads"] = "JSON-LD",
+    ) -> PreparedAssertion:
+        return prepare_content(content, content_type)
 
-        return MerkleTree(
-            hash_assertion_with_indexes(assertions["public"]),
-            sort_pairs=True,
-        ).root
+    def prepare_many(
+        self,
+        contents: list[dict[Literal["public", "private"], JSONLD]],
+        content_type: Literal["JSON-LD", "N-Quads"] = "JSON-LD",
+        max_workers: int | None = None,
+    ) -> list[PreparedAssertion]:
+        if max_workers is None:
+            max_workers = os.cpu_count() or 1
+        max_workers = min(max_workers, len(contents))
 
-    def get_size(self, content: dict[Literal["public", "private"], JSONLD]) -> int:
-        assertions = format_content(content)
-        public_assertion_metadata = generate_assertion_metadata(assertions["public"])
+        if max_workers < 2:
+            return [prepare_content(content, content_type) for content in contents]
 
-        return public_assertion_metadata["size"]
+        # Each worker gets a few batches, keeping pickling overhead low while
+        # still balancing contents of different sizes between the workers
+        chunksize = max(len(contents) // (max_workers * 4), 1)
+        # Workers started with spawn don't inherit backends registered or set at
+        # runtime, so the selected backend is passed to each of them
+        backend_name = rdf.default_canonicalization_backend
+        with ProcessPoolExecutor(
+            max_workers=max_workers,
+            initializer=_initialize_worker,
+            initargs=(backend_name, rdf.canonicalization_backends[backend_name]),
+        ) as executor:
+            return list(
+                executor.map(
+                    prepare_content,
+                    contents,
+                    itertools.repeat(content_type),
+                    chunksize=chunksize,
+                )
+            )
 
-    def get_triples_number(
-        self, content: dict[Literal["public", "private"], JSONLD]
+    def get_public_assertion_id(
+        self, content: dict[Literal["public", "private"], JSONLD] | PreparedAssertion
+    ) -> HexStr:
+        return self._prepare(content).public_assertion_id
+
+    def get_size(
+        self, content: dict[Literal["public", "private"], JSONLD] | PreparedAssertion
     ) -> int:
-        assertions = format_content(content)
-        public_assertion_metadata = generate_assertion_metadata(assertions["public"])
+        return self._prepare(content).size
 
-        return public_assertion_metadata["triples_number"]
+    def get_triples_number(
+        self, content: dict[Literal["public", "private"], JSONLD] | PreparedAssertion
+    ) -> int:
+        return self._prepare(content).triples_number
 
     def get_chunks_number(
-        self, content: dict[Literal["public", "private"], JSONLD]
+        self, content: dict[Literal["public", "private"], JSONLD] | PreparedAssertion
     ) -> int:
-        assertions = format_content(content)
-        public_assertion_metadata = generate_assertion_metadata(assertions["public"])
+        return self._prepare(content).chunks_number
+
+    def _prepare(
+        self, content: dict[Literal["public", "private"], JSONLD] | PreparedAssertion
+    ) -> PreparedAssertion:
+        if isinstance(content, PreparedAssertion):
+            return content
+
+        return prepare_content(content)
+
 
-        return public_assertion_metadata["chunks_number"]
+def _initialize_worker(backend_name: str, backend: rdf.CanonicalizationBackend) -> None:
+    rdf.register_canonicalization_backend(backend_name, backend)
+    rdf.set_canonicalization_backend(backend_name)
@@ -14,15 +14,18 @@
 # KIND, either express or implied.  See the License for the
 # specific language governing permissions and limitations
 # under the License.
-
+import asyncio
 import json
 import math
 import re
-from typing import Literal, Type
+from concurrent.futures import Future
+from functools import partial
+from typing import Callable, Literal, Type
 
-from pyld import jsonld
+from eth_utils import event_abi_to_log_topic
 from web3 import Web3
 from web3.constants import ADDRESS_ZERO, HASH_ZERO
+from web3.contract import AsyncContract, Contract
 from web3.exceptions import ContractLogicError
 from web3.types import TxReceipt
 
@@ -38,6 +41,8 @@ from dkg.dataclasses import (
     KnowledgeAssetContentVisibility,
     KnowledgeAssetEnumStates,
     NodeResponseDict,
+    OperationStatusTransition,
+    PreparedAssertion,
 )
 from dkg.exceptions import (
     DatasetOutputFormatNotSupported,
@@ -45,37 +50,65 @@ from dkg.exceptions import (
     InvalidStateOption,
     InvalidTokenAmount,
     MissingKnowledgeAssetState,
-    OperationNotFinished,
+    TransactionReverted,
 )
-from dkg.manager import DefaultRequestManager
+from dkg.manager import AsyncRequestManager, DefaultRequestManager
 from dkg.method import Method
-from dkg.module import Module
-from dkg.types import JSONLD, UAL, Address, AgreementData, HexStr, Wei
+from dkg.module import AsyncModule, Module
+from dkg.providers.transaction import PendingTransaction
+from dkg.types import JSONLD, UAL, Address, AgreementData, HexStr, NQuads, Wei
 from dkg.utils.blockchain_request import BlockchainRequest
-from dkg.utils.decorators import retry
-from dkg.utils.merkle import MerkleTree, hash_assertion_with_indexes
-from dkg.utils.metadata import (
-    generate_agreement_id,
-    generate_assertion_metadata,
-    generate_keyword,
+from dkg.utils.decorators import batchable
+from dkg.utils.cache import LRUCache, TokenStateCache, get_assertion_cache
+from dkg.utils.merkle import (
+    AssertionMerkleTree,
+    calculate_merkle_root,
+    hash_assertion_leaves,
 )
+from dkg.utils.metadata import generate_agreement_id, generate_keyword
 from dkg.utils.node_request import (
     NodeRequest,
     OperationStatus,
+    OperationStatusTracker,
     StoreTypes,
     validate_operation_status,
 )
-from dkg.utils.rdf import format_content, normalize_dataset
+from dkg.utils.rdf import (
+    normalize_content,
+    normalize_dataset,
+    prepare_content,
+    to_prepared_assertion,
+)
+from dkg.utils.steps import Batch, Gather, Steps, Wait, steps
 from dkg.utils.ual import format_ual, parse_ual
 
 
-class KnowledgeAsset(Module):
-    def __init__(self, manager: DefaultRequestManager):
+class BaseKnowledgeAsset:
+    """
+    Knowledge asset operations shared by the sync and async modules. Methods
+    yield their requests, which the module's driver either returns right away
+    or awaits, so only the I/O differs between the two.
+    """
+
+    ASSERTION_TREES_CACHE_SIZE = 16
+    STATE_EVENTS = ("AssetStateUpdated", "AssetStateUpdateCanceled", "AssetBurnt")
+    STATE_LOGS_BLOCK_RANGE = 1000
+
+    def __init__(
+        self,
+        manager: DefaultRequestManager | AsyncRequestManager,
+        state_cache_ttl: float = 6,
+    ):
         self.manager = manager
+        self._assertion_trees: LRUCache[UAL, AssertionMerkleTree] = LRUCache(
+            self.ASSERTION_TREES_CACHE_SIZE
+        )
+        self._state_cache = TokenStateCache(ttl=state_cache_ttl)
 
     _owner = Method(BlockchainRequest.owner_of)
 
-    def is_valid_ual(self, ual: UAL) -> bool:
+    @steps
+    def is_valid_ual(self, ual: UAL) -> Steps[bool]:
         if not ual or not isinstance(ual, str):
             raise ValueError("UAL must be a non-empty string.")
 
@@ -98,6 +131,8 @@ class KnowledgeAsset(Module):
                 f"Invalid DKG prefix. Expected: 'dkg'. Received: '{prefixes[1]}'."
             )
 
+        yield self.manager.blockchain_provider.initialize()
+
         if prefixes[2] != (
             blockchain_name := (
                 self.manager.blockchain_provider.blockchain_id.split(":")[0]
@@ -117,9 +152,9 @@ class KnowledgeAsset(Module):
                     f"Expected: '${chain_id}'. Received: '${prefixes[3]}'."
                 )
 
-        contract_address = self.manager.blockchain_provider.contracts[
-            "ContentAssetStorage"
-        ].address
+        contract_address = (
+            yield self.manager.blockchain_provider.get_contract("ContentAssetStorage")
+        ).address
 
         if parts[1].lower() != contract_address.lower():
             raise ValueError(
@@ -129,7 +164,7 @@ class KnowledgeAsset(Module):
             )
 
         try:
-            owner = self._owner(int(parts[2]))
+            owner = yield self._owner(int(parts[2]))
 
             if not owner or owner == ADDRESS_ZERO:
                 raise ValueError("Token does not exist or has no owner.")
@@ -141,54 +176,62 @@ class KnowledgeAsset(Module):
     _get_contract_address = Method(BlockchainRequest.get_contract_address)
     _get_current_allowance = Method(BlockchainRequest.allowance)
 
-    def get_current_allowance(self, spender: Address | None = None) -> Wei:
+    @steps
+    def get_current_allowance(self, spender: Address | None = None) -> Steps[Wei]:
         if spender is None:
-            spender = self._get_contract_address("ServiceAgreementV1")
+            spender = yield self._get_contract_address("ServiceAgreementV1")
 
         return int(
-            self._get_current_allowance(
-                self.manager.blockchain_provider.account.address, spender
+            (
+                yield self._get_current_allowance(
+                    self.manager.blockchain_provider.account.address, spender
+                )
             )
         )
 
     _increase_allowance = Method(BlockchainRequest.increase_allowance)
     _decrease_allowance = Method(BlockchainRequest.decrease_allowance)
 
-    def set_allowance(self, token_amount: Wei, spender: Address | None = None) -> Wei:
+    @steps
+    def set_allowance(
+        self, token_amount: Wei, spender: Address | None = None
+    ) -> Steps[Wei]:
         if spender is None:
-            spender = self._get_contract_address("ServiceAgreementV1")
+            spender = yield self._get_contract_address("ServiceAgreementV1")
 
-        current_allowance = self.get_current_allowance(spender)
+        current_allowance = yield self.get_current_allowance(spender)
 
         allowance_difference = token_amount - current_allowance
 
         if allowance_difference > 0:
-            self._increase_allowance(spender, allowance_difference)
+            yield self._increase_allowance(spender, allowance_difference)
         elif allowance_difference < 0:
-            self._decrease_allowance(spender, -allowance_difference)
+            yield self._decrease_allowance(spender, -allowance_difference)
 
         return allowance_difference
 
+    @steps
     def increase_allowance(
         self, token_amount: Wei, spender: Address | None = None
-    ) -> Wei:
+    ) -> Steps[Wei]:
         if spender is None:
-            spender = self._get_contract_address("ServiceAgreementV1")
+            spender = yield self._get_contract_address("ServiceAgreementV1")
 
-        self._increase_allowance(spender, token_amount)
+        yield self._increase_allowance(spender, token_amount)
 
         return token_amount
 
+    @steps
     def decrease_allowance(
         self, token_amount: Wei, spender: Address | None = None
-    ) -> Wei:
+    ) -> Steps[Wei]:
         if spender is None:
-            spender = self._get_contract_address("ServiceAgreementV1")
+            spender = yield self._get_contract_address("ServiceAgreementV1")
 
-        current_allowance = self.get_current_allowance(spender)
+        current_allowance = yield self.get_current_allowance(spender)
         subtracted_value = min(token_amount, current_allowance)
 
-        self._decrease_allowance(spender, subtracted_value)
+        yield self._decrease_allowance(spender, subtracted_value)
 
         return subtracted_value
 
@@ -202,101 +245,66 @@ class KnowledgeAsset(Module):
     _local_store = Method(NodeRequest.local_store)
     _publish = Method(NodeRequest.publish)
 
+    @steps
     def create(
         self,
-        content: dict[Literal["public", "private"], JSONLD],
+        content: dict[Literal["public", "private"], JSONLD] | PreparedAssertion,
         epochs_number: int,
         token_amount: Wei | None = None,
         immutable: bool = False,
         content_type: Literal["JSON-LD", "N-Quads"] = "JSON-LD",
         paranet_ual: UAL | None = None,
-    ) -> dict[str, UAL | HexStr | dict[str, dict[str, str] | TxReceipt]]:
-        blockchain_id = self.manager.blockchain_provider.blockchain_id
-        assertions = format_content(content, content_type)
+        on_status: Callable[[OperationStatusTransition], None] | None = None,
+        status_tracker: OperationStatusTracker | None = None,
+    ) -> Steps[dict[str, UAL | HexStr | dict[str, dict[str, str] | TxReceipt]]]:
+        yield self.manager.blockchain_provider.initialize()
 
-        public_assertion_id = MerkleTree(
-            hash_assertion_with_indexes(assertions["public"]),
-            sort_pairs=True,
-        ).root
-        public_assertion_metadata = generate_assertion_metadata(assertions["public"])
+        blockchain_id = self.manager.blockchain_provider.blockchain_id
+        prepared_assertion, public_assertion_tree = self._prepare_content(
+            content, content_type
+        )
+        public_assertion_id = prepared_assertion.public_assertion_id
+        public_assertion_metadata = prepared_assertion.metadata
 
-        content_asset_storage_address = self._get_asset_storage_address(
+        content_asset_storage_address = yield self._get_asset_storage_address(
             "ContentAssetStorage"
         )
 
         if token_amount is None:
-            token_amount = int(
-                self._get_bid_suggestion(
-                    blockchain_id,
-                    epochs_number,
-                    public_assertion_metadata["size"],
-                    content_asset_storage_address,
-                    public_assertion_id,
-                    DEFAULT_HASH_FUNCTION_ID,
-                    token_amount or BidSuggestionRange.LOW,
-                )["bidSuggestion"]
+            bid_suggestion = yield self._get_bid_suggestion(
+                blockchain_id,
+                epochs_number,
+                public_assertion_metadata["size"],
+                content_asset_storage_address,
+                public_assertion_id,
+                DEFAULT_HASH_FUNCTION_ID,
+                token_amount or BidSuggestionRange.LOW,
             )
+            token_amount = int(bid_suggestion["bidSuggestion"])
 
-        current_allowance = self.get_current_allowance()
+        current_allowance = yield self.get_current_allowance()
         if is_allowance_increased := current_allowance < token_amount:
-            self.increase_allowance(token_amount)
+            yield self.increase_allowance(token_amount)
 
         result = {"publicAssertionId": public_assertion_id, "operation": {}}
 
         try:
-            if paranet_ual is None:
-                receipt: TxReceipt = self._create(
-                    {
-                        "assertionId": Web3.to_bytes(hexstr=public_assertion_id),
-                        "size": public_assertion_metadata["size"],
-                        "triplesNumber": public_assertion_metadata["triples_number"],
-                        "chunksNumber": public_assertion_metadata["chunks_number"],
-                        "tokenAmount": token_amount,
-                        "epochsNumber": epochs_number,
-                        "scoreFunctionId": DEFAULT_PROXIMITY_SCORE_FUNCTIONS_PAIR_IDS[
-                            self.manager.blockchain_provider.environment
-                        ][blockchain_id],
-                        "immutable_": immutable,
-                    }
-                )
-            else:
-                parsed_paranet_ual = parse_ual(paranet_ual)
-                paranet_knowledge_asset_storage, paranet_knowledge_asset_token_id = (
-                    parsed_paranet_ual["contract_address"],
-                    parsed_paranet_ual["token_id"],
-                )
-
-                receipt: TxReceipt = self._mint_paranet_knowledge_asset(
-                    paranet_knowledge_asset_storage,
-                    paranet_knowledge_asset_token_id,
-                    {
-                        "assertionId": Web3.to_bytes(hexstr=public_assertion_id),
-                        "size": public_assertion_metadata["size"],
-                        "triplesNumber": public_assertion_metadata["triples_number"],
-                        "chunksNumber": public_assertion_metadata["chunks_number"],
-                        "tokenAmount": token_amount,
-                        "epochsNumber": epochs_number,
-                        "scoreFunctionId": DEFAULT_PROXIMITY_SCORE_FUNCTIONS_PAIR_IDS[
-                            self.manager.blockchain_provider.environment
-                        ][blockchain_id],
-                        "immutable_": immutable,
-                    },
-                )
-
-                result["paranetId"] = Web3.to_hex(
-                    Web3.solidity_keccak(
-                        ["address", "uint256"],
-                        [
-                            paranet_knowledge_asset_storage,
-                            paranet_knowledge_asset_token_id,
-                        ],
-                    )
-                )
+            receipt: TxReceipt = yield self._mint_knowledge_asset(
+                public_assertion_id,
+                public_assertion_metadata,
+                token_amount,
+                epochs_number,
+                immutable,
+                paranet_ual,
+            )
         except ContractLogicError as err:
             if is_allowance_increased:
-                self.decrease_allowance(token_amount)
+                yield self.decrease_allowance(token_amount)
             raise err
 
+        if paranet_ual is not None:
+            result["paranetId"] = self._get_paranet_id(paranet_ual)
+
         events = self.manager.blockchain_provider.decode_logs_event(
             receipt,
             "ContentAsset",
@@ -307,65 +315,399 @@ class KnowledgeAsset(Module):
         result["UAL"] = format_ual(
             blockchain_id, content_asset_storage_address, token_id
         )
+        if public_assertion_tree is not None:
+            self._assertion_trees.set(result["UAL"], public_assertion_tree)
         result["operation"]["mintKnowledgeAsset"] = json.loads(Web3.to_json(receipt))
+        result["operation"].update(
+            (
+                yield from self._publish_knowledge_asset(
+                    content_asset_storage_address,
+                    token_id,
+                    prepared_assertion,
+                    on_status,
+                    status_tracker,
+                )
+            )
+        )
+
+        return result
+
+    @steps
+    def create_many(
+        self,
+        contents: list[dict[Literal["public", "private"], JSONLD] | PreparedAssertion],
+        epochs_number: int,
+        token_amount: Wei | None = None,
+        immutable: bool = False,
+        content_type: Literal["JSON-LD", "N-Quads"] = "JSON-LD",
+        paranet_ual: UAL | None = None,
+        max_workers: int = 10,
+        on_status: Callable[[OperationStatusTransition], None] | None = None,
+        status_tracker: OperationStatusTracker | None = None,
+    ) -> Steps[list[dict[str, UAL | HexStr | Exception | dict[str, dict[str, str]]]]]:
+        """
+        Publishes many knowledge assets, pipelining their transactions and
+        polling their operations on the node provider's shared multiplexer.
+        At most `max_workers` node requests are sent at once. on_status is
+        called, and status_tracker updated, from the multiplexer, which runs
+        on worker threads for the sync client, so both must be thread-safe.
+        """
+        yield self.manager.blockchain_provider.initialize()
+
+        blockchain_id = self.manager.blockchain_provider.blockchain_id
+        content_asset_storage_address = yield self._get_asset_storage_address(
+            "ContentAssetStorage"
+        )
+
+        results = [{"operation": {}} for _ in contents]
+        assets = {}
+
+        for i, content in enumerate(contents):
+            if not isinstance(content, PreparedAssertion):
+                try:
+                    content = prepare_content(content, content_type)
+                except Exception as err:
+                    results[i]["error"] = err
+                    continue
+
+            results[i]["publicAssertionId"] = content.public_assertion_id
+
+            assets[i] = {
+                "prepared_assertion": content,
+                "public_assertion_id": content.public_assertion_id,
+                "public_assertion_metadata": content.metadata,
+                "token_amount": token_amount,
+            }
+
+        def fail(index: int, err: Exception) -> None:
+            results[index]["error"] = err
+            assets.pop(index)
+
+        if token_amount is None:
+            bid_suggestions = yield Gather(
+                *(
+                    partial(
+                        self._get_bid_suggestion,
+                        blockchain_id,
+                        epochs_number,
+                        asset["public_assertion_metadata"]["size"],
+                        content_asset_storage_address,
+                        asset["public_assertion_id"],
+                        DEFAULT_HASH_FUNCTION_ID,
+                        BidSuggestionRange.LOW,
+                    )
+                    for asset in assets.values()
+                ),
+                max_workers=max_workers,
+            )
+
+            for i, bid_suggestion in zip(list(assets), bid_suggestions):
+                if isinstance(bid_suggestion, Exception):
+                    fail(i, bid_suggestion)
+                else:
+                    assets[i]["token_amount"] = int(bid_suggestion["bidSuggestion"])
+
+        total_token_amount = sum(asset["token_amount"] for asset in assets.values())
+        allowance_increase = max(
+            total_token_amount - (yield self.get_current_allowance()), 0
+        )
+        if allowance_increase > 0:
+            yield self.increase_allowance(allowance_increase)
+
+        unspent_token_amount = 0
+        pending_mints: dict[int, PendingTransaction] = {}
+        for i, asset in list(assets.items()):
+            try:
+                pending_mints[i] = yield self._mint_knowledge_asset(
+                    asset["public_assertion_id"],
+                    asset["public_assertion_metadata"],
+                    asset["token_amount"],
+                    epochs_number,
+                    immutable,
+                    paranet_ual,
+                    wait_for_receipt=False,
+                )
+            except Exception as err:
+                unspent_token_amount += asset["token_amount"]
+                fail(i, err)
+
+        for i, pending_mint in pending_mints.items():
+            asset = assets[i]
+            try:
+                receipt: TxReceipt = yield pending_mint.result()
+                if receipt["status"] == 0:
+                    raise TransactionReverted(
+                        f"Mint transaction {receipt['transactionHash'].hex()} "
+                        "has been reverted."
+                    )
+            except Exception as err:
+                unspent_token_amount += asset["token_amount"]
+                fail(i, err)
+                continue
+
+            events = self.manager.blockchain_provider.decode_logs_event(
+                receipt,
+                "ContentAsset",
+                "AssetMinted",
+            )
+            asset["token_id"] = events[0].args["tokenId"]
+
+            results[i]["UAL"] = format_ual(
+                blockchain_id, content_asset_storage_address, asset["token_id"]
+            )
+            if paranet_ual is not None:
+                results[i]["paranetId"] = self._get_paranet_id(paranet_ual)
+            results[i]["operation"]["mintKnowledgeAsset"] = json.loads(
+                Web3.to_json(receipt)
+            )
+
+        if unspent_token_amount > 0 and allowance_increase > 0:
+            yield self.decrease_allowance(min(unspent_token_amount, allowance_increase))
+
+        # Results of all publish and local store operations are polled
+        # together by the node provider's multiplexer
+        operation_ids = yield Gather(
+            *(
+                partial(
+                    self._publish_assertion,
+                    content_asset_storage_address,
+                    asset["token_id"],
+                    asset["prepared_assertion"],
+                )
+                for asset in assets.values()
+            ),
+            max_workers=max_workers,
+        )
+
+        publish_results = {}
+        for i, operation_id in zip(list(assets), operation_ids):
+            if isinstance(operation_id, Exception):
+                results[i]["error"] = operation_id
+                continue
+
+            results[i]["operation"]["publish"] = {"operationId": operation_id}
+            publish_results[
+                self.submit_operation_result(
+                    operation_id,
+                    "publish",
+                    on_status=on_status,
+                    status_tracker=status_tracker,
+                )
+            ] = i
+
+        local_store_results = {}
+        while publish_results:
+            published = []
+            for publish_result in (yield Wait(publish_results)):
+                i = publish_results.pop(publish_result)
+                try:
+                    operation_result = publish_result.result()
+                except Exception as err:
+                    results[i]["error"] = err
+                    continue
+
+                results[i]["operation"]["publish"]["status"] = operation_result[
+                    "status"
+                ]
+
+                if operation_result["status"] == OperationStatus.COMPLETED:
+                    published.append(i)
+
+            local_store_responses = yield Gather(
+                *(
+                    partial(
+                        self._local_store,
+                        self._get_assertions_list(
+                            content_asset_storage_address,
+                            assets[i]["token_id"],
+                            assets[i]["prepared_assertion"],
+                        ),
+                    )
+                    for i in published
+                ),
+                max_workers=max_workers,
+            )
+
+            for i, response in zip(published, local_store_responses):
+                if isinstance(response, Exception):
+                    results[i]["error"] = response
+                    continue
+
+                operation_id = response["operationId"]
+                results[i]["operation"]["localStore"] = {"operationId": operation_id}
+                local_store_results[
+                    self.submit_operation_result(
+                        operation_id,
+                        "local-store",
+                        on_status=on_status,
+                        status_tracker=status_tracker,
+                    )
+                ] = i
+
+        while local_store_results:
+            for local_store_result in (yield Wait(local_store_results)):
+                i = local_store_results.pop(local_store_result)
+                try:
+                    results[i]["operation"]["localStore"][
+                        "status"
+                    ] = local_store_result.result()["status"]
+                except Exception as err:
+                    results[i]["error"] = err
+
+        return results
+
+    def _mint_knowledge_asset(
+        self,
+        public_assertion_id: HexStr,
+        public_assertion_metadata: dict[str, int],
+        token_amount: Wei,
+        epochs_number: int,
+        immutable: bool,
+        paranet_ual: UAL | None = None,
+        wait_for_receipt: bool = True,
+    ) -> TxReceipt | PendingTransaction:
+        knowledge_asset_args = {
+            "assertionId": Web3.to_bytes(hexstr=public_assertion_id),
+            "size": public_assertion_metadata["size"],
+            "triplesNumber": public_assertion_metadata["triples_number"],
+            "chunksNumber": public_assertion_metadata["chunks_number"],
+            "tokenAmount": token_amount,
+            "epochsNumber": epochs_number,
+            "scoreFunctionId": DEFAULT_PROXIMITY_SCORE_FUNCTIONS_PAIR_IDS[
+                self.manager.blockchain_provider.environment
+            ][self.manager.blockchain_provider.blockchain_id],
+            "immutable_": immutable,
+        }
+
+        if paranet_ual is None:
+            return self._create(knowledge_asset_args, wait_for_receipt=wait_for_receipt)
+
+        parsed_paranet_ual = parse_ual(paranet_ual)
+
+        return self._mint_paranet_knowledge_asset(
+            parsed_paranet_ual["contract_address"],
+            parsed_paranet_ual["token_id"],
+            knowledge_asset_args,
+            wait_for_receipt=wait_for_receipt,
+        )
+
+    def _get_assertions_list(
+        self,
+        content_asset_storage_address: Address,
+        token_id: int,
+        prepared_assertion: PreparedAssertion,
+    ) -> list[dict[str, str | int | NQuads]]:
+        blockchain_id = self.manager.blockchain_provider.blockchain_id
+        assertions = prepared_assertion.to_assertions()
 
         assertions_list = [
             {
                 "blockchain": blockchain_id,
                 "contract": content_asset_storage_address,
                 "tokenId": token_id,
-                "assertionId": public_assertion_id,
+                "assertionId": prepared_assertion.public_assertion_id,
                 "assertion": assertions["public"],
                 "storeType": StoreTypes.TRIPLE,
             }
         ]
 
-        if content.get("private", None):
+        if prepared_assertion.private:
             assertions_list.append(
                 {
                     "blockchain": blockchain_id,
                     "contract": content_asset_storage_address,
                     "tokenId": token_id,
-                    "assertionId": MerkleTree(
-                        hash_assertion_with_indexes(assertions["private"]),
-                        sort_pairs=True,
-                    ).root,
+                    "assertionId": prepared_assertion.private_assertion_id,
                     "assertion": assertions["private"],
                     "storeType": StoreTypes.TRIPLE,
                 }
             )
 
-        operation_id = self._publish(
-            public_assertion_id,
-            assertions["public"],
-            blockchain_id,
+        return assertions_list
+
+    @steps
+    def _publish_assertion(
+        self,
+        content_asset_storage_address: Address,
+        token_id: int,
+        prepared_assertion: PreparedAssertion,
+    ) -> Steps[str]:
+        response = yield self._publish(
+            prepared_assertion.public_assertion_id,
+            list(prepared_assertion.public),
+            self.manager.blockchain_provider.blockchain_id,
             content_asset_storage_address,
             token_id,
             DEFAULT_HASH_FUNCTION_ID,
-        )["operationId"]
-        operation_result = self.get_operation_result(operation_id, "publish")
+        )
+
+        return response["operationId"]
+
+    def _publish_knowledge_asset(
+        self,
+        content_asset_storage_address: Address,
+        token_id: int,
+        prepared_assertion: PreparedAssertion,
+        on_status: Callable[[OperationStatusTransition], None] | None = None,
+        status_tracker: OperationStatusTracker | None = None,
+    ) -> Steps[dict[str, dict[str, str]]]:
+        assertions_list = self._get_assertions_list(
+            content_asset_storage_address, token_id, prepared_assertion
+        )
+
+        operation = {}
+
+        operation_id = yield self._publish_assertion(
+            content_asset_storage_address, token_id, prepared_assertion
+        )
+        operation_result = yield self.get_operation_result(
+            operation_id,
+            "publish",
+            on_status=on_status,
+            status_tracker=status_tracker,
+        )
 
-        result["operation"]["publish"] = {
+        operation["publish"] = {
             "operationId": operation_id,
             "status": operation_result["status"],
         }
 
         if operation_result["status"] == OperationStatus.COMPLETED:
-            operation_id = self._local_store(assertions_list)["operationId"]
-            operation_result = self.get_operation_result(operation_id, "local-store")
+            operation_id = (yield self._local_store(assertions_list))["operationId"]
+            operation_result = yield self.get_operation_result(
+                operation_id,
+                "local-store",
+                on_status=on_status,
+                status_tracker=status_tracker,
+            )
 
-            result["operation"]["localStore"] = {
+            operation["localStore"] = {
                 "operationId": operation_id,
                 "status": operation_result["status"],
             }
 
-        return result
+        return operation
+
+    @staticmethod
+    def _get_paranet_id(paranet_ual: UAL) -> HexStr:
+        parsed_paranet_ual = parse_ual(paranet_ual)
+
+        return Web3.to_hex(
+            Web3.solidity_keccak(
+                ["address", "uint256"],
+                [
+                    parsed_paranet_ual["contract_address"],
+                    parsed_paranet_ual["token_id"],
+                ],
+            )
+        )
 
     _submit_knowledge_asset = Method(BlockchainRequest.submit_knowledge_asset)
 
+    @steps
     def submit_to_paranet(
         self, ual: UAL, paranet_ual: UAL
-    ) -> dict[str, UAL | Address | TxReceipt]:
+    ) -> Steps[dict[str, UAL | Address | TxReceipt]]:
         parsed_ual = parse_ual(ual)
         knowledge_asset_storage, knowledge_asset_token_id = (
             parsed_ual["contract_address"],
@@ -378,7 +720,7 @@ class KnowledgeAsset(Module):
             parsed_paranet_ual["token_id"],
         )
 
-        receipt: TxReceipt = self._submit_knowledge_asset(
+        receipt: TxReceipt = yield self._submit_knowledge_asset(
             paranet_knowledge_asset_storage,
             paranet_knowledge_asset_token_id,
             knowledge_asset_storage,
@@ -399,14 +741,15 @@ class KnowledgeAsset(Module):
 
     _transfer = Method(BlockchainRequest.transfer_asset)
 
+    @steps
     def transfer(
         self,
         ual: UAL,
         new_owner: Address,
-    ) -> dict[str, UAL | Address | TxReceipt]:
+    ) -> Steps[dict[str, UAL | Address | TxReceipt]]:
         token_id = parse_ual(ual)["token_id"]
 
-        receipt: TxReceipt = self._transfer(
+        receipt: TxReceipt = yield self._transfer(
             self.manager.blockchain_provider.account,
             new_owner,
             token_id,
@@ -425,13 +768,16 @@ class KnowledgeAsset(Module):
     _get_service_agreement_data = Method(BlockchainRequest.get_service_agreement_data)
     _update_asset_state = Method(BlockchainRequest.update_asset_state)
 
+    @steps
     def update(
         self,
         ual: UAL,
-        content: dict[Literal["public", "private"], JSONLD],
+        content: dict[Literal["public", "private"], JSONLD] | PreparedAssertion,
         token_amount: Wei | None = None,
         content_type: Literal["JSON-LD", "N-Quads"] = "JSON-LD",
-    ) -> dict[str, UAL | HexStr | dict[str, str]]:
+        on_status: Callable[[OperationStatusTransition], None] | None = None,
+        status_tracker: OperationStatusTracker | None = None,
+    ) -> Steps[dict[str, UAL | HexStr | dict[str, str]]]:
         parsed_ual = parse_ual(ual)
         blockchain_id, content_asset_storage_address, token_id = (
             parsed_ual["blockchain"],
@@ -439,50 +785,49 @@ class KnowledgeAsset(Module):
             parsed_ual["token_id"],
         )
 
-        assertions = format_content(content, content_type)
-
-        public_assertion_id = MerkleTree(
-            hash_assertion_with_indexes(assertions["public"]),
-            sort_pairs=True,
-        ).root
-        public_assertion_metadata = generate_assertion_metadata(assertions["public"])
+        prepared_assertion, _ = self._prepare_content(content, content_type, ual)
+        assertions = prepared_assertion.to_assertions()
+        public_assertion_id = prepared_assertion.public_assertion_id
+        public_assertion_metadata = prepared_assertion.metadata
 
         if token_amount is None:
-            agreement_id = self.get_agreement_id(
+            agreement_id = yield self.get_agreement_id(
                 content_asset_storage_address, token_id
             )
+
             # TODO: Dynamic types for namedtuples?
-            agreement_data: Type[AgreementData] = self._get_service_agreement_data(
-                agreement_id
+            agreement_data: Type[AgreementData]
+            agreement_data, latest_block = yield Batch(
+                partial(self._get_service_agreement_data, agreement_id),
+                partial(self._get_block, "latest"),
             )
 
-            timestamp_now = self._get_block("latest")["timestamp"]
+            timestamp_now = latest_block["timestamp"]
             current_epoch = math.floor(
                 (timestamp_now - agreement_data.startTime) / agreement_data.epochLength
             )
             epochs_left = agreement_data.epochsNumber - current_epoch
 
-            token_amount = int(
-                self._get_bid_suggestion(
-                    blockchain_id,
-                    epochs_left,
-                    public_assertion_metadata["size"],
-                    content_asset_storage_address,
-                    public_assertion_id,
-                    DEFAULT_HASH_FUNCTION_ID,
-                    token_amount or BidSuggestionRange.LOW,
-                )["bidSuggestion"]
+            bid_suggestion = yield self._get_bid_suggestion(
+                blockchain_id,
+                epochs_left,
+                public_assertion_metadata["size"],
+                content_asset_storage_address,
+                public_assertion_id,
+                DEFAULT_HASH_FUNCTION_ID,
+                token_amount or BidSuggestionRange.LOW,
             )
+            token_amount = int(bid_suggestion["bidSuggestion"])
 
             token_amount -= agreement_data.tokens[0]
             token_amount = token_amount if token_amount > 0 else 0
 
-        current_allowance = self.get_current_allowance()
+        current_allowance = yield self.get_current_allowance()
         if is_allowance_increased := current_allowance < token_amount:
-            self.increase_allowance(token_amount)
+            yield self.increase_allowance(token_amount)
 
         try:
-            self._update_asset_state(
+            receipt: TxReceipt = yield self._update_asset_state(
                 token_id=token_id,
                 assertion_id=public_assertion_id,
                 size=public_assertion_metadata["size"],
@@ -492,9 +837,11 @@ class KnowledgeAsset(Module):
             )
         except ContractLogicError as err:
             if is_allowance_increased:
-                self.decrease_allowance(token_amount)
+                yield self.decrease_allowance(token_amount)
             raise err
 
+        self._state_cache.invalidate(token_id, receipt["blockNumber"])
+
         assertions_list = [
             {
                 "blockchain": blockchain_id,
@@ -506,33 +853,41 @@ class KnowledgeAsset(Module):
             }
         ]
 
-        if content.get("private", None):
+        if prepared_assertion.private:
             assertions_list.append(
                 {
                     "blockchain": blockchain_id,
                     "contract": content_asset_storage_address,
                     "tokenId": token_id,
-                    "assertionId": MerkleTree(
-                        hash_assertion_with_indexes(assertions["private"]),
-                        sort_pairs=True,
-                    ).root,
+                    "assertionId": prepared_assertion.private_assertion_id,
                     "assertion": assertions["private"],
                     "storeType": StoreTypes.PENDING,
                 }
             )
 
-        operation_id = self._local_store(assertions_list)["operationId"]
-        self.get_operation_result(operation_id, "local-store")
+        operation_id = (yield self._local_store(assertions_list))["operationId"]
+        yield self.get_operation_result(
+            operation_id,
+            "local-store",
+            on_status=on_status,
+            status_tracker=status_tracker,
+        )
 
-        operation_id = self._update(
+        response = yield self._update(
             public_assertion_id,
             assertions["public"],
             blockchain_id,
             content_asset_storage_address,
             token_id,
             DEFAULT_HASH_FUNCTION_ID,
-        )["operationId"]
-        operation_result = self.get_operation_result(operation_id, "update")
+        )
+        operation_id = response["operationId"]
+        operation_result = yield self.get_operation_result(
+            operation_id,
+            "update",
+            on_status=on_status,
+            status_tracker=status_tracker,
+        )
 
         return {
             "UAL": ual,
@@ -545,10 +900,12 @@ class KnowledgeAsset(Module):
 
     _cancel_update = Method(BlockchainRequest.cancel_asset_state_update)
 
-    def cancel_update(self, ual: UAL) -> dict[str, UAL | TxReceipt]:
+    @steps
+    def cancel_update(self, ual: UAL) -> Steps[dict[str, UAL | TxReceipt]]:
         token_id = parse_ual(ual)["token_id"]
 
-        receipt: TxReceipt = self._cancel_update(token_id)
+        receipt: TxReceipt = yield self._cancel_update(token_id)
+        self._state_cache.invalidate(token_id, receipt["blockNumber"])
 
         return {
             "UAL": ual,
@@ -557,20 +914,105 @@ class KnowledgeAsset(Module):
 
     _burn_asset = Method(BlockchainRequest.burn_asset)
 
-    def burn(self, ual: UAL) -> dict[str, UAL | TxReceipt]:
+    @steps
+    def burn(self, ual: UAL) -> Steps[dict[str, UAL | TxReceipt]]:
         token_id = parse_ual(ual)["token_id"]
 
-        receipt: TxReceipt = self._burn_asset(token_id)
+        receipt: TxReceipt = yield self._burn_asset(token_id)
+        self._state_cache.invalidate(token_id, receipt["blockNumber"])
 
         return {"UAL": ual, "operation": json.loads(Web3.to_json(receipt))}
 
     _get_assertion_ids = Method(BlockchainRequest.get_assertion_ids)
     _get_latest_assertion_id = Method(BlockchainRequest.get_latest_assertion_id)
     _get_unfinalized_state = Method(BlockchainRequest.get_unfinalized_state)
+    _get_block_number = Method(BlockchainRequest.get_block_number)
+    _get_logs = Method(BlockchainRequest.get_logs)
+
+    @steps
+    def sync_state_cache(self) -> Steps[None]:
+        """
+        Invalidates cached states of knowledge assets changed by ContentAsset
+        events since the previous sync. The whole cache is cleared on the first
+        sync, or if the previous one is too many blocks behind.
+        """
+        latest_block = yield self._get_block_number()
+        synced_block = self._state_cache.synced_block
+
+        if (
+            synced_block is None
+            or latest_block - synced_block > self.STATE_LOGS_BLOCK_RANGE
+        ):
+            self._state_cache.clear()
+        elif latest_block > synced_block:
+            content_asset = yield self.manager.blockchain_provider.get_contract(
+                "ContentAsset"
+            )
+            yield from self._invalidate_state_cache(
+                content_asset, synced_block + 1, latest_block
+            )
+
+        self._state_cache.synced_block = latest_block
+
+    def _invalidate_state_cache(
+        self, content_asset: Contract | AsyncContract, from_block: int, to_block: int
+    ) -> Steps[None]:
+        event_topics = {
+            event_abi_to_log_topic(event_abi): event_abi["name"]
+            for event_abi in content_asset.abi
+            if event_abi["type"] == "event" and event_abi["name"] in self.STATE_EVENTS
+        }
+
+        logs = yield self._get_logs(
+            {
+                "address": content_asset.address,
+                "fromBlock": from_block,
+                "toBlock": to_block,
+                "topics": [[Web3.to_hex(topic) for topic in event_topics]],
+            }
+        )
+
+        for log in logs:
+            event_name = event_topics.get(bytes(log["topics"][0]))
+            if event_name is None:
+                continue
+
+            event = content_asset.events[event_name]().process_log(log)
+            self._state_cache.invalidate(event.args.tokenId, log["blockNumber"])
+
+    def _get_token_state(
+        self, token_id: int, *keys: str, use_cache: bool = True
+    ) -> Steps[list[HexStr | tuple[HexStr, ...]]]:
+        states = [self._state_cache.get(token_id, key) for key in keys]
+        if use_cache and None not in states:
+            return states
+
+        *results, block_number = yield Batch(
+            *(partial(getattr(self, f"_get_{key}"), token_id) for key in keys),
+            self._get_block_number,
+        )
+
+        states = []
+        for key, result in zip(keys, results):
+            state = self._format_token_state(key, result)
+            self._state_cache.set(token_id, key, state, block_number)
+            states.append(state)
+
+        return states
+
+    @staticmethod
+    def _format_token_state(
+        key: str, state: bytes | list[bytes]
+    ) -> HexStr | tuple[HexStr, ...]:
+        if key == "assertion_ids":
+            return tuple(Web3.to_hex(assertion_id) for assertion_id in state)
+
+        return Web3.to_hex(state)
 
     _get = Method(NodeRequest.get)
     _query = Method(NodeRequest.query)
 
+    @steps
     def get(
         self,
         ual: UAL,
@@ -578,7 +1020,8 @@ class KnowledgeAsset(Module):
         content_visibility: str = KnowledgeAssetContentVisibility.ALL,
         output_format: Literal["JSON-LD", "N-Quads"] = "JSON-LD",
         validate: bool = True,
-    ) -> dict[str, UAL | HexStr | list[JSONLD] | dict[str, str]]:
+        use_cache: bool = True,
+    ) -> Steps[dict[str, UAL | HexStr | list[JSONLD] | dict[str, str]]]:
         state = (
             state.upper()
             if (isinstance(state, str) and not re.match(r"^0x[a-fA-F0-9]{64}$", state))
@@ -589,33 +1032,46 @@ class KnowledgeAsset(Module):
 
         token_id = parse_ual(ual)["token_id"]
 
-        def handle_latest_state(token_id: int) -> tuple[HexStr, bool]:
-            unfinalized_state = Web3.to_hex(self._get_unfinalized_state(token_id))
+        def handle_latest_state(token_id: int) -> Steps[tuple[HexStr, bool]]:
+            unfinalized_state, latest_assertion_id = yield from self._get_token_state(
+                token_id,
+                "unfinalized_state",
+                "latest_assertion_id",
+                use_cache=use_cache,
+            )
 
             if unfinalized_state and unfinalized_state != HASH_ZERO:
                 return unfinalized_state, False
             else:
-                return handle_latest_finalized_state(token_id)
+                return latest_assertion_id, True
 
-        def handle_latest_finalized_state(token_id: int) -> tuple[HexStr, bool]:
-            return Web3.to_hex(self._get_latest_assertion_id(token_id)), True
+        def handle_latest_finalized_state(
+            token_id: int,
+        ) -> Steps[tuple[HexStr, bool]]:
+            (latest_assertion_id,) = yield from self._get_token_state(
+                token_id, "latest_assertion_id", use_cache=use_cache
+            )
+
+            return latest_assertion_id, True
 
         is_state_finalized = False
 
         match state:
             case KnowledgeAssetEnumStates.LATEST:
-                public_assertion_id, is_state_finalized = handle_latest_state(token_id)
+                public_assertion_id, is_state_finalized = (
+                    yield from handle_latest_state(token_id)
+                )
 
             case KnowledgeAssetEnumStates.LATEST_FINALIZED:
-                public_assertion_id, is_state_finalized = handle_latest_finalized_state(
-                    token_id
-                )
+                (
+                    public_assertion_id,
+                    is_state_finalized,
+                ) = yield from handle_latest_finalized_state(token_id)
 
             case _ if isinstance(state, int):
-                assertion_ids = [
-                    Web3.to_hex(assertion_id)
-                    for assertion_id in self._get_assertion_ids(token_id)
-                ]
+                (assertion_ids,) = yield from self._get_token_state(
+                    token_id, "assertion_ids", use_cache=use_cache
+                )
                 if 0 <= state < (states_number := len(assertion_ids)):
                     public_assertion_id = assertion_ids[state]
 
@@ -627,10 +1083,9 @@ class KnowledgeAsset(Module):
             case _ if isinstance(state, str) and re.match(
                 r"^0x[a-fA-F0-9]{64}$", state
             ):
-                assertion_ids = [
-                    Web3.to_hex(assertion_id)
-                    for assertion_id in self._get_assertion_ids(token_id)
-                ]
+                (assertion_ids,) = yield from self._get_token_state(
+                    token_id, "assertion_ids", use_cache=use_cache
+                )
 
                 if state in assertion_ids:
                     public_assertion_id = state
@@ -645,26 +1100,41 @@ class KnowledgeAsset(Module):
             case _:
                 raise InvalidStateOption(f"Invalid state option: {state}.")
 
-        get_public_operation_id: NodeResponseDict = self._get(
-            ual, public_assertion_id, hashFunctionId=1
-        )["operationId"]
+        assertion_cache = get_assertion_cache() if use_cache else None
 
-        get_public_operation_result = self.get_operation_result(
-            get_public_operation_id, "get"
+        public_assertion = (
+            assertion_cache.get(public_assertion_id)
+            if assertion_cache is not None
+            else None
         )
-        public_assertion = get_public_operation_result["data"].get("assertion", None)
+        get_public_operation_result: NodeResponseDict | None = None
 
         if public_assertion is None:
-            raise MissingKnowledgeAssetState("Unable to find state on the network!")
-
-        if validate:
-            root = MerkleTree(
-                hash_assertion_with_indexes(public_assertion), sort_pairs=True
-            ).root
-            if root != public_assertion_id:
-                raise InvalidKnowledgeAsset(
-                    f"State: {public_assertion_id}. " f"Merkle Tree Root: {root}"
+            get_public_operation_id: NodeResponseDict = (
+                yield self._get(ual, public_assertion_id, hashFunctionId=1)
+            )["operationId"]
+
+            get_public_operation_result = yield self.get_operation_result(
+                get_public_operation_id, "get"
+            )
+            public_assertion = get_public_operation_result["data"].get(
+                "assertion", None
+            )
+
+            if public_assertion is None:
+                raise MissingKnowledgeAssetState("Unable to find state on the network!")
+
+            if validate:
+                root = calculate_merkle_root(
+                    hash_assertion_leaves(public_assertion), sort_pairs=True
                 )
+                if root != public_assertion_id:
+                    raise InvalidKnowledgeAsset(
+                        f"State: {public_assertion_id}. " f"Merkle Tree Root: {root}"
+                    )
+
+                if assertion_cache is not None:
+                    assertion_cache.set(public_assertion_id, public_assertion)
 
         result = {"operation": {}}
         if content_visibility != KnowledgeAssetContentVisibility.PRIVATE:
@@ -672,6 +1142,8 @@ class KnowledgeAsset(Module):
 
             match output_format:
                 case "NQUADS" | "N-QUADS":
+                    from pyld import jsonld
+
                     formatted_public_assertion: list[JSONLD] = jsonld.from_rdf(
                         "\n".join(public_assertion),
                         {"algorithm": "URDNA2015", "format": "application/n-quads"},
@@ -696,10 +1168,16 @@ class KnowledgeAsset(Module):
                     "assertionId": public_assertion_id,
                 }
 
-            result["operation"]["publicGet"] = {
-                "operationId": get_public_operation_id,
-                "status": get_public_operation_result["status"],
-            }
+            if get_public_operation_result is not None:
+                result["operation"]["publicGet"] = {
+                    "operationId": get_public_operation_id,
+                    "status": get_public_operation_result["status"],
+                }
+            else:
+                result["operation"]["publicGet"] = {
+                    "cached": True,
+                    "assertionId": public_assertion_id,
+                }
 
         if content_visibility != KnowledgeAssetContentVisibility.PUBLIC:
             private_assertion_link_triples = list(
@@ -714,54 +1192,75 @@ class KnowledgeAsset(Module):
                     r'"(.*?)"', private_assertion_link_triples[0]
                 ).group(1)
 
-                private_assertion = get_public_operation_result["data"].get(
-                    "privateAssertion", None
+                private_assertion = (
+                    get_public_operation_result["data"].get("privateAssertion", None)
+                    if get_public_operation_result is not None
+                    else None
                 )
 
                 query_private_operation_id: NodeResponseDict | None = None
+                is_private_assertion_cached = False
                 if private_assertion is None:
-                    query = f"""
-                    CONSTRUCT {{ ?s ?p ?o }}
-                    WHERE {{
-                        {{
-                            GRAPH <assertion:{private_assertion_id}>
+                    if assertion_cache is not None:
+                        private_assertion = assertion_cache.get(private_assertion_id)
+                        is_private_assertion_cached = private_assertion is not None
+
+                    if private_assertion is None:
+                        query = f"""
+                        CONSTRUCT {{ ?s ?p ?o }}
+                        WHERE {{
                             {{
-                                ?s ?p ?o .
+                                GRAPH <assertion:{private_assertion_id}>
+                                {{
+                                    ?s ?p ?o .
+                                }}
                             }}
                         }}
-                    }}
-                    """
-
-                    query_private_operation_id = self._query(
-                        query,
-                        "CONSTRUCT",
-                        PRIVATE_CURRENT_REPOSITORY
-                        if is_state_finalized
-                        else PRIVATE_HISTORICAL_REPOSITORY,
-                    )["operationId"]
-
-                    query_private_operation_result = self.get_operation_result(
-                        query_private_operation_id, "query"
-                    )
+                        """
+
+                        query_private_operation_id = (
+                            yield self._query(
+                                query,
+                                "CONSTRUCT",
+                                (
+                                    PRIVATE_CURRENT_REPOSITORY
+                                    if is_state_finalized
+                                    else PRIVATE_HISTORICAL_REPOSITORY
+                                ),
+                            )
+                        )["operationId"]
 
-                    private_assertion = normalize_dataset(
-                        query_private_operation_result["data"],
-                        "N-Quads",
-                    )
+                        query_private_operation_result = (
+                            yield self.get_operation_result(
+                                query_private_operation_id, "query"
+                            )
+                        )
+
+                        private_assertion = normalize_dataset(
+                            query_private_operation_result["data"],
+                            "N-Quads",
+                        )
 
-                    if validate:
-                        root = MerkleTree(
-                            hash_assertion_with_indexes(private_assertion),
-                            sort_pairs=True,
-                        ).root
-                        if root != private_assertion_id:
-                            raise InvalidKnowledgeAsset(
-                                f"State: {private_assertion_id}. "
-                                f"Merkle Tree Root: {root}"
+                        if validate:
+                            root = calculate_merkle_root(
+                                hash_assertion_leaves(private_assertion),
+                                sort_pairs=True,
                             )
+                            if root != private_assertion_id:
+                                raise InvalidKnowledgeAsset(
+                                    f"State: {private_assertion_id}. "
+                                    f"Merkle Tree Root: {root}"
+                                )
+
+                            if assertion_cache is not None:
+                                assertion_cache.set(
+                                    private_assertion_id, private_assertion
+                                )
 
                     match output_format:
                         case "NQUADS" | "N-QUADS":
+                            from pyld import jsonld
+
                             formatted_private_assertion: list[JSONLD] = jsonld.from_rdf(
                                 "\n".join(private_assertion),
                                 {
@@ -794,17 +1293,23 @@ class KnowledgeAsset(Module):
                             "operationId": query_private_operation_id,
                             "status": query_private_operation_result["status"],
                         }
+                    elif is_private_assertion_cached:
+                        result["operation"]["queryPrivate"] = {
+                            "cached": True,
+                            "assertionId": private_assertion_id,
+                        }
 
         return result
 
     _extend_storing_period = Method(BlockchainRequest.extend_asset_storing_period)
 
+    @steps
     def extend_storing_period(
         self,
         ual: UAL,
         additional_epochs: int,
         token_amount: Wei | None = None,
-    ) -> dict[str, UAL | TxReceipt]:
+    ) -> Steps[dict[str, UAL | TxReceipt]]:
         parsed_ual = parse_ual(ual)
         blockchain_id, content_asset_storage_address, token_id = (
             parsed_ual["blockchain"],
@@ -813,24 +1318,23 @@ class KnowledgeAsset(Module):
         )
 
         if token_amount is None:
-            latest_finalized_state = self._get_latest_assertion_id(token_id)
-            latest_finalized_state_size = self._get_assertion_size(
+            latest_finalized_state = yield self._get_latest_assertion_id(token_id)
+            latest_finalized_state_size = yield self._get_assertion_size(
                 latest_finalized_state
             )
 
-            token_amount = int(
-                self._get_bid_suggestion(
-                    blockchain_id,
-                    additional_epochs,
-                    latest_finalized_state_size,
-                    content_asset_storage_address,
-                    latest_finalized_state,
-                    DEFAULT_HASH_FUNCTION_ID,
-                    token_amount or BidSuggestionRange.LOW,
-                )["bidSuggestion"]
+            bid_suggestion = yield self._get_bid_suggestion(
+                blockchain_id,
+                additional_epochs,
+                latest_finalized_state_size,
+                content_asset_storage_address,
+                latest_finalized_state,
+                DEFAULT_HASH_FUNCTION_ID,
+                token_amount or BidSuggestionRange.LOW,
             )
+            token_amount = int(bid_suggestion["bidSuggestion"])
 
-        receipt: TxReceipt = self._extend_storing_period(
+        receipt: TxReceipt = yield self._extend_storing_period(
             token_id, additional_epochs, token_amount
         )
 
@@ -842,11 +1346,12 @@ class KnowledgeAsset(Module):
     _get_assertion_size = Method(BlockchainRequest.get_assertion_size)
     _add_tokens = Method(BlockchainRequest.increase_asset_token_amount)
 
+    @steps
     def add_tokens(
         self,
         ual: UAL,
         token_amount: Wei | None = None,
-    ) -> dict[str, UAL | TxReceipt]:
+    ) -> Steps[dict[str, UAL | TxReceipt]]:
         parsed_ual = parse_ual(ual)
         blockchain_id, content_asset_storage_address, token_id = (
             parsed_ual["blockchain"],
@@ -855,36 +1360,43 @@ class KnowledgeAsset(Module):
         )
 
         if token_amount is None:
-            agreement_id = self.get_agreement_id(
-                content_asset_storage_address, token_id
+            first_assertion_id, latest_finalized_state = yield Batch(
+                partial(self._get_assertion_id_by_index, token_id, 0),
+                partial(self._get_latest_assertion_id, token_id),
             )
+
+            agreement_id = generate_agreement_id(
+                content_asset_storage_address,
+                token_id,
+                generate_keyword(content_asset_storage_address, first_assertion_id),
+            )
+
             # TODO: Dynamic types for namedtuples?
-            agreement_data: Type[AgreementData] = self._get_service_agreement_data(
-                agreement_id
+            agreement_data: Type[AgreementData]
+            agreement_data, latest_finalized_state_size, latest_block = yield Batch(
+                partial(self._get_service_agreement_data, agreement_id),
+                partial(self._get_assertion_size, latest_finalized_state),
+                partial(self._get_block, "latest"),
             )
 
-            timestamp_now = self._get_block("latest")["timestamp"]
+            timestamp_now = latest_block["timestamp"]
             current_epoch = math.floor(
                 (timestamp_now - agreement_data.startTime) / agreement_data.epochLength
             )
             epochs_left = agreement_data.epochsNumber - current_epoch
 
-            latest_finalized_state = self._get_latest_assertion_id(token_id)
-            latest_finalized_state_size = self._get_assertion_size(
-                latest_finalized_state
+            bid_suggestion = yield self._get_bid_suggestion(
+                blockchain_id,
+                epochs_left,
+                latest_finalized_state_size,
+                content_asset_storage_address,
+                latest_finalized_state,
+                DEFAULT_HASH_FUNCTION_ID,
+                token_amount or BidSuggestionRange.LOW,
+            )
+            token_amount = int(bid_suggestion["bidSuggestion"]) - sum(
+                agreement_data.tokensInfo
             )
-
-            token_amount = int(
-                self._get_bid_suggestion(
-                    blockchain_id,
-                    epochs_left,
-                    latest_finalized_state_size,
-                    content_asset_storage_address,
-                    latest_finalized_state,
-                    DEFAULT_HASH_FUNCTION_ID,
-                    token_amount or BidSuggestionRange.LOW,
-                )["bidSuggestion"]
-            ) - sum(agreement_data.tokensInfo)
 
             if token_amount <= 0:
                 raise InvalidTokenAmount(
@@ -893,7 +1405,7 @@ class KnowledgeAsset(Module):
                     "more tokens!"
                 )
 
-        receipt: TxReceipt = self._add_tokens(token_id, token_amount)
+        receipt: TxReceipt = yield self._add_tokens(token_id, token_amount)
 
         return {
             "UAL": ual,
@@ -902,11 +1414,12 @@ class KnowledgeAsset(Module):
 
     _add_update_tokens = Method(BlockchainRequest.increase_asset_update_token_amount)
 
+    @steps
     def add_update_tokens(
         self,
         ual: UAL,
         token_amount: Wei | None = None,
-    ) -> dict[str, UAL | TxReceipt]:
+    ) -> Steps[dict[str, UAL | TxReceipt]]:
         parsed_ual = parse_ual(ual)
         blockchain_id, content_asset_storage_address, token_id = (
             parsed_ual["blockchain"],
@@ -915,34 +1428,43 @@ class KnowledgeAsset(Module):
         )
 
         if token_amount is None:
-            agreement_id = self.get_agreement_id(
-                content_asset_storage_address, token_id
+            first_assertion_id, unfinalized_state = yield Batch(
+                partial(self._get_assertion_id_by_index, token_id, 0),
+                partial(self._get_latest_assertion_id, token_id),
+            )
+
+            agreement_id = generate_agreement_id(
+                content_asset_storage_address,
+                token_id,
+                generate_keyword(content_asset_storage_address, first_assertion_id),
             )
+
             # TODO: Dynamic types for namedtuples?
-            agreement_data: Type[AgreementData] = self._get_service_agreement_data(
-                agreement_id
+            agreement_data: Type[AgreementData]
+            agreement_data, unfinalized_state_size, latest_block = yield Batch(
+                partial(self._get_service_agreement_data, agreement_id),
+                partial(self._get_assertion_size, unfinalized_state),
+                partial(self._get_block, "latest"),
             )
 
-            timestamp_now = self._get_block("latest")["timestamp"]
+            timestamp_now = latest_block["timestamp"]
             current_epoch = math.floor(
                 (timestamp_now - agreement_data.startTime) / agreement_data.epochLength
             )
             epochs_left = agreement_data.epochsNumber - current_epoch
 
-            unfinalized_state = self._get_latest_assertion_id(token_id)
-            unfinalized_state_size = self._get_assertion_size(unfinalized_state)
-
-            token_amount = int(
-                self._get_bid_suggestion(
-                    blockchain_id,
-                    epochs_left,
-                    unfinalized_state_size,
-                    content_asset_storage_address,
-                    unfinalized_state,
-                    DEFAULT_HASH_FUNCTION_ID,
-                    token_amount or BidSuggestionRange.LOW,
-                )["bidSuggestion"]
-            ) - sum(agreement_data.tokensInfo)
+            bid_suggestion = yield self._get_bid_suggestion(
+                blockchain_id,
+                epochs_left,
+                unfinalized_state_size,
+                content_asset_storage_address,
+                unfinalized_state,
+                DEFAULT_HASH_FUNCTION_ID,
+                token_amount or BidSuggestionRange.LOW,
+            )
+            token_amount = int(bid_suggestion["bidSuggestion"]) - sum(
+                agreement_data.tokensInfo
+            )
 
             if token_amount <= 0:
                 raise InvalidTokenAmount(
@@ -951,36 +1473,148 @@ class KnowledgeAsset(Module):
                     "more update tokens!"
                 )
 
-        receipt: TxReceipt = self._add_update_tokens(token_id, token_amount)
+        receipt: TxReceipt = yield self._add_update_tokens(token_id, token_amount)
 
         return {
             "UAL": ual,
             "operation": json.loads(Web3.to_json(receipt)),
         }
 
-    def get_owner(self, ual: UAL) -> Address:
+    @batchable
+    @steps
+    def get_owner(self, ual: UAL) -> Steps[Address]:
         token_id = parse_ual(ual)["token_id"]
 
-        return self._owner(token_id)
+        return (yield self._owner(token_id))
 
     _get_assertion_id_by_index = Method(BlockchainRequest.get_assertion_id_by_index)
 
-    def get_agreement_id(self, contract_address: Address, token_id: int) -> HexStr:
-        first_assertion_id = self._get_assertion_id_by_index(token_id, 0)
+    @steps
+    def get_agreement_id(
+        self, contract_address: Address, token_id: int
+    ) -> Steps[HexStr]:
+        first_assertion_id = yield self._get_assertion_id_by_index(token_id, 0)
         keyword = generate_keyword(contract_address, first_assertion_id)
         return generate_agreement_id(contract_address, token_id, keyword)
 
     _get_operation_result = Method(NodeRequest.get_operation_result)
 
-    @retry(catch=OperationNotFinished, max_retries=5, base_delay=1, backoff=2)
     def get_operation_result(
-        self, operation_id: str, operation: str
+        self,
+        operation_id: str,
+        operation: str,
+        timeout: float | None = None,
+        on_status: Callable[[OperationStatusTransition], None] | None = None,
+        status_tracker: OperationStatusTracker | None = None,
     ) -> NodeResponseDict:
-        operation_result = self._get_operation_result(
+        if status_tracker is None:
+            status_tracker = OperationStatusTracker()
+        status_tracker.start(operation_id)
+
+        return self._poll_operation_result(
+            partial(
+                self._fetch_operation_result,
+                operation_id,
+                operation,
+                status_tracker,
+                on_status,
+            ),
+            operation,
+            timeout,
+        )
+
+    def submit_operation_result(
+        self,
+        operation_id: str,
+        operation: str,
+        timeout: float | None = None,
+        on_status: Callable[[OperationStatusTransition], None] | None = None,
+        status_tracker: OperationStatusTracker | None = None,
+    ) -> Future | asyncio.Future:
+        if status_tracker is None:
+            status_tracker = OperationStatusTracker()
+        status_tracker.start(operation_id)
+
+        return self.manager.node_provider.multiplexer.submit(
+            partial(
+                self._fetch_operation_result,
+                operation_id,
+                operation,
+                status_tracker,
+                on_status,
+            ),
+            operation,
+            timeout,
+        )
+
+    @steps
+    def _fetch_operation_result(
+        self,
+        operation_id: str,
+        operation: str,
+        status_tracker: OperationStatusTracker,
+        on_status: Callable[[OperationStatusTransition], None] | None,
+    ) -> Steps[NodeResponseDict]:
+        operation_result = yield self._get_operation_result(
             operation_id=operation_id,
             operation=operation,
         )
 
+        transition = status_tracker.update(operation_id, operation, operation_result)
+        if transition is not None and on_status is not None:
+            on_status(transition)
         validate_operation_status(operation_result)
 
         return operation_result
+
+    def _prepare_content(
+        self,
+        content: dict[Literal["public", "private"], JSONLD] | PreparedAssertion,
+        content_type: Literal["JSON-LD", "N-Quads"],
+        ual: UAL | None = None,
+    ) -> tuple[PreparedAssertion, AssertionMerkleTree | None]:
+        if isinstance(content, PreparedAssertion):
+            # Cached tree would be stale once the asset is updated with this content
+            if ual is not None:
+                self._assertion_trees.pop(ual)
+            return content, None
+
+        public_assertion, private_assertion, private_assertion_id = normalize_content(
+            content, content_type
+        )
+        public_assertion_tree = self._get_assertion_tree(public_assertion, ual)
+
+        return (
+            to_prepared_assertion(
+                public_assertion,
+                public_assertion_tree.root,
+                private_assertion,
+                private_assertion_id,
+            ),
+            public_assertion_tree,
+        )
+
+    def _get_assertion_tree(
+        self, assertion: NQuads, ual: UAL | None = None
+    ) -> AssertionMerkleTree:
+        tree = self._assertion_trees.pop(ual) if ual is not None else None
+        if tree is None:
+            tree = AssertionMerkleTree(assertion)
+        else:
+            tree.replace(assertion)
+
+        if ual is not None:
+            self._assertion_trees.set(ual, tree)
+
+        # Assertion is published in the same order as it is hashed
+        assertion.sort()
+
+        return tree
+
+
+class KnowledgeAsset(BaseKnowledgeAsset, Module):
+    manager: DefaultRequestManager
+
+
+class AsyncKnowledgeAsset(BaseKnowledgeAsset, AsyncModule):
+    manager: AsyncRequestManager
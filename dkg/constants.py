@@ -37,11 +37,13 @@ BLOCKCHAINS = {
         },
         "gnosis:10200": {
             "hub": "0xD2bA102A0b11944d00180eE8136208ccF87bC39A",
+            "multicall": "0xcA11bde05977b3631167028862bE2a173976CA11",
             "rpc": "https://rpc.chiadochain.net",
             "gas_price_oracle": "https://blockscout.chiadochain.net/api/v1/gas-price-oracle",
         },
         "base:84532": {
             "hub": "0x6C861Cb69300C34DfeF674F7C00E734e840C29C0",
+            "multicall": "0xcA11bde05977b3631167028862bE2a173976CA11",
             "rpc": "https://sepolia.base.org",
         }
     },
@@ -52,11 +54,13 @@ BLOCKCHAINS = {
         },
         "gnosis:10200": {
             "hub": "0xC06210312C9217A0EdF67453618F5eB96668679A",
+            "multicall": "0xcA11bde05977b3631167028862bE2a173976CA11",
             "rpc": "https://rpc.chiadochain.net",
             "gas_price_oracle": "https://blockscout.chiadochain.net/api/v1/gas-price-oracle",
         },
         "base:84532": {
             "hub": "0x144eDa5cbf8926327cb2cceef168A121F0E4A299",
+            "multicall": "0xcA11bde05977b3631167028862bE2a173976CA11",
             "rpc": "https://sepolia.base.org",
         }
     },
@@ -67,6 +71,7 @@ BLOCKCHAINS = {
         },
         "gnosis:100": {
             "hub": "0xbEF14fc04F870c2dD65c13Df4faB6ba01A9c746b",
+            "multicall": "0xcA11bde05977b3631167028862bE2a173976CA11",
             "rpc": "https://rpc.gnosischain.com/",
             "gas_price_oracle": [
                 "https://api.gnosisscan.io/api?module=proxy&action=eth_gasPrice",
@@ -75,6 +80,7 @@ BLOCKCHAINS = {
         },
         "base:8453": {
             "hub": "0xaBfcf2ad1718828E7D3ec20435b0d0b5EAfbDf2c",
+            "multicall": "0xcA11bde05977b3631167028862bE2a173976CA11",
             "rpc": "https://mainnet.base.org",
         },
     },
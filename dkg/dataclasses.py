@@ -17,10 +17,18 @@
 
 from dataclasses import dataclass
 from enum import auto, Enum
+from typing import TYPE_CHECKING
 
-import pandas as pd
+from dkg.types import (
+    AutoStrEnum,
+    AutoStrEnumCapitalize,
+    AutoStrEnumUpperCase,
+    HexStr,
+    NQuads,
+)
 
-from dkg.types import AutoStrEnum, AutoStrEnumCapitalize, AutoStrEnumUpperCase
+if TYPE_CHECKING:
+    import pandas as pd
 
 
 class BlockchainResponseDict(dict):
@@ -33,7 +41,9 @@ class HTTPRequestMethod(Enum):
 
 
 class NodeResponseDict(dict):
-    def to_dataframe(self) -> pd.DataFrame:
+    def to_dataframe(self) -> "pd.DataFrame":
+        import pandas as pd
+
         return pd.DataFrame(self)
 
 
@@ -59,6 +69,66 @@ class ParanetIncentivizationType(AutoStrEnumCapitalize):
     NEUROWEB = auto()
 
 
+@dataclass(frozen=True)
+class PreparedAssertion:
+    """
+    Normalized and hashed content, ready to be published. Produced by
+    `Assertion.prepare` / `Assertion.prepare_many` and accepted in place of
+    the raw content by `KnowledgeAsset.create` and `create_many`.
+    """
+
+    public: tuple[str, ...]
+    public_assertion_id: HexStr
+    size: int
+    triples_number: int
+    chunks_number: int
+    private: tuple[str, ...] = ()
+    private_assertion_id: HexStr | None = None
+
+    @property
+    def metadata(self) -> dict[str, int]:
+        return {
+            "size": self.size,
+            "triples_number": self.triples_number,
+            "chunks_number": self.chunks_number,
+        }
+
+    def to_assertions(self) -> dict[str, NQuads]:
+        return {
+            "public": list(self.public),
+            "private": list(self.private) if self.private else {},
+        }
+
+
+@dataclass(frozen=True)
+class PollingProfile:
+    """
+    Polling schedule for results of a single node operation type. Intervals and
+    the timeout are in seconds.
+    """
+
+    initial_interval: float
+    max_interval: float
+    backoff: float = 1.5
+    timeout: float = 60
+
+
+@dataclass(frozen=True)
+class OperationStatusTransition:
+    """
+    Status change of a node operation observed while polling for its result.
+    Timestamp is the Unix time of the poll, elapsed is the number of seconds
+    since the polling started.
+    """
+
+    operation_id: str
+    operation: str
+    status: str
+    previous_status: str | None
+    timestamp: float
+    elapsed: float
+
+
 @dataclass
 class BaseIncentivesPoolParams:
     def to_contract_args(self) -> dict:
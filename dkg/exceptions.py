@@ -109,6 +109,14 @@ class OperationNotFinished(DKGException):
     pass
 
 
+class OperationTimeout(NodeRequestError):
+    """
+    Raised when requested operation isn't finished before the polling deadline.
+    """
+
+    pass
+
+
 class OperationFailed(DKGException):
     """
     Raised when requested operation status is failed.
@@ -142,6 +150,15 @@ class DatasetInputFormatNotSupported(DKGException):
     pass
 
 
+class CanonicalizationBackendNotSupported(DKGException):
+    """
+    Raised when trying to normalize RDF dataset with not registered
+    canonicalization backend.
+    """
+
+    pass
+
+
 class DatasetOutputFormatNotSupported(DKGException):
     """
     Raised when trying to convert RDF dataset to not supported output format.
@@ -175,3 +192,29 @@ class LeafNotInTree(DKGException):
     """
 
     pass
+
+
+class TransactionReplaced(DKGException):
+    """
+    Raised when nonce of the sent transaction has been used by another transaction
+    before the original one was mined.
+    """
+
+    pass
+
+
+class TransactionDropped(DKGException):
+    """
+    Raised when sent transaction has been dropped from the mempool and couldn't be
+    rebroadcast.
+    """
+
+    pass
+
+
+class TransactionReverted(DKGException):
+    """
+    Raised when sent transaction has been mined, but its execution was reverted.
+    """
+
+    pass
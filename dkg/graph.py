@@ -14,50 +14,95 @@
 # KIND, either express or implied.  See the License for the
 # specific language governing permissions and limitations
 # under the License.
+from functools import partial
+from typing import Callable
 
-from rdflib.plugins.sparql.parser import parseQuery
-
-from dkg.dataclasses import NodeResponseDict
-from dkg.exceptions import OperationNotFinished
-from dkg.manager import DefaultRequestManager
+from dkg.dataclasses import NodeResponseDict, OperationStatusTransition
+from dkg.manager import AsyncRequestManager, DefaultRequestManager
 from dkg.method import Method
-from dkg.module import Module
+from dkg.module import AsyncModule, Module
 from dkg.types import NQuads
-from dkg.utils.decorators import retry
-from dkg.utils.node_request import NodeRequest, validate_operation_status
+from dkg.utils.node_request import (
+    NodeRequest,
+    OperationStatusTracker,
+    validate_operation_status,
+)
+from dkg.utils.steps import Steps, steps
 
 
-class Graph(Module):
-    def __init__(self, manager: DefaultRequestManager):
+class BaseGraph:
+    def __init__(self, manager: DefaultRequestManager | AsyncRequestManager):
         self.manager = manager
 
     _query = Method(NodeRequest.query)
     _get_operation_result = Method(NodeRequest.get_operation_result)
 
+    @steps
     def query(
         self,
         query: str,
         repository: str,
-    ) -> NQuads:
+    ) -> Steps[NQuads]:
+        from rdflib.plugins.sparql.parser import parseQuery
+
         parsed_query = parseQuery(query)
         query_type = parsed_query[1].name.replace("Query", "").upper()
 
-        operation_id: NodeResponseDict = self._query(query, query_type, repository)[
-            "operationId"
-        ]
-        operation_result = self.get_operation_result(operation_id, "query")
+        operation_id: NodeResponseDict = (
+            yield self._query(query, query_type, repository)
+        )["operationId"]
+        operation_result = yield self.get_operation_result(operation_id, "query")
 
         return operation_result["data"]
 
-    @retry(catch=OperationNotFinished, max_retries=5, base_delay=1, backoff=2)
     def get_operation_result(
-        self, operation_id: str, operation: str
+        self,
+        operation_id: str,
+        operation: str,
+        timeout: float | None = None,
+        on_status: Callable[[OperationStatusTransition], None] | None = None,
+        status_tracker: OperationStatusTracker | None = None,
     ) -> NodeResponseDict:
-        operation_result = self._get_operation_result(
+        if status_tracker is None:
+            status_tracker = OperationStatusTracker()
+        status_tracker.start(operation_id)
+
+        return self._poll_operation_result(
+            partial(
+                self._fetch_operation_result,
+                operation_id,
+                operation,
+                status_tracker,
+                on_status,
+            ),
+            operation,
+            timeout,
+        )
+
+    @steps
+    def _fetch_operation_result(
+        self,
+        operation_id: str,
+        operation: str,
+        status_tracker: OperationStatusTracker,
+        on_status: Callable[[OperationStatusTransition], None] | None,
+    ) -> Steps[NodeResponseDict]:
+        operation_result = yield self._get_operation_result(
             operation_id=operation_id,
             operation=operation,
         )
 
+        transition = status_tracker.update(operation_id, operation, operation_result)
+        if transition is not None and on_status is not None:
+            on_status(transition)
         validate_operation_status(operation_result)
 
         return operation_result
+
+
+class Graph(BaseGraph, Module):
+    manager: DefaultRequestManager
+
+
+class AsyncGraph(BaseGraph, AsyncModule):
+    manager: AsyncRequestManager
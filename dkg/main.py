@@ -16,16 +16,23 @@
 # under the License.
 
 from functools import wraps
+from typing import ContextManager
 
 from dkg.assertion import Assertion
-from dkg.asset import KnowledgeAsset
-from dkg.graph import Graph
-from dkg.manager import DefaultRequestManager
-from dkg.module import Module
-from dkg.network import Network
-from dkg.node import Node
-from dkg.paranet import Paranet
-from dkg.providers import BlockchainProvider, NodeHTTPProvider
+from dkg.asset import AsyncKnowledgeAsset, KnowledgeAsset
+from dkg.graph import AsyncGraph, Graph
+from dkg.manager import AsyncRequestManager, DefaultRequestManager
+from dkg.module import AsyncModule, Module
+from dkg.network import AsyncNetwork, Network
+from dkg.node import AsyncNode, Node
+from dkg.paranet import AsyncParanet, Paranet
+from dkg.providers import (
+    AsyncBlockchainProvider,
+    AsyncNodeHTTPProvider,
+    BlockchainProvider,
+    NodeHTTPProvider,
+)
+from dkg.providers.batch import CallBatch
 from dkg.types import UAL, Address, ChecksumAddress
 from dkg.utils.ual import format_ual, parse_ual
 
@@ -81,3 +88,61 @@ class DKG(Module):
     @blockchain_provider.setter
     def blockchain_provider(self, blockchain_provider: BlockchainProvider) -> None:
         self.manager.blockchain_provider = blockchain_provider
+
+    def batch(self) -> ContextManager[CallBatch]:
+        return self.manager.blockchain_provider.batch()
+
+
+class AsyncDKG(AsyncModule):
+    assertion: Assertion
+    asset: AsyncKnowledgeAsset
+    paranet: AsyncParanet
+    network: AsyncNetwork
+    node: AsyncNode
+    graph: AsyncGraph
+
+    format_ual = DKG.format_ual
+    parse_ual = DKG.parse_ual
+
+    def __init__(
+        self,
+        node_provider: AsyncNodeHTTPProvider,
+        blockchain_provider: AsyncBlockchainProvider,
+    ):
+        self.manager = AsyncRequestManager(node_provider, blockchain_provider)
+        modules = {
+            "assertion": Assertion(self.manager),
+            "asset": AsyncKnowledgeAsset(self.manager),
+            "paranet": AsyncParanet(self.manager),
+            "network": AsyncNetwork(self.manager),
+            "node": AsyncNode(self.manager),
+            "graph": AsyncGraph(self.manager),
+        }
+        self._attach_modules(modules)
+
+    @property
+    def node_provider(self) -> AsyncNodeHTTPProvider:
+        return self.manager.node_provider
+
+    @node_provider.setter
+    def node_provider(self, node_provider: AsyncNodeHTTPProvider) -> None:
+        self.manager.node_provider = node_provider
+
+    @property
+    def blockchain_provider(self) -> AsyncBlockchainProvider:
+        return self.manager.blockchain_provider
+
+    @blockchain_provider.setter
+    def blockchain_provider(self, blockchain_provider: AsyncBlockchainProvider) -> None:
+        self.manager.blockchain_provider = blockchain_provider
+
+    async def close(self) -> None:
+        await self.node_provider.close()
+        await self.blockchain_provider.close()
+
+    async def __aenter__(self) -> "AsyncDKG":
+        await self.blockchain_provider.initialize()
+        return self
+
+    async def __aexit__(self, *exc_info) -> None:
+        await self.close()
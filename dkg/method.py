@@ -62,9 +62,18 @@ class Method(Generic[TFunc]):
                             "ContractInteraction requires a 'contract' to be provided"
                         )
 
+                processed_args = {}
+                if isinstance(self.action, ContractTransaction) and (
+                    "wait_for_receipt" in kwargs
+                ):
+                    processed_args["wait_for_receipt"] = kwargs.pop(
+                        "wait_for_receipt"
+                    )
+
                 return {
                     "args": self._validate_and_map(self.action.args, args, kwargs),
                     "state_changing": isinstance(self.action, ContractTransaction),
+                    **processed_args,
                 }
             case NodeCall():
                 return self._process_node_call_args(args, kwargs)
@@ -15,13 +15,23 @@
 # specific language governing permissions and limitations
 # under the License.
 
+from contextlib import nullcontext
 from dataclasses import asdict
-from typing import Any, Callable, Sequence
+from typing import Any, Awaitable, Callable, ContextManager, Sequence
 
 from dkg.exceptions import ValidationError
-from dkg.manager import DefaultRequestManager
+from dkg.manager import AsyncRequestManager, DefaultRequestManager
 from dkg.method import Method
+from dkg.providers.batch import BatchedResult
 from dkg.types import TReturn
+from dkg.utils.steps import (
+    Batch,
+    Steps,
+    async_resolve_step,
+    async_run_steps,
+    resolve_step,
+    run_steps,
+)
 
 
 class Module:
@@ -39,6 +49,30 @@ class Module:
 
         return caller
 
+    def _run(self, steps: Steps[TReturn]) -> TReturn:
+        return run_steps(steps, self._resolve_step)
+
+    def _resolve_step(self, step: Any) -> Any:
+        if not isinstance(step, Batch):
+            return resolve_step(step)
+
+        provider = self.manager.blockchain_provider
+        with provider.batch(), provider.deferred():
+            results = [call() for call in step.calls]
+
+        return [
+            result.result() if isinstance(result, BatchedResult) else result
+            for result in results
+        ]
+
+    def _deferred(self, defer: bool = True, multicall: bool = True) -> ContextManager:
+        return self.manager.blockchain_provider.deferred(defer, multicall)
+
+    def _poll_operation_result(
+        self, fetch: Callable[[], TReturn], operation: str, timeout: float | None
+    ) -> TReturn:
+        return self.manager.node_provider.poller.poll(fetch, operation, timeout)
+
     def _attach_modules(self, module_definitions: dict[str, Any]) -> None:
         for module_name, module_info in module_definitions.items():
             module_info_is_list_like = isinstance(module_info, Sequence)
@@ -62,3 +96,34 @@ class Module:
                     raise ValidationError(
                         "Module definitions can only have 1 or 2 elements."
                     )
+
+
+class AsyncModule(Module):
+    manager: AsyncRequestManager
+
+    def retrieve_caller_fn(
+        self, method: Method[Callable[..., TReturn]]
+    ) -> Callable[..., Awaitable[TReturn]]:
+        async def caller(*args: Any, **kwargs: Any) -> TReturn:
+            processed_args = method.process_args(*args, **kwargs)
+            request_params = asdict(method.action)
+            request_params.update(processed_args)
+
+            return await self.manager.async_request(type(method.action), request_params)
+
+        return caller
+
+    def _run(self, steps: Steps[TReturn]) -> Awaitable[TReturn]:
+        return async_run_steps(steps, async_resolve_step)
+
+    def _deferred(self, defer: bool = True, multicall: bool = True) -> ContextManager:
+        # Async calls are awaited concurrently instead of being batched
+        return nullcontext()
+
+    def _poll_operation_result(
+        self,
+        fetch: Callable[[], Awaitable[TReturn]],
+        operation: str,
+        timeout: float | None,
+    ) -> Awaitable[TReturn]:
+        return self.manager.node_provider.poller.async_poll(fetch, operation, timeout)
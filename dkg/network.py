@@ -16,35 +16,60 @@
 # under the License.
 
 from dkg.constants import DEFAULT_HASH_FUNCTION_ID
-from dkg.dataclasses import BidSuggestionRange
-from dkg.manager import DefaultRequestManager
+from dkg.dataclasses import BidSuggestionRange, PreparedAssertion
+from dkg.exceptions import ValidationError
+from dkg.manager import AsyncRequestManager, DefaultRequestManager
 from dkg.method import Method
-from dkg.module import Module
+from dkg.module import AsyncModule, Module
 from dkg.types import DataHexStr
 from dkg.utils.blockchain_request import BlockchainRequest
 from dkg.utils.node_request import NodeRequest
+from dkg.utils.steps import Steps, steps
 
 
-class Network(Module):
-    def __init__(self, manager: DefaultRequestManager):
+def _get_bid_suggestion_args(
+    public_assertion_id: DataHexStr | PreparedAssertion,
+    size_in_bytes: int | None,
+    epochs_number: int | None,
+) -> tuple[DataHexStr, int]:
+    if isinstance(public_assertion_id, PreparedAssertion):
+        if size_in_bytes is None:
+            size_in_bytes = public_assertion_id.size
+        public_assertion_id = public_assertion_id.public_assertion_id
+
+    if size_in_bytes is None or epochs_number is None:
+        raise ValidationError(
+            "Size in bytes and epochs number must be provided for the bid "
+            "suggestion, size can be omitted only for the prepared assertion."
+        )
+
+    return public_assertion_id, size_in_bytes
+
+
+class BaseNetwork:
+    def __init__(self, manager: DefaultRequestManager | AsyncRequestManager):
         self.manager = manager
 
     _get_asset_storage_address = Method(BlockchainRequest.get_asset_storage_address)
 
     _get_bid_suggestion = Method(NodeRequest.bid_suggestion)
 
+    @steps
     def get_bid_suggestion(
         self,
-        public_assertion_id: DataHexStr,
-        size_in_bytes: int,
-        epochs_number: int,
+        public_assertion_id: DataHexStr | PreparedAssertion,
+        size_in_bytes: int | None = None,
+        epochs_number: int | None = None,
         range: BidSuggestionRange = BidSuggestionRange.LOW,
-    ) -> int:
-        content_asset_storage_address = self._get_asset_storage_address(
+    ) -> Steps[int]:
+        public_assertion_id, size_in_bytes = _get_bid_suggestion_args(
+            public_assertion_id, size_in_bytes, epochs_number
+        )
+        content_asset_storage_address = yield self._get_asset_storage_address(
             "ContentAssetStorage"
         )
 
-        response = self._get_bid_suggestion(
+        response = yield self._get_bid_suggestion(
             self.manager.blockchain_provider.blockchain_id,
             epochs_number,
             size_in_bytes,
@@ -59,3 +84,11 @@ class Network(Module):
             if range != BidSuggestionRange.ALL
             else response
         )
+
+
+class Network(BaseNetwork, Module):
+    manager: DefaultRequestManager
+
+
+class AsyncNetwork(BaseNetwork, AsyncModule):
+    manager: AsyncRequestManager
@@ -22,15 +22,17 @@ from web3 import Web3
 from web3.types import TxReceipt
 
 from dkg.dataclasses import BaseIncentivesPoolParams, ParanetIncentivizationType
-from dkg.manager import DefaultRequestManager
+from dkg.manager import AsyncRequestManager, DefaultRequestManager
 from dkg.method import Method
-from dkg.module import Module
+from dkg.module import AsyncModule, Module
 from dkg.types import Address, UAL, HexStr
 from dkg.utils.blockchain_request import BlockchainRequest
+from dkg.utils.decorators import batchable, unbatched
+from dkg.utils.steps import Steps, steps
 from dkg.utils.ual import parse_ual
 
 
-class Paranet(Module):
+class BaseParanet:
     @dataclass
     class NeuroWebIncentivesPoolParams(BaseIncentivesPoolParams):
         neuro_emission_multiplier: float
@@ -48,7 +50,7 @@ class Paranet(Module):
                 ),
             }
 
-    def __init__(self, manager: DefaultRequestManager):
+    def __init__(self, manager: DefaultRequestManager | AsyncRequestManager):
         self.manager = manager
         self.incentives_pools_deployment_functions = {
             ParanetIncentivizationType.NEUROWEB: self._deploy_neuro_incentives_pool,
@@ -56,16 +58,17 @@ class Paranet(Module):
 
     _register_paranet = Method(BlockchainRequest.register_paranet)
 
+    @steps
     def create(
         self, ual: UAL, name: str, description: str
-    ) -> dict[str, str | HexStr | TxReceipt]:
+    ) -> Steps[dict[str, str | HexStr | TxReceipt]]:
         parsed_ual = parse_ual(ual)
         knowledge_asset_storage, knowledge_asset_token_id = (
             parsed_ual["contract_address"],
             parsed_ual["token_id"],
         )
 
-        receipt: TxReceipt = self._register_paranet(
+        receipt: TxReceipt = yield self._register_paranet(
             knowledge_asset_storage,
             knowledge_asset_token_id,
             name,
@@ -87,12 +90,13 @@ class Paranet(Module):
         BlockchainRequest.deploy_neuro_incentives_pool
     )
 
+    @steps
     def deploy_incentives_contract(
         self,
         ual: UAL,
         incentives_pool_parameters: NeuroWebIncentivesPoolParams,
         incentives_type: ParanetIncentivizationType = ParanetIncentivizationType.NEUROWEB,
-    ) -> dict[str, str | HexStr | TxReceipt]:
+    ) -> Steps[dict[str, str | HexStr | TxReceipt]]:
         deploy_incentives_pool_fn = self.incentives_pools_deployment_functions.get(
             incentives_type,
             None,
@@ -110,7 +114,7 @@ class Paranet(Module):
             parsed_ual["token_id"],
         )
 
-        receipt: TxReceipt = deploy_incentives_pool_fn(
+        receipt: TxReceipt = yield deploy_incentives_pool_fn(
             knowledge_asset_storage,
             knowledge_asset_token_id,
             **incentives_pool_parameters.to_contract_args(),
@@ -136,11 +140,13 @@ class Paranet(Module):
 
     _get_incentives_pool_address = Method(BlockchainRequest.get_incentives_pool_address)
 
+    @batchable
+    @steps
     def get_incentives_pool_address(
         self,
         ual: UAL,
         incentives_type: ParanetIncentivizationType = ParanetIncentivizationType.NEUROWEB,
-    ) -> Address:
+    ) -> Steps[Address]:
         parsed_ual = parse_ual(ual)
         knowledge_asset_storage, knowledge_asset_token_id = (
             parsed_ual["contract_address"],
@@ -150,20 +156,21 @@ class Paranet(Module):
             ["address", "uint256"], [knowledge_asset_storage, knowledge_asset_token_id]
         )
 
-        return self._get_incentives_pool_address(paranet_id, incentives_type)
+        return (yield self._get_incentives_pool_address(paranet_id, incentives_type))
 
     _register_paranet_service = Method(BlockchainRequest.register_paranet_service)
 
+    @steps
     def create_service(
         self, ual: UAL, name: str, description: str, addresses: list[Address]
-    ) -> dict[str, str | HexStr | TxReceipt]:
+    ) -> Steps[dict[str, str | HexStr | TxReceipt]]:
         parsed_ual = parse_ual(ual)
         knowledge_asset_storage, knowledge_asset_token_id = (
             parsed_ual["contract_address"],
             parsed_ual["token_id"],
         )
 
-        receipt: TxReceipt = self._register_paranet_service(
+        receipt: TxReceipt = yield self._register_paranet_service(
             knowledge_asset_storage,
             knowledge_asset_token_id,
             name,
@@ -184,9 +191,10 @@ class Paranet(Module):
 
     _add_paranet_services = Method(BlockchainRequest.add_paranet_services)
 
+    @steps
     def add_services(
         self, ual: UAL, services_uals: list[UAL]
-    ) -> dict[str, str | HexStr | TxReceipt]:
+    ) -> Steps[dict[str, str | HexStr | TxReceipt]]:
         parsed_paranet_ual = parse_ual(ual)
         paranet_knowledge_asset_storage, paranet_knowledge_asset_token_id = (
             parsed_paranet_ual["contract_address"],
@@ -196,7 +204,7 @@ class Paranet(Module):
         parsed_service_uals = []
         for service_ual in services_uals:
             parsed_service_ual = parse_ual(service_ual)
-            (service_knowledge_asset_storage, service_knowledge_asset_token_id) = (
+            service_knowledge_asset_storage, service_knowledge_asset_token_id = (
                 parsed_service_ual["contract_address"],
                 parsed_service_ual["token_id"],
             )
@@ -208,7 +216,7 @@ class Paranet(Module):
                 }
             )
 
-        receipt: TxReceipt = self._add_paranet_services(
+        receipt: TxReceipt = yield self._add_paranet_services(
             paranet_knowledge_asset_storage,
             paranet_knowledge_asset_token_id,
             parsed_service_uals,
@@ -229,7 +237,11 @@ class Paranet(Module):
         BlockchainRequest.is_knowledge_miner_registered
     )
 
-    def is_knowledge_miner(self, ual: UAL, address: Address | None = None) -> bool:
+    @batchable
+    @steps
+    def is_knowledge_miner(
+        self, ual: UAL, address: Address | None = None
+    ) -> Steps[bool]:
         parsed_ual = parse_ual(ual)
         knowledge_asset_storage, knowledge_asset_token_id = (
             parsed_ual["contract_address"],
@@ -240,70 +252,91 @@ class Paranet(Module):
             ["address", "uint256"], [knowledge_asset_storage, knowledge_asset_token_id]
         )
 
-        return self._is_knowledge_miner_registered(
-            paranet_id, address or self.manager.blockchain_provider.account.address
+        return (
+            yield self._is_knowledge_miner_registered(
+                paranet_id, address or self.manager.blockchain_provider.account.address
+            )
         )
 
     _owner_of = Method(BlockchainRequest.owner_of)
 
-    def is_operator(self, ual: UAL, address: Address | None = None) -> bool:
+    @steps
+    def is_operator(self, ual: UAL, address: Address | None = None) -> Steps[bool]:
         knowledge_asset_token_id = parse_ual(ual)["token_id"]
 
-        return self._owner_of(knowledge_asset_token_id) == (
+        return (yield self._owner_of(knowledge_asset_token_id)) == (
             address or self.manager.blockchain_provider.account.address
         )
 
     _is_proposal_voter = Method(BlockchainRequest.is_proposal_voter)
 
+    @batchable
+    @steps
     def is_voter(
         self,
         ual: UAL,
         address: Address | None = None,
         incentives_type: ParanetIncentivizationType = ParanetIncentivizationType.NEUROWEB,
-    ) -> bool:
-        return self._is_proposal_voter(
-            contract=self._get_incentives_pool_contract(ual, incentives_type),
-            addr=address or self.manager.blockchain_provider.account.address,
+    ) -> Steps[bool]:
+        contract = yield self._get_incentives_pool_contract(ual, incentives_type)
+
+        return (
+            yield self._is_proposal_voter(
+                contract=contract,
+                addr=address or self.manager.blockchain_provider.account.address,
+            )
         )
 
     _get_claimable_knowledge_miner_reward_amount = Method(
         BlockchainRequest.get_claimable_knowledge_miner_reward_amount
     )
 
+    # Reward amounts depend on the caller, so they can't go through Multicall
+    @batchable(multicall=False)
+    @steps
     def calculate_claimable_miner_reward_amount(
         self,
         ual: UAL,
         incentives_type: ParanetIncentivizationType = ParanetIncentivizationType.NEUROWEB,
-    ) -> int:
-        return self._get_claimable_knowledge_miner_reward_amount(
-            contract=self._get_incentives_pool_contract(ual, incentives_type)
+    ) -> Steps[int]:
+        contract = yield self._get_incentives_pool_contract(ual, incentives_type)
+
+        return (
+            yield self._get_claimable_knowledge_miner_reward_amount(contract=contract)
         )
 
     _get_claimable_all_knowledge_miners_reward_amount = Method(
         BlockchainRequest.get_claimable_all_knowledge_miners_reward_amount
     )
 
+    @batchable
+    @steps
     def calculate_all_claimable_miner_rewards_amount(
         self,
         ual: UAL,
         incentives_type: ParanetIncentivizationType = ParanetIncentivizationType.NEUROWEB,
-    ) -> int:
-        return self._get_claimable_all_knowledge_miners_reward_amount(
-            contract=self._get_incentives_pool_contract(ual, incentives_type)
+    ) -> Steps[int]:
+        contract = yield self._get_incentives_pool_contract(ual, incentives_type)
+
+        return (
+            yield self._get_claimable_all_knowledge_miners_reward_amount(
+                contract=contract
+            )
         )
 
     _claim_knowledge_miner_reward = Method(
         BlockchainRequest.claim_knowledge_miner_reward
     )
 
+    @steps
     def claim_miner_reward(
         self,
         ual: UAL,
         incentives_type: ParanetIncentivizationType = ParanetIncentivizationType.NEUROWEB,
-    ) -> dict[str, str | HexStr | TxReceipt]:
-        receipt: TxReceipt = self._claim_knowledge_miner_reward(
-            contract=self._get_incentives_pool_contract(ual, incentives_type)
-        )
+    ) -> Steps[dict[str, str | HexStr | TxReceipt]]:
+        contract = yield self._get_incentives_pool_contract(ual, incentives_type)
+
+        receipt: TxReceipt = yield self._claim_knowledge_miner_reward(contract=contract)
 
         parsed_ual = parse_ual(ual)
         knowledge_asset_storage, knowledge_asset_token_id = (
@@ -326,26 +359,33 @@ class Paranet(Module):
         BlockchainRequest.get_claimable_paranet_operator_reward_amount
     )
 
+    @batchable(multicall=False)
+    @steps
     def calculate_claimable_operator_reward_amount(
         self,
         ual: UAL,
         incentives_type: ParanetIncentivizationType = ParanetIncentivizationType.NEUROWEB,
-    ) -> int:
-        return self._get_claimable_paranet_operator_reward_amount(
-            contract=self._get_incentives_pool_contract(ual, incentives_type)
+    ) -> Steps[int]:
+        contract = yield self._get_incentives_pool_contract(ual, incentives_type)
+
+        return (
+            yield self._get_claimable_paranet_operator_reward_amount(contract=contract)
         )
 
     _claim_paranet_operator_reward = Method(
         BlockchainRequest.claim_paranet_operator_reward
     )
 
+    @steps
     def claim_operator_reward(
         self,
         ual: UAL,
         incentives_type: ParanetIncentivizationType = ParanetIncentivizationType.NEUROWEB,
-    ) -> dict[str, str | HexStr | TxReceipt]:
-        receipt: TxReceipt = self._claim_paranet_operator_reward(
-            contract=self._get_incentives_pool_contract(ual, incentives_type)
+    ) -> Steps[dict[str, str | HexStr | TxReceipt]]:
+        contract = yield self._get_incentives_pool_contract(ual, incentives_type)
+
+        receipt: TxReceipt = yield self._claim_paranet_operator_reward(
+            contract=contract
         )
 
         parsed_ual = parse_ual(ual)
@@ -369,39 +409,52 @@ class Paranet(Module):
         BlockchainRequest.get_claimable_proposal_voter_reward_amount
     )
 
+    @batchable(multicall=False)
+    @steps
     def calculate_claimable_voter_reward_amount(
         self,
         ual: UAL,
         incentives_type: ParanetIncentivizationType = ParanetIncentivizationType.NEUROWEB,
-    ) -> int:
-        return self._get_claimable_proposal_voter_reward_amount(
-            contract=self._get_incentives_pool_contract(ual, incentives_type)
+    ) -> Steps[int]:
+        contract = yield self._get_incentives_pool_contract(ual, incentives_type)
+
+        return (
+            yield self._get_claimable_proposal_voter_reward_amount(contract=contract)
         )
 
     _get_claimable_all_proposal_voters_reward_amount = Method(
         BlockchainRequest.get_claimable_all_proposal_voters_reward_amount
     )
 
+    @batchable
+    @steps
     def calculate_all_claimable_voters_reward_amount(
         self,
         ual: UAL,
         incentives_type: ParanetIncentivizationType = ParanetIncentivizationType.NEUROWEB,
-    ) -> int:
-        return self._get_claimable_all_proposal_voters_reward_amount(
-            contract=self._get_incentives_pool_contract(ual, incentives_type)
+    ) -> Steps[int]:
+        contract = yield self._get_incentives_pool_contract(ual, incentives_type)
+
+        return (
+            yield self._get_claimable_all_proposal_voters_reward_amount(
+                contract=contract
+            )
         )
 
     _claim_incentivization_proposal_voter_reward = Method(
         BlockchainRequest.claim_incentivization_proposal_voter_reward
     )
 
+    @steps
     def claim_voter_reward(
         self,
         ual: UAL,
         incentives_type: ParanetIncentivizationType = ParanetIncentivizationType.NEUROWEB,
-    ) -> dict[str, str | HexStr | TxReceipt]:
-        receipt: TxReceipt = self._claim_incentivization_proposal_voter_reward(
-            contract=self._get_incentives_pool_contract(ual, incentives_type)
+    ) -> Steps[dict[str, str | HexStr | TxReceipt]]:
+        contract = yield self._get_incentives_pool_contract(ual, incentives_type)
+
+        receipt: TxReceipt = yield self._claim_incentivization_proposal_voter_reward(
+            contract=contract
         )
 
         parsed_ual = parse_ual(ual)
@@ -428,7 +481,10 @@ class Paranet(Module):
         BlockchainRequest.process_updated_knowledge_asset_states_metadata
     )
 
-    def update_claimable_rewards(self, ual: UAL) -> dict[str, str | HexStr | TxReceipt]:
+    @steps
+    def update_claimable_rewards(
+        self, ual: UAL
+    ) -> Steps[dict[str, str | HexStr | TxReceipt]]:
         parsed_ual = parse_ual(ual)
         knowledge_asset_storage, knowledge_asset_token_id = (
             parsed_ual["contract_address"],
@@ -439,15 +495,17 @@ class Paranet(Module):
             ["address", "uint256"], [knowledge_asset_storage, knowledge_asset_token_id]
         )
 
-        updating_states = self._get_updating_knowledge_asset_states(
+        updating_states = yield self._get_updating_knowledge_asset_states(
             self.manager.blockchain_provider.account.address,
             paranet_id,
         )
-        receipt: TxReceipt = self._process_updated_knowledge_asset_states_metadata(
-            knowledge_asset_storage,
-            knowledge_asset_token_id,
-            0,
-            len(updating_states),
+        receipt: TxReceipt = (
+            yield self._process_updated_knowledge_asset_states_metadata(
+                knowledge_asset_storage,
+                knowledge_asset_token_id,
+                0,
+                len(updating_states),
+            )
         )
 
         return {
@@ -456,21 +514,30 @@ class Paranet(Module):
             "operation": json.loads(Web3.to_json(receipt)),
         }
 
+    @unbatched
+    @steps
     def _get_incentives_pool_contract(
         self,
         ual: UAL,
         incentives_type: ParanetIncentivizationType = ParanetIncentivizationType.NEUROWEB,
-    ) -> str | dict[str, str]:
+    ) -> Steps[str | dict[str, str]]:
         incentives_pool_name = f"Paranet{str(incentives_type)}IncentivesPool"
         is_incentives_pool_cached = (
             incentives_pool_name in self.manager.blockchain_provider.contracts.keys()
         )
 
-        return (
-            incentives_pool_name
-            if is_incentives_pool_cached
-            else {
-                "name": incentives_pool_name,
-                "address": self.get_incentives_pool_address(ual, incentives_type),
-            }
-        )
+        if is_incentives_pool_cached:
+            return incentives_pool_name
+
+        return {
+            "name": incentives_pool_name,
+            "address": (yield self.get_incentives_pool_address(ual, incentives_type)),
+        }
+
+
+class Paranet(BaseParanet, Module):
+    manager: DefaultRequestManager
+
+
+class AsyncParanet(BaseParanet, AsyncModule):
+    manager: AsyncRequestManager
@@ -1,2 +1,3 @@
-from .blockchain import BlockchainProvider  # NOQA
-from .node_http import NodeHTTPProvider  # NOQA
+from .blockchain import AsyncBlockchainProvider, BlockchainProvider  # NOQA
+from .node_http import AsyncNodeHTTPProvider, NodeHTTPProvider  # NOQA
+from .transaction import NonceManager, PendingTransaction  # NOQA
@@ -0,0 +1,127 @@
+# Licensed to the Apache Software Foundation (ASF) under one
+# or more contributor license agreements.  See the NOTICE file
+# distributed with this work for additional information
+# regarding copyright ownership.  The ASF licenses this file
+# to you under the Apache License, Version 2.0 (the
+# "License"); you may not use this file except in compliance
+# with the License.  You may obtain a copy of the License at
+
+#   http://www.apache.org/licenses/LICENSE-2.0
+
+# Unless required by applicable law or agreed to in writing,
+# software distributed under the License is distributed on an
+# "AS IS" BASIS, WITHOUT WARRANTIES OR CONDITIONS OF ANY
+# KIND, either express or implied.  See the License for the
+# specific language governing permissions and limitations
+# under the License.
+
+import hashlib
+import json
+import marshal
+import os
+import sys
+import threading
+from collections import namedtuple
+from functools import lru_cache
+from pathlib import Path
+from typing import Any, Type
+
+from dkg.utils.cache import get_cache_dir
+from web3.types import ABI
+
+ContractsABI = dict[str, ABI]
+OutputNamedTuples = dict[str, dict[str, Type[tuple]]]
+
+
+@lru_cache(maxsize=None)
+def load_abi_bundle(metadata_dir: Path) -> tuple[ContractsABI, OutputNamedTuples]:
+    """
+    Loads contract ABIs and output namedtuple classes once per process. The parsed
+    ABIs are kept in a marshalled bundle in the cache directory, so that following
+    processes don't need to parse the JSON files again. Returned dictionaries are
+    shared between providers and must not be modified.
+    """
+    metadata_files = sorted(metadata_dir.glob("*.json"))
+    bundle_path = (
+        get_cache_dir() / "abi" / f"{_get_bundle_key(metadata_files)}.marshal"
+    )
+
+    bundle = _read_bundle(bundle_path)
+    if bundle is None:
+        bundle = _compile_bundle(metadata_files)
+        _write_bundle(bundle_path, bundle)
+
+    output_named_tuples = {
+        contract_name: {
+            function_name: namedtuple(f"{function_name}Result", output_names)
+            for function_name, output_names in functions.items()
+        }
+        for contract_name, functions in bundle["output_names"].items()
+    }
+
+    return bundle["abi"], output_named_tuples
+
+
+def _get_bundle_key(metadata_files: list[Path]) -> str:
+    key = hashlib.sha256(f"{sys.version_info[:2]}:{marshal.version}".encode())
+    for metadata_file in metadata_files:
+        stat = metadata_file.stat()
+        key.update(f"{metadata_file.name}:{stat.st_size}:{stat.st_mtime_ns}".encode())
+
+    return key.hexdigest()[:16]
+
+
+def _compile_bundle(metadata_files: list[Path]) -> dict[str, Any]:
+    abi = {}
+    for metadata_file in metadata_files:
+        with open(metadata_file, "r") as metadata_json:
+            abi[metadata_file.stem] = json.load(metadata_json)
+
+    return {
+        "abi": abi,
+        "output_names": {
+            contract_name: _get_output_names(contract_abi)
+            for contract_name, contract_abi in abi.items()
+        },
+    }
+
+
+def _get_output_names(contract_abi: ABI) -> dict[str, list[str]]:
+    output_names = {}
+    for item in contract_abi:
+        if (item["type"] != "function") or not item["outputs"]:
+            continue
+        elif item["name"] in output_names:
+            continue
+
+        names = [output["name"] for output in item["outputs"]]
+        if all(name != "" for name in names):
+            output_names[item["name"]] = names
+
+    return output_names
+
+
+def _read_bundle(bundle_path: Path) -> dict[str, Any] | None:
+    try:
+        with open(bundle_path, "rb") as bundle_file:
+            bundle = marshal.loads(bundle_file.read())
+    except (OSError, EOFError, ValueError, TypeError):
+        return None
+
+    if not isinstance(bundle, dict) or bundle.keys() != {"abi", "output_names"}:
+        return None
+
+    return bundle
+
+
+def _write_bundle(bundle_path: Path, bundle: dict[str, Any]) -> None:
+    temporary_path = bundle_path.with_suffix(
+        f".{os.getpid()}.{threading.get_ident()}.tmp"
+    )
+    try:
+        bundle_path.parent.mkdir(parents=True, exist_ok=True)
+        with open(temporary_path, "wb") as bundle_file:
+            bundle_file.write(marshal.dumps(bundle))
+        os.replace(temporary_path, bundle_path)
+    except OSError:
+        pass
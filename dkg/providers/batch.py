@@ -0,0 +1,210 @@
+# Licensed to the Apache Software Foundation (ASF) under one
+# or more contributor license agreements.  See the NOTICE file
+# distributed with this work for additional information
+# regarding copyright ownership.  The ASF licenses this file
+# to you under the Apache License, Version 2.0 (the
+# "License"); you may not use this file except in compliance
+# with the License.  You may obtain a copy of the License at
+
+#   http://www.apache.org/licenses/LICENSE-2.0
+
+# Unless required by applicable law or agreed to in writing,
+# software distributed under the License is distributed on an
+# "AS IS" BASIS, WITHOUT WARRANTIES OR CONDITIONS OF ANY
+# KIND, either express or implied.  See the License for the
+# specific language governing permissions and limitations
+# under the License.
+
+import inspect
+import threading
+from typing import TYPE_CHECKING, Any
+
+from web3.contract.contract import ContractFunction
+from web3.datastructures import AttributeDict
+from web3.eth import Eth
+from web3.manager import RequestManager, apply_result_formatters
+from web3.method import Method
+
+if TYPE_CHECKING:
+    from dkg.providers.blockchain import BlockchainProvider
+
+# Web3 endpoints that can be sent as a part of the JSON-RPC batch, mapped to
+# the web3 methods that define their request and response formatting
+BATCHABLE_JSON_RPC_ENDPOINTS = {
+    "call": "_call",
+    "chain_id": "_chain_id",
+    "get_block": "_get_block",
+    "get_block_number": "get_block_number",
+    "get_logs": "_get_logs",
+    "get_transaction_receipt": "_transaction_receipt",
+}
+
+_PENDING = object()
+
+
+class JSONRPCBatchRequest:
+    def __init__(self, eth: Eth, endpoint: str, args: dict[str, Any] = {}):
+        web3_method: Method = inspect.getattr_static(
+            Eth, BATCHABLE_JSON_RPC_ENDPOINTS[endpoint]
+        )
+
+        # Mungers of web3 methods accept only positional arguments, so keyword
+        # arguments are ordered using the signature of the public Eth method
+        public_method = inspect.getattr_static(Eth, endpoint)
+        positional_args = (
+            inspect.signature(public_method).bind(eth, **args).args[1:]
+            if inspect.isfunction(public_method)
+            else tuple(args.values())
+        )
+
+        (self.method, self.params), self.formatters = web3_method.process_params(
+            eth, *positional_args
+        )
+
+    def to_payload(self, request_id: int) -> dict[str, Any]:
+        return {
+            "jsonrpc": "2.0",
+            "id": request_id,
+            "method": self.method,
+            "params": self.params,
+        }
+
+    def format_response(self, response: dict[str, Any]) -> Any:
+        result_formatters, error_formatters, null_result_formatters = self.formatters
+
+        result = RequestManager.formatted_response(
+            response, self.params, error_formatters, null_result_formatters
+        )
+
+        return AttributeDict.recursive(
+            apply_result_formatters(result_formatters, result)
+        )
+
+
+class BatchedResult:
+    """
+    Handle for a request queued in a batch. The value is available after the
+    batch is flushed, calling `result` flushes it if needed.
+    """
+
+    def __init__(self, batch: "CallBatch"):
+        self.batch = batch
+
+        self._result: Any = _PENDING
+        self._exception: Exception | None = None
+
+    def done(self) -> bool:
+        return self._result is not _PENDING or self._exception is not None
+
+    def result(self) -> Any:
+        if not self.done():
+            self.batch.flush()
+
+        if self._exception is not None:
+            raise self._exception
+
+        return self._result
+
+    def set_result(self, result: Any) -> None:
+        self._result = result
+
+    def set_exception(self, exception: Exception) -> None:
+        self._exception = exception
+
+
+class BatchedCall(BatchedResult):
+    def __init__(
+        self,
+        batch: "CallBatch",
+        contract: str | dict[str, str],
+        function: str,
+        args: dict[str, Any],
+        contract_function: ContractFunction,
+        use_multicall: bool = True,
+    ):
+        super().__init__(batch)
+        self.contract = contract
+        self.function = function
+        self.args = args
+        self.contract_function = contract_function
+        self.use_multicall = use_multicall
+
+    @property
+    def contract_name(self) -> str:
+        return (
+            self.contract if isinstance(self.contract, str) else self.contract["name"]
+        )
+
+
+class BatchedRequest(BatchedResult):
+    def __init__(
+        self,
+        batch: "CallBatch",
+        endpoint: str,
+        args: dict[str, Any],
+        rpc_request: JSONRPCBatchRequest,
+    ):
+        super().__init__(batch)
+        self.endpoint = endpoint
+        self.args = args
+        self.rpc_request = rpc_request
+
+
+class CallBatch:
+    def __init__(self, provider: "BlockchainProvider"):
+        self.provider = provider
+        self.defer = False
+        self.multicall = True
+
+        self._depth = 0
+        self._queue: list[BatchedResult] = []
+        self._lock = threading.RLock()
+
+    def add(
+        self,
+        contract: str | dict[str, str],
+        function: str,
+        args: dict[str, Any],
+        contract_function: ContractFunction,
+    ) -> BatchedCall:
+        return self._enqueue(
+            BatchedCall(
+                self, contract, function, args, contract_function, self.multicall
+            )
+        )
+
+    def add_request(self, endpoint: str, args: dict[str, Any]) -> BatchedRequest:
+        return self._enqueue(
+            BatchedRequest(
+                self,
+                endpoint,
+                args,
+                JSONRPCBatchRequest(self.provider.w3.eth, endpoint, args),
+            )
+        )
+
+    def flush(self) -> None:
+        with self._lock:
+            queue, self._queue = self._queue, []
+
+            if queue:
+                self.provider._execute_batch(queue)
+
+    def enter_scope(self, defer: bool, multicall: bool) -> tuple[bool, bool, int]:
+        previous_state = self.defer, self.multicall, self._depth
+        # Only the outermost batchable method defers its calls, nested ones need
+        # the values right away to compute their own results
+        self.defer = defer and self._depth == 0
+        self.multicall = multicall
+        self._depth += 1
+
+        return previous_state
+
+    def exit_scope(self, previous_state: tuple[bool, bool, int]) -> None:
+        self.defer, self.multicall, self._depth = previous_state
+
+    def _enqueue(self, item: BatchedResult) -> BatchedResult:
+        with self._lock:
+            self._queue.append(item)
+
+        return item
@@ -15,13 +15,18 @@
 # specific language governing permissions and limitations
 # under the License.
 
+
+import asyncio
 import json
 import os
-from collections import namedtuple
-from functools import wraps
+import threading
+import time
+from contextlib import contextmanager
+from functools import cached_property, partial, wraps
 from pathlib import Path
-from typing import Any, Type
+from typing import Any, Callable, Iterator, TypeVar
 
+import aiohttp
 import requests
 from dkg.constants import BLOCKCHAINS, DEFAULT_GAS_PRICE_GWEI
 from dkg.exceptions import (
@@ -30,116 +35,133 @@ from dkg.exceptions import (
     NetworkNotSupported,
     RPCURINotDefined,
 )
+from dkg.providers.abi import load_abi_bundle
+from dkg.providers.batch import (
+    BATCHABLE_JSON_RPC_ENDPOINTS,
+    BatchedCall,
+    BatchedRequest,
+    BatchedResult,
+    CallBatch,
+    JSONRPCBatchRequest,
+)
+from dkg.providers.multicall import MULTICALL3_ABI, decode_call_output
+from dkg.providers.transaction import (
+    AsyncNonceManager,
+    AsyncPendingTransaction,
+    NonceManager,
+    PendingTransaction,
+)
 from dkg.types import URI, Address, DataHexStr, Environment, Wei
+from dkg.utils.cache import get_cache_dir
+from dkg.utils.steps import Steps, async_run_steps, run_steps
 from eth_account.signers.local import LocalAccount
-from web3 import Web3
-from web3.contract import Contract
+from eth_utils import event_abi_to_log_topic
+from web3 import AsyncWeb3, Web3
+from web3.contract import AsyncContract, Contract
 from web3.contract.contract import ContractFunction
 from web3.logs import DISCARD
 from web3.middleware import construct_sign_and_send_raw_middleware
-from web3.types import ABI, ABIFunction, TxReceipt
+from web3.types import LogReceipt, TxReceipt
+
+T = TypeVar("T")
+
+
+def handle_updated_contract(func: Callable[..., Steps[T]]) -> Callable[..., T]:
+    @wraps(func)
+    def wrapper(self: "BaseBlockchainProvider", *args, **kwargs) -> T:
+        return self._run(self._handle_updated_contract(func, args, kwargs))
 
+    return wrapper
 
-class BlockchainProvider:
+
+class BaseBlockchainProvider:
     CONTRACTS_METADATA_DIR = Path(__file__).parents[1] / "data/interfaces"
 
+    w3: Web3 | AsyncWeb3
+    contracts: dict[str, Contract | AsyncContract]
+    nonce_manager_class: type[NonceManager] = NonceManager
+    pending_transaction_class: type[PendingTransaction] = PendingTransaction
+
     def __init__(
         self,
         environment: Environment,
         blockchain_id: str,
         rpc_uri: URI | None = None,
-        private_key: DataHexStr | None = None,
         gas_price: Wei | None = None,
-        verify: bool = True,
     ):
         if environment not in BLOCKCHAINS.keys():
             raise EnvironmentNotSupported(f"Environment {environment} isn't supported!")
 
         self.environment = environment
         self.rpc_uri = rpc_uri
-        self.blockchain_id = (
+        # Blockchain IDs without a chain ID are completed with the one reported
+        # by the RPC, which is requested on first use
+        known_blockchain_id = (
             blockchain_id
             if blockchain_id in BLOCKCHAINS[self.environment].keys()
             else None
         )
+        self.blockchain_id = known_blockchain_id
 
-        if self.rpc_uri is None and self.blockchain_id is not None:
-            self.blockchain_id = blockchain_id
-            self.rpc_uri = self.rpc_uri or BLOCKCHAINS[self.environment][
-                self.blockchain_id
-            ].get("rpc", None)
+        if self.rpc_uri is None and known_blockchain_id is not None:
+            self.rpc_uri = BLOCKCHAINS[self.environment][known_blockchain_id].get(
+                "rpc", None
+            )
 
         if self.rpc_uri is None:
             raise RPCURINotDefined(
                 "No RPC URI provided for unrecognized "
-                f"blockchain ID {self.blockchain_id}"
+                f"blockchain ID {known_blockchain_id}"
             )
 
-        self.w3 = Web3(
-            Web3.HTTPProvider(self.rpc_uri, request_kwargs={"verify": verify})
+        self.gas_price = gas_price
+
+        self.abi, self.output_named_tuples = load_abi_bundle(
+            self.CONTRACTS_METADATA_DIR
         )
 
-        if self.blockchain_id is None:
-            self.blockchain_id = f"{blockchain_id}:{self.w3.eth.chain_id}"
-            if self.blockchain_id not in BLOCKCHAINS[self.environment]:
-                raise NetworkNotSupported(
-                    f"Network with blockchain ID {self.blockchain_id} isn't supported!"
-                )
+    def _set_blockchain_id(self, blockchain_id: str, chain_id: int) -> None:
+        blockchain_id = f"{blockchain_id}:{chain_id}"
+        if blockchain_id not in BLOCKCHAINS[self.environment]:
+            raise NetworkNotSupported(
+                f"Network with blockchain ID {blockchain_id} isn't supported!"
+            )
 
-        self.gas_price = gas_price
-        self.gas_price_oracle = BLOCKCHAINS[self.environment][self.blockchain_id].get(
+        self.blockchain_id = blockchain_id
+
+    def _get_gas_price_oracle(self) -> str | list[str] | None:
+        return BLOCKCHAINS[self.environment][self.blockchain_id].get(
             "gas_price_oracle",
             None,
         )
 
-        self.abi = self._load_abi()
-        self.output_named_tuples = self._generate_output_named_tuples()
+    def _get_hub_address(self) -> Address:
+        return BLOCKCHAINS[self.environment][self.blockchain_id]["hub"]
 
-        hub_address: Address = BLOCKCHAINS[self.environment][self.blockchain_id]["hub"]
-        self.contracts: dict[str, Contract] = {
-            "Hub": self.w3.eth.contract(
-                address=hub_address,
-                abi=self.abi["Hub"],
-                decode_tuples=True,
-            )
-        }
-        self._init_contracts()
+    def _get_multicall_address(self) -> Address | None:
+        return BLOCKCHAINS[self.environment][self.blockchain_id].get("multicall")
 
-        if (
-            private_key is not None
-            or (private_key_env := os.environ.get("PRIVATE_KEY", None)) is not None
-        ):
-            self.set_account(private_key or private_key_env)
+    def _get_default_gas_price(self) -> Wei:
+        blockchain_name, _ = self.blockchain_id.split(":")
 
-    def make_json_rpc_request(self, endpoint: str, args: dict[str, Any] = {}) -> Any:
-        web3_method = getattr(self.w3.eth, endpoint)
+        return Web3.to_wei(DEFAULT_GAS_PRICE_GWEI[blockchain_name], "gwei")
 
-        if callable(web3_method):
-            return web3_method(**args)
+    @staticmethod
+    def _parse_gas_price_oracle_response(data: dict) -> Wei | None:
+        if "result" in data:
+            return int(data["result"], 16)
+        elif "average" in data:
+            return Web3.to_wei(data["average"], "gwei")
         else:
-            return web3_method
+            return None
 
-    @staticmethod
-    def handle_updated_contract(func):
-        @wraps(func)
-        def wrapper(self, *args, **kwargs):
-            contract_name = kwargs.get("contract") or (args[0] if args else None)
+    def _format_call_result(self, contract_name: str, function: str, result: Any):
+        if function in (output_named_tuples := self.output_named_tuples[contract_name]):
+            result = output_named_tuples[function](*result)
+        return result
 
-            try:
-                return func(self, *args, **kwargs)
-            except Exception as err:
-                if (
-                    contract_name
-                    and isinstance(contract_name, str)
-                    and any(msg in str(err) for msg in ["revert", "VM Exception"])
-                    and not self._check_contract_status(contract_name)
-                ):
-                    is_updated = self._update_contract_instance(contract_name)
-                    if is_updated:
-                        return func(self, *args, **kwargs)
-                raise err
-
-        return wrapper
+    def _run(self, steps: Steps[T]) -> T:
+        raise NotImplementedError
 
     @handle_updated_contract
     def call_function(
@@ -150,10 +172,13 @@ class BlockchainProvider:
         state_changing: bool = False,
         gas_price: Wei | None = None,
         gas_limit: Wei | None = None,
-    ) -> TxReceipt | Any:
+        wait_for_receipt: bool = True,
+    ) -> Steps[TxReceipt | PendingTransaction | Any]:
+        yield self.initialize()
+
         if isinstance(contract, str):
             contract_name = contract
-            contract_instance = self.contracts[contract_name]
+            contract_instance = yield self.get_contract(contract_name)
         else:
             contract_name = contract["name"]
             contract_instance = self.w3.eth.contract(
@@ -165,33 +190,126 @@ class BlockchainProvider:
 
         contract_function: ContractFunction = getattr(
             contract_instance.functions, function
-        )
+        )(**args)
 
         if not state_changing:
-            result = contract_function(**args).call()
-            if function in (
-                output_named_tuples := self.output_named_tuples[contract_name]
+            batched_call = self._defer_call(contract, function, args, contract_function)
+            if batched_call is not None:
+                return batched_call
+
+            result = yield contract_function.call()
+            return self._format_call_result(contract_name, function, result)
+
+        if not hasattr(self, "account"):
+            raise AccountMissing(
+                "State-changing transactions can be performed only with specified "
+                "account."
+            )
+
+        gas_price = (
+            self.gas_price or gas_price or (yield from self._get_network_gas_price())
+        )
+
+        options = {
+            "from": self.account.address,
+            "chainId": int(self.blockchain_id.split(":")[-1]),
+            "gas": gas_limit
+            or (yield contract_function.estimate_gas({"from": self.account.address})),
+        }
+        if gas_price is not None:
+            options["gasPrice"] = gas_price
+
+        pending_transaction = yield from self._send_transaction(
+            contract_function, options
+        )
+
+        if not wait_for_receipt:
+            return pending_transaction
+
+        return (yield pending_transaction.result())
+
+    def _handle_updated_contract(
+        self, func: Callable[..., Steps[T]], args: tuple, kwargs: dict[str, Any]
+    ) -> Steps[T]:
+        contract_name = kwargs.get("contract") or (args[0] if args else None)
+
+        try:
+            return (yield from func(self, *args, **kwargs))
+        except Exception as err:
+            if (
+                contract_name
+                and isinstance(contract_name, str)
+                and any(msg in str(err) for msg in ["revert", "VM Exception"])
+                and not (yield from self._check_contract_status(contract_name))
             ):
-                result = output_named_tuples[function](*result)
-            return result
-        else:
-            if not hasattr(self, "account"):
-                raise AccountMissing(
-                    "State-changing transactions can be performed only with specified "
-                    "account."
+                is_updated = yield self._update_contract_instance(contract_name)
+                if is_updated:
+                    return (yield from func(self, *args, **kwargs))
+                self._invalidate_contract_instances([contract_name])
+            raise err
+
+    def _defer_call(
+        self,
+        contract: str | dict[str, str],
+        function: str,
+        args: dict[str, Any],
+        contract_function: ContractFunction,
+    ) -> BatchedCall | None:
+        return None
+
+    def _send_transaction(
+        self, contract_function: ContractFunction, options: dict[str, Any]
+    ) -> Steps[PendingTransaction]:
+        for attempt in range(2):
+            nonce = yield self.nonce_manager.acquire()
+            is_sent = False
+            try:
+                transaction = yield contract_function.build_transaction(
+                    {**options, "nonce": nonce}
                 )
+                signed_transaction = self.account.sign_transaction(transaction)
+                tx_hash = yield self.w3.eth.send_raw_transaction(
+                    signed_transaction.rawTransaction
+                )
+                is_sent = True
+                break
+            except Exception as err:
+                # Local nonce went stale (e.g. account used elsewhere), it's
+                # resynchronized with the node on release, so retry once
+                if attempt > 0 or not NonceManager.is_nonce_error(err):
+                    raise
+            finally:
+                self.nonce_manager.release(nonce, is_sent)
 
-            gas_price = self.gas_price or gas_price or self._get_network_gas_price()
+        return self.pending_transaction_class(
+            self.w3,
+            self.account.address,
+            tx_hash,
+            nonce,
+            signed_transaction.rawTransaction,
+        )
 
-            options = {
-                "gasPrice": gas_price,
-                "gas": gas_limit or contract_function(**args).estimate_gas(),
-            }
+    def _get_network_gas_price(self) -> Steps[Wei | None]:
+        if self.environment == "development":
+            return None
 
-            tx_hash = contract_function(**args).transact(options)
-            tx_receipt = self.w3.eth.wait_for_transaction_receipt(tx_hash)
+        oracles = self.gas_price_oracle
+        if oracles is not None:
+            if isinstance(oracles, str):
+                oracles = [oracles]
 
-            return tx_receipt
+            for oracle_url in oracles:
+                gas_price = yield self._fetch_gas_price(oracle_url)
+                if gas_price is not None:
+                    return gas_price
+
+        return self._get_default_gas_price()
+
+    def _check_contract_status(self, contract: str) -> Steps[bool]:
+        try:
+            return (yield self.call_function(contract, "status"))
+        except Exception:
+            return False
 
     def decode_logs_event(
         self, receipt: TxReceipt, contract_name: str, event_name: str
@@ -204,69 +322,849 @@ class BlockchainProvider:
 
     def set_account(self, private_key: DataHexStr):
         self.account: LocalAccount = self.w3.eth.account.from_key(private_key)
+        self.w3.eth.default_account = self.account.address
+        self.nonce_manager = self.nonce_manager_class(self.w3, self.account.address)
+
+
+class LazyContracts(dict[str, Contract]):
+    """
+    Contract instances resolved through the Hub on first access.
+    """
+
+    def __init__(self, provider: "BlockchainProvider", *args, **kwargs):
+        super().__init__(*args, **kwargs)
+        self.provider = provider
+        self._lock = threading.RLock()
+
+    def __missing__(self, contract_name: str) -> Contract:
+        # Addresses are resolved without holding the lock, so a contract can be
+        # resolved by several threads at once, but none of them waits for the
+        # RPC requests of another one
+        if contract_name == "Hub":
+            hub = self.provider._get_hub_contract()
+            with self._lock:
+                return self.setdefault("Hub", hub)
+
+        self.provider._load_contracts_cache()
+
+        if contract_name not in self and contract_name in self.provider.abi:
+            self.provider._update_contract_instance(contract_name)
+
+        if (contract := self.get(contract_name)) is not None:
+            return contract
+
+        raise KeyError(contract_name)
+
+
+class BlockchainProvider(BaseBlockchainProvider):
+    MULTICALL_BATCH_SIZE = 500
+    JSON_RPC_BATCH_SIZE = 100
+    JSON_RPC_TIMEOUT = 10
+    CONTRACTS_CACHE_TTL = 24 * 60 * 60
+    HUB_EVENTS = {
+        "NewContract": False,
+        "ContractChanged": False,
+        "NewAssetStorage": True,
+        "AssetStorageChanged": True,
+    }
+    HUB_LOGS_BLOCK_RANGE = 10_000
+
+    # Last Hub events sync of every cached set of contract addresses in this
+    # process, so providers created for the same chain don't repeat it
+    _contracts_synced_at: dict[str, float] = {}
+
+    def __init__(
+        self,
+        environment: Environment,
+        blockchain_id: str,
+        rpc_uri: URI | None = None,
+        private_key: DataHexStr | None = None,
+        gas_price: Wei | None = None,
+        verify: bool = True,
+        cache_contracts: bool | None = None,
+        contracts_cache_path: str | Path | None = None,
+        contracts_cache_ttl: float | None = None,
+    ):
+        self._requested_blockchain_id = blockchain_id
+        self._blockchain_id_lock = threading.Lock()
+        super().__init__(environment, blockchain_id, rpc_uri, gas_price)
+
+        self.w3 = Web3(
+            Web3.HTTPProvider(self.rpc_uri, request_kwargs={"verify": verify})
+        )
+        self.rpc_session = requests.Session()
+        self.rpc_session.verify = verify
+
+        self._batch_state = threading.local()
+
+        if cache_contracts is None:
+            # Local chains are redeployed at the same addresses, so their contracts
+            # are only cached on request
+            cache_contracts = self.environment != "development"
+
+        self.contracts_cache_path = (
+            Path(contracts_cache_path or get_cache_dir() / "contracts.json")
+            if cache_contracts
+            else None
+        )
+        self.contracts_cache_ttl = (
+            contracts_cache_ttl
+            if contracts_cache_ttl is not None
+            else self.CONTRACTS_CACHE_TTL
+        )
+        self._contracts_cache: dict[str, dict[str, Any]] = {}
+        self._is_contracts_cache_loaded = False
+        self.contracts = LazyContracts(self)
+
+        if (
+            private_key is not None
+            or (private_key_env := os.environ.get("PRIVATE_KEY", None)) is not None
+        ):
+            self.set_account(private_key or private_key_env)
+
+    def make_json_rpc_request(self, endpoint: str, args: dict[str, Any] = {}) -> Any:
+        batch = self.current_batch
+        if (
+            batch is not None
+            and batch.defer
+            and endpoint in BATCHABLE_JSON_RPC_ENDPOINTS
+        ):
+            return batch.add_request(endpoint, args)
+
+        web3_method = getattr(self.w3.eth, endpoint)
+
+        if callable(web3_method):
+            return web3_method(**args)
+        else:
+            return web3_method
+
+    @property
+    def blockchain_id(self) -> str:
+        if self._blockchain_id is None:
+            with self._blockchain_id_lock:
+                if self._blockchain_id is None:
+                    self._set_blockchain_id(
+                        self._requested_blockchain_id, self.w3.eth.chain_id
+                    )
+
+        return self._blockchain_id
+
+    @blockchain_id.setter
+    def blockchain_id(self, blockchain_id: str | None) -> None:
+        self._blockchain_id = blockchain_id
+
+    @cached_property
+    def gas_price_oracle(self) -> str | list[str] | None:
+        return self._get_gas_price_oracle()
+
+    @cached_property
+    def multicall(self) -> Contract | None:
+        multicall_address = self._get_multicall_address()
+        if multicall_address is None:
+            return None
+
+        return self.w3.eth.contract(address=multicall_address, abi=MULTICALL3_ABI)
+
+    def _get_hub_contract(self) -> Contract:
+        return self.w3.eth.contract(
+            address=self._get_hub_address(),
+            abi=self.abi["Hub"],
+            decode_tuples=True,
+        )
+
+    def _run(self, steps: Steps[T]) -> T:
+        return run_steps(steps)
+
+    def initialize(self) -> None:
+        # Chain ID and contracts are resolved on first use
+        return None
+
+    def get_contract(self, contract_name: str) -> Contract:
+        return self.contracts[contract_name]
+
+    def _defer_call(
+        self,
+        contract: str | dict[str, str],
+        function: str,
+        args: dict[str, Any],
+        contract_function: ContractFunction,
+    ) -> BatchedCall | None:
+        batch = self.current_batch
+        if batch is not None and batch.defer:
+            return batch.add(contract, function, args, contract_function)
+
+        return None
+
+    @property
+    def current_batch(self) -> CallBatch | None:
+        return getattr(self._batch_state, "batch", None)
+
+    @contextmanager
+    def batch(self) -> Iterator[CallBatch]:
+        if self.current_batch is not None:
+            yield self.current_batch
+            return
+
+        batch = CallBatch(self)
+        self._batch_state.batch = batch
+        try:
+            yield batch
+        finally:
+            self._batch_state.batch = None
+
+        batch.flush()
+
+    @contextmanager
+    def deferred(self, defer: bool = True, multicall: bool = True) -> Iterator[None]:
+        batch = self.current_batch
+        if batch is None:
+            yield
+            return
+
+        previous_state = batch.enter_scope(defer, multicall)
+        try:
+            yield
+        finally:
+            batch.exit_scope(previous_state)
+
+    def make_batch_json_rpc_request(
+        self, requests: list[JSONRPCBatchRequest]
+    ) -> list[dict[str, Any] | None]:
+        responses = []
+        for i in range(0, len(requests), self.JSON_RPC_BATCH_SIZE):
+            chunk = requests[i : i + self.JSON_RPC_BATCH_SIZE]
+
+            response = self.rpc_session.post(
+                self.rpc_uri,
+                json=[
+                    request.to_payload(request_id)
+                    for request_id, request in enumerate(chunk)
+                ],
+                timeout=self.JSON_RPC_TIMEOUT,
+            )
+            response.raise_for_status()
+
+            data = response.json()
+            if not isinstance(data, list):
+                raise ValueError(f"Unexpected JSON-RPC batch response: {data}")
+
+            responses_by_id = {
+                item["id"]: item
+                for item in data
+                if isinstance(item, dict) and item.get("id") is not None
+            }
+            responses.extend(
+                responses_by_id.get(request_id) for request_id in range(len(chunk))
+            )
+
+        return responses
+
+    def _execute_batch(self, queue: list[BatchedResult]) -> None:
+        calls = [
+            item
+            for item in queue
+            if isinstance(item, BatchedCall)
+            and item.use_multicall
+            and self.multicall is not None
+        ]
+
+        # JSON-RPC requests paired with the functions resolving queued items
+        # from their responses
+        batch: list[
+            tuple[JSONRPCBatchRequest, Callable[[JSONRPCBatchRequest, Any], None]]
+        ] = []
+
+        for i in range(0, len(calls), self.MULTICALL_BATCH_SIZE):
+            chunk = calls[i : i + self.MULTICALL_BATCH_SIZE]
+            aggregate = self.multicall.functions.aggregate3(
+                [
+                    (
+                        call.contract_function.address,
+                        True,
+                        call.contract_function._encode_transaction_data(),
+                    )
+                    for call in chunk
+                ]
+            )
+            batch.append(
+                (
+                    self._prepare_call_request(aggregate),
+                    partial(self._resolve_multicall, chunk, aggregate),
+                )
+            )
+
+        for item in queue:
+            if isinstance(item, BatchedRequest):
+                batch.append((item.rpc_request, partial(self._resolve_request, item)))
+            elif item not in calls:
+                batch.append(
+                    (
+                        self._prepare_call_request(item.contract_function),
+                        partial(self._resolve_call, item),
+                    )
+                )
+
+        try:
+            responses = self.make_batch_json_rpc_request(
+                [rpc_request for rpc_request, _ in batch]
+            )
+        except Exception:
+            # RPC doesn't support batching, every item is executed on its own
+            responses = [None] * len(batch)
+
+        for (rpc_request, resolve), response in zip(batch, responses):
+            resolve(rpc_request, response)
+
+    def _prepare_call_request(
+        self, contract_function: ContractFunction
+    ) -> JSONRPCBatchRequest:
+        return JSONRPCBatchRequest(
+            self.w3.eth,
+            "call",
+            {
+                "transaction": {
+                    **contract_function._get_call_txparams(),
+                    "data": contract_function._encode_transaction_data(),
+                }
+            },
+        )
+
+    def _resolve_multicall(
+        self,
+        calls: list[BatchedCall],
+        aggregate: ContractFunction,
+        rpc_request: JSONRPCBatchRequest,
+        response: dict[str, Any] | None,
+    ) -> None:
+        try:
+            results = decode_call_output(
+                aggregate, rpc_request.format_response(response)
+            )
+        except Exception:
+            results = [(False, b"")] * len(calls)
+
+        for call, (success, return_data) in zip(calls, results):
+            if success:
+                self._set_call_output(call, return_data)
+            else:
+                self._execute_call(call)
+
+    def _resolve_call(
+        self,
+        call: BatchedCall,
+        rpc_request: JSONRPCBatchRequest,
+        response: dict[str, Any] | None,
+    ) -> None:
+        try:
+            return_data = rpc_request.format_response(response)
+        except Exception:
+            self._execute_call(call)
+            return
+
+        self._set_call_output(call, return_data)
+
+    def _resolve_request(
+        self,
+        request: BatchedRequest,
+        rpc_request: JSONRPCBatchRequest,
+        response: dict[str, Any] | None,
+    ) -> None:
+        if response is None:
+            self._execute_request(request)
+            return
+
+        try:
+            request.set_result(rpc_request.format_response(response))
+        except Exception as err:
+            request.set_exception(err)
+
+    def _set_call_output(self, call: BatchedCall, return_data: bytes) -> None:
+        try:
+            call.set_result(
+                self._format_call_result(
+                    call.contract_name,
+                    call.function,
+                    decode_call_output(call.contract_function, return_data),
+                )
+            )
+        except Exception as err:
+            call.set_exception(err)
+
+    def _execute_call(self, call: BatchedCall) -> None:
+        # Executed on its own to surface the revert reason and resolve updated
+        # contracts the same way as unbatched calls
+        try:
+            with self.deferred(False):
+                call.set_result(
+                    self.call_function(call.contract, call.function, call.args)
+                )
+        except Exception as err:
+            call.set_exception(err)
+
+    def _execute_request(self, request: BatchedRequest) -> None:
+        try:
+            with self.deferred(False):
+                request.set_result(
+                    self.make_json_rpc_request(request.endpoint, request.args)
+                )
+        except Exception as err:
+            request.set_exception(err)
+
+    def set_account(self, private_key: DataHexStr):
+        super().set_account(private_key)
         self.w3.middleware_onion.add(
             construct_sign_and_send_raw_middleware(self.account)
         )
-        self.w3.eth.default_account = self.account.address
 
-    def _get_network_gas_price(self) -> Wei | None:
-        if self.environment == "development":
+    def _fetch_gas_price(self, oracle_url: str) -> Wei | None:
+        try:
+            response = requests.get(oracle_url)
+            response.raise_for_status()
+            data: dict = response.json()
+
+            return self._parse_gas_price_oracle_response(data)
+        except Exception:
             return None
 
-        blockchain_name, _ = self.blockchain_id.split(":")
+    def preload_contracts(self) -> None:
+        self._load_contracts_cache()
 
-        default_gas_price = self.w3.to_wei(
-            DEFAULT_GAS_PRICE_GWEI[blockchain_name], "gwei"
-        )
+        contracts = [
+            contract
+            for contract in self.abi.keys()
+            if contract != "Hub" and contract not in self.contracts
+        ]
+        if not contracts:
+            return
 
-        def fetch_gas_price(oracle_url: str) -> Wei | None:
-            try:
-                response = requests.get(oracle_url)
-                response.raise_for_status()
-                data: dict = response.json()
+        addresses, block = self._resolve_contract_addresses(contracts)
+        with self.contracts._lock:
+            for contract, address in addresses.items():
+                self._set_contract_instance(contract, address, block)
 
-                if "result" in data:
-                    return int(data["result"], 16)
-                elif "average" in data:
-                    return self.w3.to_wei(data["average"], "gwei")
-                else:
-                    return None
-            except Exception:
-                return None
+            self._save_cached_contract_addresses()
 
-        oracles = self.gas_price_oracle
-        if oracles is not None:
-            if isinstance(oracles, str):
-                oracles = [oracles]
+    def sync_contract_addresses(self) -> None:
+        """
+        Applies contract updates announced by the Hub since the cached addresses
+        were resolved. Cached addresses are dropped if Hub events can't be fetched.
+        """
+        self._load_contracts_cache(sync=False)
 
-            for oracle_url in oracles:
-                gas_price = fetch_gas_price(oracle_url)
-                if gas_price is not None:
-                    return gas_price
+        cache_key = self._get_contracts_cache_key()
+        with self.contracts._lock:
+            cached_blocks = {
+                contract: entry["block"]
+                for contract, entry in self._contracts_cache.items()
+            }
 
-        return default_gas_price
+        if not cached_blocks:
+            return
 
-    def _init_contracts(self):
-        for contract in self.abi.keys():
-            if contract == "Hub":
+        from_block = min(cached_blocks.values())
+        try:
+            latest_block = self.w3.eth.block_number
+            if latest_block < from_block:
+                raise ValueError("Chain is behind the cached contract addresses.")
+
+            logs = self._get_hub_logs(from_block + 1, latest_block)
+        except Exception:
+            # Failure can be transient, so the shared cache file is kept as is
+            self._invalidate_contract_instances(list(cached_blocks), persist=False)
+            return
+
+        hub = self.contracts["Hub"]
+        event_topics = {
+            event_abi_to_log_topic(event_abi): event_abi["name"]
+            for event_abi in self.abi["Hub"]
+            if event_abi["type"] == "event" and event_abi["name"] in self.HUB_EVENTS
+        }
+
+        updates = {}
+        for log in logs:
+            event_name = event_topics.get(bytes(log["topics"][0]))
+            if event_name is None:
                 continue
 
-            self._update_contract_instance(contract)
+            event = hub.events[event_name]().process_log(log)
+            contract = event.args.contractName
+            if (
+                contract not in cached_blocks
+                or log["blockNumber"] <= cached_blocks[contract]
+                or contract.endswith("AssetStorage") != self.HUB_EVENTS[event_name]
+            ):
+                continue
+
+            updates[contract] = (event.args.newContractAddress, log["blockNumber"])
+
+        with self.contracts._lock:
+            for contract, (address, block) in updates.items():
+                # Contracts invalidated or resolved again meanwhile are skipped
+                entry = self._contracts_cache.get(contract)
+                if entry is not None and entry["block"] < block:
+                    self._set_contract_instance(contract, address, block)
+
+            for contract in cached_blocks:
+                if (entry := self._contracts_cache.get(contract)) is not None:
+                    entry["block"] = max(entry["block"], latest_block)
+
+            self._save_cached_contract_addresses()
+            self._contracts_synced_at[cache_key] = time.time()
+
+    def _load_contracts_cache(self, sync: bool = True) -> None:
+        """
+        Loads the cached contract addresses on first contract resolution. They're
+        synced with Hub events unless this process already did that for the same
+        chain within the cache TTL.
+        """
+        if self._is_contracts_cache_loaded:
+            return
+
+        cache_key = self._get_contracts_cache_key()
+        cached_entries = self._load_cached_contract_addresses()
+
+        with self.contracts._lock:
+            if self._is_contracts_cache_loaded:
+                return
+            self._is_contracts_cache_loaded = True
+
+            for contract, entry in cached_entries.items():
+                if contract not in self.contracts:
+                    self._set_contract_instance(
+                        contract, entry["address"], entry["block"], entry["updated_at"]
+                    )
+
+            synced_at = self._contracts_synced_at.get(cache_key)
+            is_sync_needed = (
+                sync
+                and bool(self._contracts_cache)
+                and (
+                    synced_at is None
+                    or time.time() - synced_at >= self.contracts_cache_ttl
+                )
+            )
+
+        # Hub events are fetched outside of the lock, contracts used meanwhile
+        # are retried through the Hub if their cached address is outdated
+        if is_sync_needed:
+            self.sync_contract_addresses()
+
+    def _get_hub_logs(self, from_block: int, to_block: int) -> list[LogReceipt]:
+        topics = [
+            Web3.to_hex(event_abi_to_log_topic(event_abi))
+            for event_abi in self.abi["Hub"]
+            if event_abi["type"] == "event" and event_abi["name"] in self.HUB_EVENTS
+        ]
+
+        with self._isolated_batch():
+            requests = [
+                self.make_json_rpc_request(
+                    "get_logs",
+                    {
+                        "filter_params": {
+                            "address": self._get_hub_address(),
+                            "fromBlock": start_block,
+                            "toBlock": min(
+                                start_block + self.HUB_LOGS_BLOCK_RANGE - 1, to_block
+                            ),
+                            "topics": [topics],
+                        }
+                    },
+                )
+                for start_block in range(
+                    from_block, to_block + 1, self.HUB_LOGS_BLOCK_RANGE
+                )
+            ]
+
+        return [log for request in requests for log in request.result()]
 
     def _update_contract_instance(self, contract: str) -> bool:
+        addresses, block = self._resolve_contract_addresses([contract])
+        if (address := addresses.get(contract)) is None:
+            return False
+
+        with self.contracts._lock:
+            self._set_contract_instance(contract, address, block)
+            self._save_cached_contract_addresses()
+
+        return True
+
+    def _set_contract_instance(
+        self,
+        contract: str,
+        address: Address,
+        block: int,
+        updated_at: float | None = None,
+    ) -> None:
+        self._contracts_cache[contract] = {
+            "address": address,
+            "block": block,
+            "updated_at": updated_at or time.time(),
+        }
+        self.contracts[contract] = self.w3.eth.contract(
+            address=address,
+            abi=self.abi[contract],
+            decode_tuples=True,
+        )
+
+    def _invalidate_contract_instances(
+        self, contracts: list[str], persist: bool = True
+    ) -> None:
+        with self.contracts._lock:
+            for contract in contracts:
+                self.contracts.pop(contract, None)
+                self._contracts_cache.pop(contract, None)
+
+            if persist:
+                self._save_cached_contract_addresses(invalidated=contracts)
+
+    def _resolve_contract_addresses(
+        self, contracts: list[str]
+    ) -> tuple[dict[str, Address], int]:
+        with self._isolated_batch():
+            block_number = self.make_json_rpc_request("get_block_number")
+            registration_calls = {
+                contract: (
+                    self.call_function("Hub", "isContract", {"contractName": contract}),
+                    self.call_function(
+                        "Hub", "isAssetStorage", {"assetStorageName": contract}
+                    ),
+                )
+                for contract in contracts
+            }
+
+        with self._isolated_batch():
+            address_calls = {
+                contract: (
+                    self.call_function(
+                        "Hub", "getAssetStorageAddress", {"assetStorageName": contract}
+                    )
+                    if contract.endswith("AssetStorage")
+                    else self.call_function(
+                        "Hub", "getContractAddress", {"contractName": contract}
+                    )
+                )
+                for contract, (is_contract, is_asset_storage) in (
+                    registration_calls.items()
+                )
+                if is_contract.result() or is_asset_storage.result()
+            }
+
+        return (
+            {contract: call.result() for contract, call in address_calls.items()},
+            block_number.result(),
+        )
+
+    @contextmanager
+    def _isolated_batch(self) -> Iterator[CallBatch]:
+        # Contracts can be resolved while the user's batch is being built, so
+        # the Hub calls are collected separately from the user's deferred calls
+        outer_batch = self.current_batch
+
+        batch = CallBatch(self)
+        self._batch_state.batch = batch
+        try:
+            with self.deferred():
+                yield batch
+        finally:
+            self._batch_state.batch = outer_batch
+
+        batch.flush()
+
+    def _get_contracts_cache_key(self) -> str:
+        return f"{self.environment}/{self.blockchain_id}/{self._get_hub_address()}"
+
+    def _read_contracts_cache(self) -> dict[str, dict[str, Any]]:
+        try:
+            with open(self.contracts_cache_path, "r") as cache_file:
+                cache = json.load(cache_file)
+        except (OSError, ValueError):
+            return {}
+
+        return cache if isinstance(cache, dict) else {}
+
+    def _load_cached_contract_addresses(self) -> dict[str, dict[str, Any]]:
+        if self.contracts_cache_path is None:
+            return {}
+
+        expires_before = time.time() - self.contracts_cache_ttl
+
+        cache = self._read_contracts_cache()
+
+        entries = {}
+        for contract, entry in cache.get(self._get_contracts_cache_key(), {}).items():
+            try:
+                if contract in self.abi and entry["updated_at"] > expires_before:
+                    entries[contract] = {
+                        "address": entry["address"],
+                        "block": int(entry["block"]),
+                        "updated_at": entry["updated_at"],
+                    }
+            except (KeyError, TypeError, ValueError):
+                continue
+
+        return entries
+
+    def _save_cached_contract_addresses(self, invalidated: list[str] = []) -> None:
+        if self.contracts_cache_path is None:
+            return
+
+        cache = self._read_contracts_cache()
+        cache_key = self._get_contracts_cache_key()
+
+        entries = {
+            contract: entry
+            for contract, entry in cache.get(cache_key, {}).items()
+            if contract not in invalidated
+        }
+        for contract, entry in self._contracts_cache.items():
+            cached_entry = entries.get(contract)
+            # Other processes share the file and could have resolved a newer address
+            if (
+                not isinstance(cached_entry, dict)
+                or cached_entry.get("block", -1) <= entry["block"]
+            ):
+                entries[contract] = entry
+        cache[cache_key] = entries
+
+        temporary_path = self.contracts_cache_path.with_suffix(
+            f".{os.getpid()}.{threading.get_ident()}.tmp"
+        )
+        try:
+            self.contracts_cache_path.parent.mkdir(parents=True, exist_ok=True)
+            with open(temporary_path, "w") as cache_file:
+                json.dump(cache, cache_file, indent=2)
+            os.replace(temporary_path, self.contracts_cache_path)
+        except OSError:
+            # Cache is an optimization, read-only file systems shouldn't break calls
+            pass
+
+
+class AsyncBlockchainProvider(BaseBlockchainProvider):
+    """
+    Asynchronous counterpart of BlockchainProvider. Contract addresses are
+    resolved through the Hub once per provider and aren't cached on disk, and
+    contract calls aren't batched through JSON-RPC batches or Multicall3. Calls
+    of a batch are sent as concurrent requests instead.
+    """
+
+    nonce_manager_class = AsyncNonceManager
+    pending_transaction_class = AsyncPendingTransaction
+
+    def __init__(
+        self,
+        environment: Environment,
+        blockchain_id: str,
+        rpc_uri: URI | None = None,
+        private_key: DataHexStr | None = None,
+        gas_price: Wei | None = None,
+        verify: bool = True,
+    ):
+        self._requested_blockchain_id = blockchain_id
+        super().__init__(environment, blockchain_id, rpc_uri, gas_price)
+
+        self.verify = verify
+        self.w3 = AsyncWeb3(AsyncWeb3.AsyncHTTPProvider(self.rpc_uri))
+
+        self.gas_price_oracle = None
+        self.contracts: dict[str, AsyncContract] = {}
+
+        self._session: aiohttp.ClientSession | None = None
+
+        self._initialized = False
+        self._init_lock = asyncio.Lock()
+        self._contracts_lock = asyncio.Lock()
+
+        if (
+            private_key is not None
+            or (private_key_env := os.environ.get("PRIVATE_KEY", None)) is not None
+        ):
+            self.set_account(private_key or private_key_env)
+
+    async def initialize(self) -> None:
+        if self._initialized:
+            return
+
+        async with self._init_lock:
+            if self._initialized:
+                return
+
+            if self.blockchain_id is None:
+                self._set_blockchain_id(
+                    self._requested_blockchain_id, await self.w3.eth.chain_id
+                )
+
+            self._session = aiohttp.ClientSession(
+                connector=(
+                    aiohttp.TCPConnector()
+                    if self.verify
+                    else aiohttp.TCPConnector(ssl=False)
+                )
+            )
+            await self.w3.provider.cache_async_session(self._session)
+
+            self.gas_price_oracle = self._get_gas_price_oracle()
+            self.contracts["Hub"] = self.w3.eth.contract(
+                address=self._get_hub_address(),
+                abi=self.abi["Hub"],
+                decode_tuples=True,
+            )
+
+            self._initialized = True
+
+    async def make_json_rpc_request(
+        self, endpoint: str, args: dict[str, Any] = {}
+    ) -> Any:
+        await self.initialize()
+
+        web3_method = getattr(self.w3.eth, endpoint)
+
+        if callable(web3_method):
+            return await web3_method(**args)
+        else:
+            return await web3_method
+
+    def _run(self, steps: Steps[T]) -> T:
+        return async_run_steps(steps)
+
+    async def get_contract(self, contract_name: str) -> AsyncContract:
+        await self.initialize()
+
+        if contract_name not in self.contracts:
+            async with self._contracts_lock:
+                if contract_name not in self.contracts:
+                    await self._update_contract_instance(contract_name)
+
+        return self.contracts[contract_name]
+
+    async def close(self) -> None:
+        if self._session is not None:
+            await self._session.close()
+            self._session = None
+            self._initialized = False
+
+    async def _fetch_gas_price(self, oracle_url: str) -> Wei | None:
+        try:
+            async with self._session.get(oracle_url) as response:
+                response.raise_for_status()
+                data: dict = await response.json(content_type=None)
+
+            return self._parse_gas_price_oracle_response(data)
+        except Exception:
+            return None
+
+    async def _update_contract_instance(self, contract: str) -> bool:
+        hub = self.contracts["Hub"]
+
         if (
-            self.contracts["Hub"].functions.isContract(contractName=contract).call()
-            or self.contracts["Hub"]
-            .functions.isAssetStorage(assetStorageName=contract)
-            .call()
+            await hub.functions.isContract(contractName=contract).call()
+            or await hub.functions.isAssetStorage(assetStorageName=contract).call()
         ):
             self.contracts[contract] = self.w3.eth.contract(
                 address=(
-                    self.contracts["Hub"].functions.getContractAddress(contract).call()
+                    await hub.functions.getContractAddress(contract).call()
                     if not contract.endswith("AssetStorage")
-                    else self.contracts["Hub"]
-                    .functions.getAssetStorageAddress(contract)
-                    .call()
+                    else await hub.functions.getAssetStorageAddress(contract).call()
                 ),
                 abi=self.abi[contract],
                 decode_tuples=True,
@@ -274,38 +1172,10 @@ class BlockchainProvider:
             return True
         return False
 
-    def _check_contract_status(self, contract: str) -> bool:
-        try:
-            return self.call_function(contract, "status")
-        except Exception:
-            return False
-
-    def _generate_output_named_tuples(self) -> dict[str, dict[str, Type[tuple]]]:
-        def generate_output_namedtuple(function_abi: ABIFunction) -> Type[tuple] | None:
-            output_names = [output["name"] for output in function_abi["outputs"]]
-            if all(name != "" for name in output_names):
-                return namedtuple(f"{function_abi['name']}Result", output_names)
-            return None
-
-        output_named_tuples = {}
-        for contract_name, contract_abi in self.abi.items():
-            output_named_tuples[contract_name] = {}
-            for item in contract_abi:
-                if (item["type"] != "function") or not item["outputs"]:
-                    continue
-                elif item["name"] in output_named_tuples[contract_name]:
-                    continue
-                named_tuple = generate_output_namedtuple(item)
-                if named_tuple is not None:
-                    output_named_tuples[contract_name][item["name"]] = named_tuple
-
-        return output_named_tuples
-
-    def _load_abi(self) -> ABI:
-        abi = {}
-
-        for contract_metadata in self.CONTRACTS_METADATA_DIR.glob("*.json"):
-            with open(contract_metadata, "r") as metadata_json:
-                abi[contract_metadata.stem] = json.load(metadata_json)
-
-        return abi
+    def _invalidate_contract_instances(
+        self, contracts: list[str], persist: bool = True
+    ) -> None:
+        # Addresses are only kept in memory, so there is nothing to persist
+        for contract in contracts:
+            if contract != "Hub":
+                self.contracts.pop(contract, None)
@@ -0,0 +1,83 @@
+# Licensed to the Apache Software Foundation (ASF) under one
+# or more contributor license agreements.  See the NOTICE file
+# distributed with this work for additional information
+# regarding copyright ownership.  The ASF licenses this file
+# to you under the Apache License, Version 2.0 (the
+# "License"); you may not use this file except in compliance
+# with the License.  You may obtain a copy of the License at
+
+#   http://www.apache.org/licenses/LICENSE-2.0
+
+# Unless required by applicable law or agreed to in writing,
+# software distributed under the License is distributed on an
+# "AS IS" BASIS, WITHOUT WARRANTIES OR CONDITIONS OF ANY
+# KIND, either express or implied.  See the License for the
+# specific language governing permissions and limitations
+# under the License.
+
+import itertools
+from typing import Any
+
+from web3._utils.abi import (
+    get_abi_output_types,
+    map_abi_data,
+    named_tree,
+    recursive_dict_to_namedtuple,
+)
+from web3._utils.normalizers import BASE_RETURN_NORMALIZERS
+from web3.contract.contract import ContractFunction
+from web3.types import ABI
+
+MULTICALL3_ABI: ABI = [
+    {
+        "inputs": [
+            {
+                "components": [
+                    {"internalType": "address", "name": "target", "type": "address"},
+                    {"internalType": "bool", "name": "allowFailure", "type": "bool"},
+                    {"internalType": "bytes", "name": "callData", "type": "bytes"},
+                ],
+                "internalType": "struct Multicall3.Call3[]",
+                "name": "calls",
+                "type": "tuple[]",
+            }
+        ],
+        "name": "aggregate3",
+        "outputs": [
+            {
+                "components": [
+                    {"internalType": "bool", "name": "success", "type": "bool"},
+                    {"internalType": "bytes", "name": "returnData", "type": "bytes"},
+                ],
+                "internalType": "struct Multicall3.Result[]",
+                "name": "returnData",
+                "type": "tuple[]",
+            }
+        ],
+        "stateMutability": "payable",
+        "type": "function",
+    }
+]
+
+
+def decode_call_output(contract_function: ContractFunction, return_data: bytes) -> Any:
+    output_types = get_abi_output_types(contract_function.abi)
+    output_data = contract_function.w3.codec.decode(output_types, return_data)
+
+    normalized_data = map_abi_data(
+        itertools.chain(
+            BASE_RETURN_NORMALIZERS, contract_function._return_data_normalizers
+        ),
+        output_types,
+        output_data,
+    )
+
+    if contract_function.decode_tuples:
+        normalized_data = recursive_dict_to_namedtuple(
+            named_tree(contract_function.abi["outputs"], normalized_data)
+        )
+
+    if len(normalized_data) == 1:
+        return normalized_data[0]
+
+    return normalized_data
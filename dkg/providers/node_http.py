@@ -15,19 +15,60 @@
 # specific language governing permissions and limitations
 # under the License.
 
+import asyncio
 from typing import Any
 
+import aiohttp
 import requests
-from dkg.dataclasses import HTTPRequestMethod, NodeResponseDict
+from dkg.dataclasses import HTTPRequestMethod, NodeResponseDict, PollingProfile
 from dkg.exceptions import HTTPRequestMethodNotSupported, NodeRequestError
 from dkg.types import URI
+from dkg.utils.polling import (
+    AsyncOperationMultiplexer,
+    OperationMultiplexer,
+    OperationPoller,
+)
+from requests.adapters import HTTPAdapter
 from requests.exceptions import HTTPError, ConnectionError, Timeout, RequestException
 
 
 class NodeHTTPProvider:
-    def __init__(self, endpoint_uri: URI | str, auth_token: str | None = None):
+    def __init__(
+        self,
+        endpoint_uri: URI | str,
+        auth_token: str | None = None,
+        pool_connections: int = 10,
+        pool_maxsize: int = 10,
+        keep_alive: bool = True,
+        timeout: float | tuple[float, float] | None = None,
+        polling_profiles: dict[str, PollingProfile] | None = None,
+    ):
         self.endpoint_uri = URI(endpoint_uri)
         self.auth_token = auth_token
+        self.pool_connections = pool_connections
+        self.pool_maxsize = pool_maxsize
+        self.keep_alive = keep_alive
+        self.timeout = timeout
+        self.poller = OperationPoller(polling_profiles)
+
+        self._session: requests.Session | None = None
+        self._multiplexer: OperationMultiplexer | None = None
+
+    @property
+    def session(self) -> requests.Session:
+        if self._session is None:
+            self._session = self._create_session()
+
+        return self._session
+
+    @property
+    def multiplexer(self) -> OperationMultiplexer:
+        if self._multiplexer is None:
+            self._multiplexer = OperationMultiplexer(
+                self.poller, max_workers=self.pool_maxsize
+            )
+
+        return self._multiplexer
 
     def make_request(
         self,
@@ -43,9 +84,13 @@ class NodeHTTPProvider:
 
         try:
             if method == HTTPRequestMethod.GET:
-                response = requests.get(url, params=params, headers=headers)
+                response = self.session.get(
+                    url, params=params, headers=headers, timeout=self.timeout
+                )
             elif method == HTTPRequestMethod.POST:
-                response = requests.post(url, json=data, headers=headers)
+                response = self.session.post(
+                    url, json=data, headers=headers, timeout=self.timeout
+                )
             else:
                 raise HTTPRequestMethodNotSupported(
                     f"{method.name} method isn't supported"
@@ -60,3 +105,142 @@ class NodeHTTPProvider:
 
         except (HTTPError, ConnectionError, Timeout, RequestException) as err:
             raise NodeRequestError(f"Request failed: {err}")
+
+    def close(self) -> None:
+        if self._multiplexer is not None:
+            self._multiplexer.close()
+            self._multiplexer = None
+
+        if self._session is not None:
+            self._session.close()
+            self._session = None
+
+    def __enter__(self) -> "NodeHTTPProvider":
+        return self
+
+    def __exit__(self, *exc_info) -> None:
+        self.close()
+
+    def _create_session(self) -> requests.Session:
+        session = requests.Session()
+
+        adapter = HTTPAdapter(
+            pool_connections=self.pool_connections,
+            pool_maxsize=self.pool_maxsize,
+        )
+        session.mount("http://", adapter)
+        session.mount("https://", adapter)
+
+        if not self.keep_alive:
+            session.headers["Connection"] = "close"
+
+        return session
+
+
+class AsyncNodeHTTPProvider:
+    def __init__(
+        self,
+        endpoint_uri: URI | str,
+        auth_token: str | None = None,
+        pool_connections: int = 10,
+        pool_maxsize: int = 10,
+        keep_alive: bool = True,
+        timeout: float | tuple[float, float] | None = None,
+        polling_profiles: dict[str, PollingProfile] | None = None,
+    ):
+        self.endpoint_uri = URI(endpoint_uri)
+        self.auth_token = auth_token
+        self.pool_connections = pool_connections
+        self.pool_maxsize = pool_maxsize
+        self.keep_alive = keep_alive
+        self.timeout = timeout
+        self.poller = OperationPoller(polling_profiles)
+
+        self._session: aiohttp.ClientSession | None = None
+        self._multiplexer: AsyncOperationMultiplexer | None = None
+
+    @property
+    def session(self) -> aiohttp.ClientSession:
+        if self._session is None or self._session.closed:
+            self._session = self._create_session()
+
+        return self._session
+
+    @property
+    def multiplexer(self) -> AsyncOperationMultiplexer:
+        if self._multiplexer is None:
+            self._multiplexer = AsyncOperationMultiplexer(self.poller)
+
+        return self._multiplexer
+
+    async def make_request(
+        self,
+        method: HTTPRequestMethod,
+        path: str,
+        params: dict[str, Any] = {},
+        data: dict[str, Any] = {},
+    ) -> NodeResponseDict:
+        url = f"{self.endpoint_uri}/{path}"
+        headers = (
+            {"Authorization": f"Bearer {self.auth_token}"} if self.auth_token else {}
+        )
+
+        try:
+            if method == HTTPRequestMethod.GET:
+                request = self.session.get(
+                    url, params=self._format_params(params), headers=headers
+                )
+            elif method == HTTPRequestMethod.POST:
+                request = self.session.post(url, json=data, headers=headers)
+            else:
+                raise HTTPRequestMethodNotSupported(
+                    f"{method.name} method isn't supported"
+                )
+
+            async with request as response:
+                response.raise_for_status()
+
+                try:
+                    return NodeResponseDict(await response.json(content_type=None))
+                except ValueError as err:
+                    raise NodeRequestError(f"JSON decoding failed: {err}")
+
+        except (aiohttp.ClientError, asyncio.TimeoutError) as err:
+            raise NodeRequestError(f"Request failed: {err}")
+
+    async def close(self) -> None:
+        if self._multiplexer is not None:
+            await self._multiplexer.close()
+            self._multiplexer = None
+
+        if self._session is not None:
+            await self._session.close()
+            self._session = None
+
+    async def __aenter__(self) -> "AsyncNodeHTTPProvider":
+        return self
+
+    async def __aexit__(self, *exc_info) -> None:
+        await self.close()
+
+    def _create_session(self) -> aiohttp.ClientSession:
+        connector = aiohttp.TCPConnector(
+            limit=self.pool_connections * self.pool_maxsize,
+            limit_per_host=self.pool_maxsize,
+            force_close=not self.keep_alive,
+        )
+
+        match self.timeout:
+            case None:
+                timeout = aiohttp.ClientTimeout()
+            case (connect, read):
+                timeout = aiohttp.ClientTimeout(sock_connect=connect, sock_read=read)
+            case _:
+                timeout = aiohttp.ClientTimeout(total=self.timeout)
+
+        return aiohttp.ClientSession(connector=connector, timeout=timeout)
+
+    @staticmethod
+    def _format_params(params: dict[str, Any]) -> dict[str, str]:
+        # aiohttp only accepts str/int/float query values, requests stringifies
+        return {key: str(value) for key, value in params.items() if value is not None}
@@ -0,0 +1,202 @@
+# Licensed to the Apache Software Foundation (ASF) under one
+# or more contributor license agreements.  See the NOTICE file
+# distributed with this work for additional information
+# regarding copyright ownership.  The ASF licenses this file
+# to you under the Apache License, Version 2.0 (the
+# "License"); you may not use this file except in compliance
+# with the License.  You may obtain a copy of the License at
+
+#   http://www.apache.org/licenses/LICENSE-2.0
+
+# Unless required by applicable law or agreed to in writing,
+# software distributed under the License is distributed on an
+# "AS IS" BASIS, WITHOUT WARRANTIES OR CONDITIONS OF ANY
+# KIND, either express or implied.  See the License for the
+# specific language governing permissions and limitations
+# under the License.
+
+import asyncio
+import threading
+import time
+from typing import Any
+
+from dkg.exceptions import TransactionDropped, TransactionReplaced
+from dkg.types import Address
+from dkg.utils.steps import Steps, async_run_steps, run_steps, steps
+from hexbytes import HexBytes
+from web3 import AsyncWeb3, Web3
+from web3.exceptions import TimeExhausted, TransactionNotFound
+from web3.types import TxReceipt
+
+NONCE_ERRORS = (
+    "nonce too low",
+    "already known",
+    "replacement transaction underpriced",
+)
+
+
+class NonceManager:
+    """
+    Hands out sequential nonces for a single account without querying the node
+    for every transaction, so that many transactions can be in flight at once.
+    The local counter is resynchronized with the node's pending transaction
+    count whenever sending a transaction fails.
+
+    A nonce is held from `acquire` until `release`, which has to be called
+    whether the transaction was sent or not.
+    """
+
+    def __init__(self, w3: Web3, address: Address):
+        self.w3 = w3
+        self.address = address
+
+        self._lock = threading.Lock()
+        self._next_nonce: int | None = None
+
+    def _run(self, steps: Steps) -> Any:
+        return run_steps(steps)
+
+    @steps
+    def acquire(self) -> Steps[int]:
+        yield self._lock.acquire()
+
+        if self._next_nonce is None:
+            try:
+                self._next_nonce = yield self.w3.eth.get_transaction_count(
+                    self.address, "pending"
+                )
+            except BaseException:
+                self._lock.release()
+                raise
+
+        return self._next_nonce
+
+    def release(self, nonce: int, sent: bool = True) -> None:
+        self._next_nonce = nonce + 1 if sent else None
+        self._lock.release()
+
+    @steps
+    def reset(self) -> Steps[None]:
+        yield self._lock.acquire()
+        self._next_nonce = None
+        self._lock.release()
+
+    @staticmethod
+    def is_nonce_error(err: Exception) -> bool:
+        return any(msg in str(err).lower() for msg in NONCE_ERRORS)
+
+
+class AsyncNonceManager(NonceManager):
+    def __init__(self, w3: AsyncWeb3, address: Address):
+        super().__init__(w3, address)
+        self._lock = asyncio.Lock()
+
+    def _run(self, steps: Steps) -> Any:
+        return async_run_steps(steps)
+
+
+class PendingTransaction:
+    """
+    Handle for a signed transaction that was sent to the network, but whose
+    receipt hasn't been awaited yet.
+    """
+
+    RECOVERY_INTERVAL = 30
+
+    def __init__(
+        self,
+        w3: Web3,
+        sender: Address,
+        tx_hash: HexBytes,
+        nonce: int,
+        raw_transaction: HexBytes,
+        receipt_timeout: float = 120,
+    ):
+        self.w3 = w3
+        self.sender = sender
+        self.tx_hash = tx_hash
+        self.nonce = nonce
+        self.raw_transaction = raw_transaction
+        self.receipt_timeout = receipt_timeout
+
+        self._receipt: TxReceipt | None = None
+
+    def _run(self, steps: Steps) -> Any:
+        return run_steps(steps)
+
+    @steps
+    def done(self) -> Steps[bool]:
+        if self._receipt is not None:
+            return True
+
+        try:
+            self._receipt = yield self.w3.eth.get_transaction_receipt(self.tx_hash)
+        except TransactionNotFound:
+            return False
+
+        return True
+
+    @steps
+    def result(self, timeout: float | None = None) -> Steps[TxReceipt]:
+        """
+        Waits for the transaction receipt for at most `timeout` seconds,
+        defaulting to `receipt_timeout`, and raises TimeExhausted after that.
+        Every `RECOVERY_INTERVAL` seconds without a receipt, the transaction is
+        checked for having been dropped or replaced, and rebroadcast if dropped.
+        """
+        timeout = self.receipt_timeout if timeout is None else timeout
+        deadline = time.monotonic() + timeout
+
+        while self._receipt is None:
+            wait_time = min(self.RECOVERY_INTERVAL, max(deadline - time.monotonic(), 0))
+
+            try:
+                self._receipt = yield self.w3.eth.wait_for_transaction_receipt(
+                    self.tx_hash, timeout=wait_time
+                )
+            except TimeExhausted:
+                if time.monotonic() >= deadline:
+                    raise TimeExhausted(
+                        f"Transaction {self.tx_hash.hex()} with nonce "
+                        f"{self.nonce} is not in the chain after {timeout} "
+                        "seconds."
+                    )
+                yield from self._recover()
+
+        return self._receipt
+
+    def _recover(self) -> Steps[None]:
+        try:
+            yield self.w3.eth.get_transaction(self.tx_hash)
+            # Transaction is still known to the node, keep waiting for it until
+            # the deadline
+            return
+        except TransactionNotFound:
+            pass
+
+        if (
+            yield self.w3.eth.get_transaction_count(self.sender, "latest")
+        ) > self.nonce:
+            if (yield self.done()):
+                return
+
+            raise TransactionReplaced(
+                f"Transaction {self.tx_hash.hex()} with nonce {self.nonce} "
+                "has been replaced by another transaction."
+            )
+
+        try:
+            yield self.w3.eth.send_raw_transaction(self.raw_transaction)
+        except Exception as err:
+            if "already known" in str(err).lower():
+                return
+
+            raise TransactionDropped(
+                f"Transaction {self.tx_hash.hex()} with nonce {self.nonce} "
+                f"has been dropped and couldn't be rebroadcast: {err}"
+            ) from err
+
+
+class AsyncPendingTransaction(PendingTransaction):
+    def _run(self, steps: Steps) -> Any:
+        return async_run_steps(steps)
@@ -55,6 +55,8 @@ class ContractCall(ContractInteraction):
 class BlockchainRequest:
     chain_id = JSONRPCRequest("chain_id")
     get_block = JSONRPCRequest("get_block", args={"block_identifier": str | int})
+    get_block_number = JSONRPCRequest("get_block_number")
+    get_logs = JSONRPCRequest("get_logs", args={"filter_params": dict})
 
     get_contract_address = ContractCall(
         contract="Hub",
@@ -0,0 +1,317 @@
+# Licensed to the Apache Software Foundation (ASF) under one
+# or more contributor license agreements.  See the NOTICE file
+# distributed with this work for additional information
+# regarding copyright ownership.  The ASF licenses this file
+# to you under the Apache License, Version 2.0 (the
+# "License"); you may not use this file except in compliance
+# with the License.  You may obtain a copy of the License at
+
+#   http://www.apache.org/licenses/LICENSE-2.0
+
+# Unless required by applicable law or agreed to in writing,
+# software distributed under the License is distributed on an
+# "AS IS" BASIS, WITHOUT WARRANTIES OR CONDITIONS OF ANY
+# KIND, either express or implied.  See the License for the
+# specific language governing permissions and limitations
+# under the License.
+
+import gzip
+import os
+import sys
+import threading
+import time
+from collections import OrderedDict
+from pathlib import Path
+from typing import Any, Generic, Hashable, TypeVar
+
+from dkg.types import HexStr, NQuads
+
+K = TypeVar("K", bound=Hashable)
+V = TypeVar("V")
+
+
+def get_cache_dir() -> Path:
+    if (cache_dir := os.environ.get("DKG_CACHE_DIR")) is not None:
+        return Path(cache_dir)
+
+    if sys.platform == "win32":
+        base_dir = os.environ.get("LOCALAPPDATA") or Path.home() / "AppData/Local"
+        return Path(base_dir) / "dkg" / "Cache"
+    elif sys.platform == "darwin":
+        return Path.home() / "Library/Caches/dkg"
+
+    return Path(os.environ.get("XDG_CACHE_HOME") or Path.home() / ".cache") / "dkg"
+
+
+class LRUCache(Generic[K, V]):
+    def __init__(self, max_size: int):
+        self.max_size = max_size
+
+        self._items: OrderedDict[K, V] = OrderedDict()
+        self._lock = threading.Lock()
+
+    def __contains__(self, key: K) -> bool:
+        return key in self._items
+
+    def __len__(self) -> int:
+        return len(self._items)
+
+    def get(self, key: K, default: V | None = None) -> V | None:
+        with self._lock:
+            if key not in self._items:
+                return default
+
+            self._items.move_to_end(key)
+            return self._items[key]
+
+    def set(self, key: K, value: V) -> None:
+        with self._lock:
+            self._items[key] = value
+            self._items.move_to_end(key)
+
+            while len(self._items) > self.max_size:
+                self._items.popitem(last=False)
+
+    def pop(self, key: K, default: V | None = None) -> V | None:
+        with self._lock:
+            return self._items.pop(key, default)
+
+    def clear(self) -> None:
+        with self._lock:
+            self._items.clear()
+
+
+class TokenStateCache:
+    """
+    Short-lived cache of knowledge asset states read from the chain, such as
+    assertion IDs or the unfinalized state of a token. Entries expire after
+    `ttl` seconds. Invalidating a token after its state changed in a block also
+    rejects values read at earlier blocks, so lagging RPC nodes can't put the
+    previous state back into the cache.
+    """
+
+    def __init__(self, ttl: float = 6, max_size: int = 4096):
+        self.ttl = ttl
+        self.synced_block: int | None = None
+
+        self._entries: LRUCache[int, dict[str, tuple[float, Any]]] = LRUCache(
+            max_size
+        )
+        self._invalidations: LRUCache[int, tuple[float, int | None]] = LRUCache(
+            max_size
+        )
+        self._lock = threading.Lock()
+
+    def get(self, token_id: int, key: str) -> Any | None:
+        entries = self._entries.get(token_id)
+        if entries is None or key not in entries:
+            return None
+
+        expires_at, value = entries[key]
+
+        return value if time.monotonic() < expires_at else None
+
+    def set(
+        self, token_id: int, key: str, value: Any, block_number: int | None = None
+    ) -> None:
+        with self._lock:
+            if self._is_stale(token_id, block_number):
+                return
+
+            entries = dict(self._entries.get(token_id) or {})
+            entries[key] = (time.monotonic() + self.ttl, value)
+            self._entries.set(token_id, entries)
+
+    def invalidate(self, token_id: int, block_number: int | None = None) -> None:
+        with self._lock:
+            self._entries.pop(token_id)
+            self._invalidations.set(token_id, (time.monotonic(), block_number))
+
+    def clear(self) -> None:
+        with self._lock:
+            self._entries.clear()
+            self._invalidations.clear()
+
+    def _is_stale(self, token_id: int, block_number: int | None) -> bool:
+        if (invalidation := self._invalidations.get(token_id)) is None:
+            return False
+
+        invalidated_at, invalidated_block_number = invalidation
+        if block_number is not None and invalidated_block_number is not None:
+            return block_number < invalidated_block_number
+
+        # Without block numbers, values read shortly after a change can't be trusted
+        return time.monotonic() - invalidated_at < self.ttl
+
+
+class NQuadsCache:
+    """
+    Cache of N-Quads datasets keyed by content hashes. Entries are kept in a
+    bounded in-memory LRU and, if `cache_dir` is set, in files named after
+    their key, the oldest of which are pruned once `max_disk_entries` is
+    exceeded.
+    """
+
+    PRUNE_INTERVAL = 64
+
+    def __init__(
+        self,
+        max_size: int = 256,
+        cache_dir: Path | str | None = None,
+        max_disk_entries: int = 10_000,
+        compress: bool = False,
+    ):
+        self.max_disk_entries = max_disk_entries
+        self.cache_dir = Path(cache_dir) if cache_dir is not None else None
+        self.compress = compress
+
+        self._entries: LRUCache[str, tuple[str, ...]] = LRUCache(max_size)
+        self._disk_writes = 0
+        self._lock = threading.Lock()
+
+    @property
+    def file_suffix(self) -> str:
+        return ".nq.gz" if self.compress else ".nq"
+
+    def get(self, key: str) -> NQuads | None:
+        if (quads := self._entries.get(key)) is None:
+            quads = self._read_entry(key)
+            if quads is None:
+                return None
+            self._entries.set(key, quads)
+
+        # Callers sort assertions in place, the cached entry must stay intact
+        return list(quads)
+
+    def set(self, key: str, quads: NQuads) -> None:
+        quads = tuple(quads)
+        self._entries.set(key, quads)
+        self._write_entry(key, quads)
+
+    def clear(self) -> None:
+        self._entries.clear()
+
+        if self.cache_dir is not None:
+            for entry_path in self.cache_dir.glob(f"*{self.file_suffix}"):
+                entry_path.unlink(missing_ok=True)
+
+    def _get_entry_path(self, key: str) -> Path:
+        return self.cache_dir / f"{key}{self.file_suffix}"
+
+    def _open_entry(self, path: Path, mode: str):
+        if self.compress:
+            return gzip.open(path, f"{mode}t", encoding="utf-8")
+
+        return open(path, mode, encoding="utf-8")
+
+    def _read_entry(self, key: str) -> tuple[str, ...] | None:
+        if self.cache_dir is None:
+            return None
+
+        entry_path = self._get_entry_path(key)
+        try:
+            with self._open_entry(entry_path, "r") as entry_file:
+                quads = tuple(entry_file.read().splitlines())
+            # Modification time is used as the access time when pruning
+            os.utime(entry_path)
+        except (OSError, EOFError, UnicodeDecodeError):
+            return None
+
+        return quads or None
+
+    def _write_entry(self, key: str, quads: tuple[str, ...]) -> None:
+        if self.cache_dir is None:
+            return
+
+        entry_path = self._get_entry_path(key)
+        temporary_path = entry_path.with_suffix(
+            f".{os.getpid()}.{threading.get_ident()}.tmp"
+        )
+        try:
+            self.cache_dir.mkdir(parents=True, exist_ok=True)
+            with self._open_entry(temporary_path, "w") as entry_file:
+                entry_file.write("\n".join(quads))
+            os.replace(temporary_path, entry_path)
+        except OSError:
+            # Cache is an optimization, read-only file systems shouldn't break calls
+            return
+
+        with self._lock:
+            self._disk_writes += 1
+            should_prune = self._disk_writes % self.PRUNE_INTERVAL == 1
+
+        if should_prune:
+            self._prune()
+
+    def _prune(self) -> None:
+        try:
+            entries = []
+            for entry_path in self.cache_dir.glob(f"*{self.file_suffix}"):
+                entries.append((entry_path.stat().st_mtime, entry_path))
+        except OSError:
+            return
+
+        if len(entries) <= self.max_disk_entries:
+            return
+
+        entries.sort()
+        for _, entry_path in entries[: len(entries) - self.max_disk_entries]:
+            try:
+                entry_path.unlink(missing_ok=True)
+            except OSError:
+                pass
+
+
+class AssertionCache(NQuadsCache):
+    """
+    Cache of validated assertions keyed by their IDs. Assertion ID is the Merkle
+    root of the assertion, so entries never need to be invalidated.
+    """
+
+    def __init__(
+        self,
+        max_size: int = 1024,
+        cache_dir: Path | str | None = None,
+        max_disk_entries: int = 100_000,
+        compress: bool = True,
+    ):
+        super().__init__(max_size, cache_dir, max_disk_entries, compress)
+
+    def get(self, assertion_id: HexStr) -> NQuads | None:
+        return super().get(assertion_id.lower())
+
+    def set(self, assertion_id: HexStr, assertion: NQuads) -> None:
+        super().set(assertion_id.lower(), assertion)
+
+
+# Assertions are only cached once the cache is configured, or persistently if
+# DKG_ASSERTION_CACHE is set
+assertion_cache: AssertionCache | None = (
+    AssertionCache(cache_dir=get_cache_dir() / "assertions")
+    if os.environ.get("DKG_ASSERTION_CACHE", "").lower() in ("1", "true")
+    else None
+)
+
+
+def configure_assertion_cache(
+    max_size: int = 1024,
+    persist: bool = False,
+    cache_dir: Path | str | None = None,
+    max_disk_entries: int = 100_000,
+) -> AssertionCache:
+    global assertion_cache
+
+    if persist and cache_dir is None:
+        cache_dir = get_cache_dir() / "assertions"
+
+    assertion_cache = AssertionCache(
+        max_size=max_size,
+        cache_dir=cache_dir,
+        max_disk_entries=max_disk_entries,
+    )
+
+    return assertion_cache
+
+
+def get_assertion_cache() -> AssertionCache | None:
+    return assertion_cache
@@ -15,32 +15,26 @@
 # specific language governing permissions and limitations
 # under the License.
 
-import time
 from functools import wraps
 from typing import Any, Callable
 
-from dkg.exceptions import NodeRequestError
 
-
-def retry(
-    catch: Exception, max_retries: int, base_delay: int, backoff: float
-) -> Callable[[Callable], Callable]:
+def batchable(func: Callable | None = None, *, multicall: bool = True) -> Callable:
     def decorator(func: Callable) -> Callable:
         @wraps(func)
-        def wrapper(*args, **kwargs) -> Any:
-            _delay = base_delay
+        def wrapper(self, *args, **kwargs) -> Any:
+            with self._deferred(True, multicall):
+                return func(self, *args, **kwargs)
+
+        return wrapper
 
-            for _ in range(max_retries):
-                try:
-                    return func(*args, **kwargs)
-                except catch:
-                    time.sleep(_delay)
-                    _delay *= backoff
+    return decorator(func) if func is not None else decorator
 
-            raise NodeRequestError(
-                f"Failed executing {func.__name__} after {max_retries} retries."
-            )
 
-        return wrapper
+def unbatched(func: Callable) -> Callable:
+    @wraps(func)
+    def wrapper(self, *args, **kwargs) -> Any:
+        with self._deferred(False):
+            return func(self, *args, **kwargs)
 
-    return decorator
+    return wrapper
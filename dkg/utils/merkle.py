@@ -15,16 +15,38 @@
 # specific language governing permissions and limitations
 # under the License.
 
-import copy
+import bisect
 import hashlib
-from typing import Callable
-
-from dkg.exceptions import LeafNotInTree
+import heapq
+import itertools
+import tempfile
+from collections import Counter
+from concurrent.futures import ProcessPoolExecutor
+from contextlib import ExitStack
+from functools import cached_property
+from pathlib import Path
+from typing import Callable, Iterable, Iterator
+
+from dkg.exceptions import InvalidDataset, LeafNotInTree
 from dkg.types import HexStr
 from eth_abi.packed import encode_packed
 from hexbytes import HexBytes
 from web3 import Web3
 
+try:
+    # pysha3 binding is several times faster than the default eth-hash backend
+    from sha3 import keccak_256
+
+    def keccak256(data: bytes) -> bytes:
+        return keccak_256(data).digest()
+
+except ImportError:
+    from eth_hash.auto import keccak as keccak256
+
+HASH_SIZE = 32
+PARALLEL_HASHING_THRESHOLD = 100_000
+SORT_CHUNK_SIZE = 1_000_000
+
 
 def solidity_keccak256(data: HexStr) -> HexStr:
     bytes_hash: HexBytes = Web3.solidity_keccak(
@@ -39,7 +61,15 @@ def hash_assertion_with_indexes(
     leaves: list[str],
     hash_function: str | Callable[[str], HexStr] = solidity_keccak256,
     sort: bool = True,
+    max_workers: int | None = None,
 ) -> list[HexStr]:
+    if hash_function is solidity_keccak256:
+        hashed_leaves = hash_assertion_leaves(leaves, sort, max_workers)
+        return [
+            "0x" + hashed_leaves[i : i + HASH_SIZE].hex()
+            for i in range(0, len(hashed_leaves), HASH_SIZE)
+        ]
+
     if sort:
         leaves.sort()
 
@@ -57,6 +87,75 @@ def hash_assertion_with_indexes(
     )
 
 
+def hash_assertion_leaves(
+    leaves: list[str], sort: bool = True, max_workers: int | None = None
+) -> bytes:
+    """
+    Returns concatenated 32-byte hashes of the leaves with their indexes, i.e.
+    keccak256(keccak256(leaf) || uint256(index)). Large assertions can be hashed
+    in `max_workers` processes.
+    """
+    if sort:
+        leaves.sort()
+
+    if (
+        max_workers is None
+        or max_workers < 2
+        or len(leaves) < PARALLEL_HASHING_THRESHOLD
+    ):
+        return _hash_leaves_chunk(leaves, 0)
+
+    chunk_size = -(-len(leaves) // max_workers)
+    with ProcessPoolExecutor(max_workers=max_workers) as executor:
+        return b"".join(
+            executor.map(
+                _hash_leaves_chunk,
+                [leaves[i : i + chunk_size] for i in range(0, len(leaves), chunk_size)],
+                range(0, len(leaves), chunk_size),
+            )
+        )
+
+
+def _hash_leaves_chunk(leaves: list[str], start_index: int) -> bytes:
+    return b"".join(
+        keccak256(keccak256(leaf.encode("utf-8")) + index.to_bytes(32, "big"))
+        for index, leaf in enumerate(leaves, start_index)
+    )
+
+
+def build_merkle_levels(leaves: bytes, sort_pairs: bool = False) -> list[bytes]:
+    """
+    Builds Merkle Tree levels from the concatenated 32-byte leaves. Levels are
+    ordered from the leaves to the root, each one stored as a contiguous buffer.
+    """
+    levels = [bytes(leaves)]
+
+    while len(level := levels[-1]) > HASH_SIZE:
+        next_level = bytearray()
+        for i in range(0, len(level) - HASH_SIZE, 2 * HASH_SIZE):
+            pair = level[i : i + 2 * HASH_SIZE]
+            if sort_pairs and pair[HASH_SIZE:] < pair[:HASH_SIZE]:
+                pair = pair[HASH_SIZE:] + pair[:HASH_SIZE]
+            next_level += keccak256(pair)
+
+        # Node without a pair is carried to the next level as it is
+        if len(level) % (2 * HASH_SIZE):
+            next_level += level[-HASH_SIZE:]
+
+        levels.append(bytes(next_level))
+
+    return levels
+
+
+def calculate_merkle_root(
+    leaves: list[HexStr] | bytes, sort_pairs: bool = False
+) -> HexStr:
+    if not isinstance(leaves, bytes):
+        leaves = b"".join(HexBytes(leaf) for leaf in leaves)
+
+    return Web3.to_hex(build_merkle_levels(leaves, sort_pairs)[-1])
+
+
 class MerkleTree:
     def __init__(
         self,
@@ -69,12 +168,27 @@ class MerkleTree:
         self.sort_leaves = sort_leaves
         self.sort_pairs = sort_pairs
         self.leaves = self._process_leaves(leaves)
-        self.tree = self.build_tree()
+        self.levels = self._build_levels()
+        if self.levels is None:
+            self.tree = self.build_tree()
 
     @property
     def root(self) -> HexStr:
+        if self.levels is not None:
+            return Web3.to_hex(self.levels[-1])
+
         return self.tree[0][0]
 
+    @cached_property
+    def tree(self) -> list[list[HexStr]]:
+        return [
+            [
+                "0x" + level[i : i + HASH_SIZE].hex()
+                for i in range(0, len(level), HASH_SIZE)
+            ]
+            for level in reversed(self.levels)
+        ]
+
     def build_tree(self) -> list[list[HexStr]]:
         tree = [self.leaves]
 
@@ -82,13 +196,7 @@ class MerkleTree:
             next_level = []
             for h1, h2 in zip(level[::2], level[1::2] + [None]):
                 if h2:
-                    next_level.append(
-                        self.hash_function(
-                            h1 + h2[2:]
-                            if not self.sort_pairs
-                            else "0x" + "".join(sorted([h1[2:], h2[2:]]))
-                        )
-                    )
+                    next_level.append(self._hash_pair(h1, h2))
                 else:
                     next_level.append(h1)
 
@@ -99,58 +207,162 @@ class MerkleTree:
 
     def proof(self, leaf: HexStr, index: int | None = None) -> list[HexStr]:
         if index is None:
-            for i, t_leaf in enumerate(self.leaves):
-                if leaf == t_leaf:
-                    index = i
-                    break
-
-        if index is None:
-            raise LeafNotInTree(f"{leaf} is not a part of the Merkle Tree.")
+            index = self._get_leaf_index(leaf)
 
         proof = []
-        levels = copy.deepcopy(self.tree[:0:-1])
-        for level in levels:
-            if (len(level) % 2) == 1:
-                level.append(level[-1])
-
-            if (index % 2) == 1:
-                proof.append(level[index - 1])
-            else:
-                proof.append(level[index + 1])
+        for level in range(self._get_depth() - 1):
+            sibling = index ^ 1
+            # Node without a pair is its own sibling in the proof
+            if sibling >= self._get_level_size(level):
+                sibling = index
 
+            proof.append(self._get_node(level, sibling))
             index //= 2
 
         return proof
 
-    def verify(self, proof: list[HexStr], leaf: HexStr) -> bool:
-        if self.sort_pairs:
-            hash = leaf
-            for p in proof:
-                if hash == p:
-                    continue
+    def proofs(self, leaves: list[HexStr] | None = None) -> list[list[HexStr]]:
+        # Nodes are hex-encoded once and shared between all the proofs
+        self.tree
 
-                hash = self.hash_function("".join(sorted([hash, p])))
+        if leaves is None:
+            return [self.proof(leaf, index) for index, leaf in enumerate(self.leaves)]
 
-        else:
-            for i, t_leaf in enumerate(self.leaves):
-                if leaf == t_leaf:
-                    index = i
-                    break
+        return [self.proof(leaf) for leaf in leaves]
 
-            if index is None:
-                raise LeafNotInTree(f"{leaf} is not a part of the Merkle Tree.")
+    def multiproof(self, leaves: list[HexStr]) -> dict[str, list[HexStr] | list[int]]:
+        indexes = sorted({self._get_leaf_index(leaf) for leaf in leaves})
 
-            hash = leaf
-            for p in proof:
-                if hash == p:
-                    continue
+        proof = []
+        known_indexes = indexes
+        for level in range(self._get_depth() - 1):
+            level_size = self._get_level_size(level)
+            known = set(known_indexes)
+            for index in known_indexes:
+                if (sibling := index ^ 1) < level_size and sibling not in known:
+                    proof.append(self._get_node(level, sibling))
+
+            known_indexes = sorted({index // 2 for index in known_indexes})
+
+        return {
+            "leaves": [self.leaves[index] for index in indexes],
+            "indexes": indexes,
+            "proof": proof,
+            "leaf_count": len(self.leaves),
+        }
 
-                is_left = (index % 2) == 0
-                hash = self.hash_function("".join([hash, p] if is_left else [p, hash]))
+    def verify(self, proof: list[HexStr], leaf: HexStr) -> bool:
+        index = None if self.sort_pairs else self._get_leaf_index(leaf)
+
+        hash = leaf
+        for p in proof:
+            if hash != p:
+                if self.sort_pairs or (index % 2) == 0:
+                    hash = self._hash_pair(hash, p)
+                else:
+                    hash = self._hash_pair(p, hash)
+
+            if index is not None:
                 index //= 2
 
         return hash == self.root
 
+    def verify_multiproof(
+        self, multiproof: dict[str, list[HexStr] | list[int]]
+    ) -> bool:
+        nodes = dict(zip(multiproof["indexes"], multiproof["leaves"]))
+        proof = iter(multiproof["proof"])
+        level_size = multiproof["leaf_count"]
+
+        try:
+            while level_size > 1:
+                next_nodes = {}
+                for index in sorted(nodes):
+                    if index // 2 in next_nodes:
+                        continue
+
+                    sibling = index ^ 1
+                    if sibling >= level_size:
+                        next_nodes[index // 2] = nodes[index]
+                        continue
+
+                    sibling_node = nodes[sibling] if sibling in nodes else next(proof)
+                    next_nodes[index // 2] = (
+                        self._hash_pair(nodes[index], sibling_node)
+                        if (index % 2) == 0
+                        else self._hash_pair(sibling_node, nodes[index])
+                    )
+
+                nodes = next_nodes
+                level_size = (level_size + 1) // 2
+        except StopIteration:
+            return False
+
+        return next(proof, None) is None and nodes.get(0) == self.root
+
+    def _hash_pair(self, h1: HexStr, h2: HexStr) -> HexStr:
+        if self.sort_pairs:
+            h1, h2 = sorted([h1, h2])
+
+        if self.levels is not None:
+            return Web3.to_hex(keccak256(HexBytes(h1) + HexBytes(h2)))
+
+        return self.hash_function(h1 + h2[2:])
+
+    @cached_property
+    def _leaf_indexes(self) -> dict[HexStr, int]:
+        leaf_indexes = {}
+        for index, leaf in enumerate(self.leaves):
+            leaf_indexes.setdefault(leaf, index)
+
+        return leaf_indexes
+
+    def _get_leaf_index(self, leaf: HexStr) -> int:
+        if (index := self._leaf_indexes.get(leaf)) is None:
+            raise LeafNotInTree(f"{leaf} is not a part of the Merkle Tree.")
+
+        return index
+
+    # Levels are numbered from the leaves, nodes are read from the hex tree if
+    # it has been materialized and from the byte levels otherwise
+    def _get_depth(self) -> int:
+        return len(self.levels) if "tree" not in self.__dict__ else len(self.tree)
+
+    def _get_level_size(self, level: int) -> int:
+        if "tree" not in self.__dict__:
+            return len(self.levels[level]) // HASH_SIZE
+
+        return len(self.tree[-1 - level])
+
+    def _get_node(self, level: int, index: int) -> HexStr:
+        if "tree" not in self.__dict__:
+            return Web3.to_hex(
+                self.levels[level][index * HASH_SIZE : (index + 1) * HASH_SIZE]
+            )
+
+        return self.tree[-1 - level][index]
+
+    def _build_levels(self) -> list[bytes] | None:
+        # Byte-native tree is built only when it gives the same root as hashing
+        # the hex strings, i.e. for the default hash and 32-byte lowercase leaves
+        if self.hash_function is not solidity_keccak256 or not self.leaves:
+            return None
+
+        if any(
+            len(leaf) != 2 + 2 * HASH_SIZE or not leaf.startswith("0x")
+            for leaf in self.leaves
+        ):
+            return None
+
+        hex_leaves = "".join(leaf[2:] for leaf in self.leaves)
+        if hex_leaves != hex_leaves.lower():
+            return None
+
+        try:
+            return build_merkle_levels(bytes.fromhex(hex_leaves), self.sort_pairs)
+        except ValueError:
+            return None
+
     def _process_leaves(self, leaves: list[str | HexStr]) -> list[HexStr]:
         if self.sort_leaves:
             leaves.sort()
@@ -171,3 +383,240 @@ class MerkleTree:
             return hash_function
         else:
             raise ValueError()
+
+
+class MerkleRootBuilder:
+    """
+    Computes the Merkle Tree root from leaves added one by one, keeping only the
+    roots of complete subtrees, i.e. O(log n) nodes.
+    """
+
+    def __init__(self, sort_pairs: bool = False):
+        self.sort_pairs = sort_pairs
+        self.leaf_count = 0
+
+        self._stack: list[tuple[int, bytes]] = []
+
+    @property
+    def root(self) -> HexStr:
+        if not self._stack:
+            raise ValueError("Merkle Tree root can't be computed without leaves.")
+
+        # Subtrees are folded from the right, the same way as nodes without a
+        # pair are carried to the next level of the full tree
+        _, node = self._stack[-1]
+        for _, left_node in reversed(self._stack[:-1]):
+            node = _hash_pair(left_node, node, self.sort_pairs)
+
+        return "0x" + node.hex()
+
+    def add(self, leaf: bytes) -> None:
+        node, height = leaf, 0
+        while self._stack and self._stack[-1][0] == height:
+            _, left_node = self._stack.pop()
+            node = _hash_pair(left_node, node, self.sort_pairs)
+            height += 1
+
+        self._stack.append((height, node))
+        self.leaf_count += 1
+
+
+class AssertionMerkleTree:
+    """
+    Merkle Tree of the assertion that can be updated in place. Quad hashes and
+    all tree levels are kept, so that inserting or removing quads rehashes only
+    leaves whose index changed and their paths to the root.
+    """
+
+    def __init__(self, quads: list[str], sort_pairs: bool = True):
+        self.sort_pairs = sort_pairs
+        self.quads = sorted(quads)
+
+        self._quad_hashes = [keccak256(quad.encode("utf-8")) for quad in self.quads]
+        self.levels = [
+            bytearray(level)
+            for level in build_merkle_levels(
+                b"".join(
+                    _hash_leaf(quad_hash, index)
+                    for index, quad_hash in enumerate(self._quad_hashes)
+                ),
+                sort_pairs,
+            )
+        ]
+
+    @property
+    def root(self) -> HexStr:
+        if not self.quads:
+            raise ValueError("Merkle Tree root can't be computed without leaves.")
+
+        return "0x" + self.levels[-1].hex()
+
+    def replace(self, quads: list[str]) -> dict[str, HexStr | dict[int, HexStr]]:
+        quad_counts = Counter(quads)
+        quad_counts.subtract(self.quads)
+
+        return self.update(
+            inserted=list(quad_counts.elements()),
+            removed=list((-quad_counts).elements()),
+        )
+
+    def update(
+        self, inserted: Iterable[str] = (), removed: Iterable[str] = ()
+    ) -> dict[str, HexStr | dict[int, HexStr] | list[int]]:
+        previous_root = self.root if self.quads else None
+        previous_quads = list(self.quads)
+
+        first_changed_index = len(self.quads)
+        for quad in removed:
+            index = bisect.bisect_left(self.quads, quad)
+            if index == len(self.quads) or self.quads[index] != quad:
+                raise LeafNotInTree(f"{quad} is not a part of the assertion.")
+
+            del self.quads[index]
+            del self._quad_hashes[index]
+            first_changed_index = min(first_changed_index, index)
+
+        for quad in inserted:
+            index = bisect.bisect_right(self.quads, quad)
+            self.quads.insert(index, quad)
+            self._quad_hashes.insert(index, keccak256(quad.encode("utf-8")))
+            first_changed_index = min(first_changed_index, index)
+
+        # Leaf hash depends on the index, so every leaf after the first insertion
+        # or removal changes unless the same quad ended up at the same index
+        leaves = self.levels[0]
+        previous_size, size = len(previous_quads), len(self.quads)
+        self._resize_level(leaves, size)
+
+        changed_leaves = {}
+        for index in range(first_changed_index, size):
+            if index < previous_size and self.quads[index] == previous_quads[index]:
+                continue
+
+            leaf = _hash_leaf(self._quad_hashes[index], index)
+            leaves[index * HASH_SIZE : (index + 1) * HASH_SIZE] = leaf
+            changed_leaves[index] = "0x" + leaf.hex()
+
+        self._update_levels(set(changed_leaves), previous_size)
+
+        return {
+            "previousRoot": previous_root,
+            "root": self.root if self.quads else None,
+            "changedLeaves": changed_leaves,
+            "removedLeaves": list(range(size, previous_size)),
+        }
+
+    def _update_levels(self, changed_indexes: set[int], previous_size: int) -> None:
+        level_number = 0
+        while (size := len(self.levels[level_number]) // HASH_SIZE) > 1:
+            if not changed_indexes and size == previous_size:
+                return
+
+            if level_number + 1 == len(self.levels):
+                self.levels.append(bytearray())
+
+            level, parent_level = self.levels[level_number : level_number + 2]
+            parent_size = (size + 1) // 2
+            previous_parent_size = len(parent_level) // HASH_SIZE
+            self._resize_level(parent_level, parent_size)
+
+            parent_indexes = {index // 2 for index in changed_indexes}
+            if size != previous_size:
+                # Last node could have gained or lost its pair
+                parent_indexes.add(parent_size - 1)
+
+            changed_indexes = set()
+            for index in parent_indexes:
+                if index >= parent_size:
+                    continue
+
+                left_index, right_index = 2 * index, 2 * index + 1
+                node = level[left_index * HASH_SIZE : right_index * HASH_SIZE]
+                if right_index < size:
+                    node = _hash_pair(
+                        node,
+                        level[right_index * HASH_SIZE : (right_index + 1) * HASH_SIZE],
+                        self.sort_pairs,
+                    )
+
+                node_slice = slice(index * HASH_SIZE, (index + 1) * HASH_SIZE)
+                if index >= previous_parent_size or parent_level[node_slice] != node:
+                    parent_level[node_slice] = node
+                    changed_indexes.add(index)
+
+            previous_size = previous_parent_size
+            level_number += 1
+
+        del self.levels[level_number + 1 :]
+
+    @staticmethod
+    def _resize_level(level: bytearray, size: int) -> None:
+        if len(level) < size * HASH_SIZE:
+            level.extend(bytes(size * HASH_SIZE - len(level)))
+        else:
+            del level[size * HASH_SIZE :]
+
+
+def stream_assertion_root(
+    quads: Iterable[str],
+    sort: bool = True,
+    sort_pairs: bool = True,
+    sort_chunk_size: int = SORT_CHUNK_SIZE,
+) -> HexStr:
+    """
+    Computes the assertion Merkle root of N-Quads from any iterable, e.g. lines
+    of a file, without holding the assertion in memory. Quads are sorted with an
+    external merge sort when they don't fit into a single chunk.
+    """
+    quads = (quad.rstrip("\r\n") for quad in quads)
+    quads = (quad for quad in quads if quad)
+
+    builder = MerkleRootBuilder(sort_pairs)
+    with ExitStack() as stack:
+        if sort:
+            quads = _sort_quads(quads, sort_chunk_size, stack)
+
+        for index, quad in enumerate(quads):
+            builder.add(_hash_leaf(keccak256(quad.encode("utf-8")), index))
+
+    if builder.leaf_count == 0:
+        raise InvalidDataset("Invalid dataset, no quads were extracted.")
+
+    return builder.root
+
+
+def _sort_quads(
+    quads: Iterator[str], sort_chunk_size: int, stack: ExitStack
+) -> Iterator[str]:
+    chunk = list(itertools.islice(quads, sort_chunk_size))
+    chunk.sort()
+    if len(chunk) < sort_chunk_size:
+        return iter(chunk)
+
+    temporary_dir = Path(stack.enter_context(tempfile.TemporaryDirectory()))
+    chunk_files = []
+    while chunk:
+        chunk_path = temporary_dir / f"{len(chunk_files)}.nq"
+        with open(chunk_path, "w", encoding="utf-8") as chunk_file:
+            chunk_file.writelines(f"{quad}\n" for quad in chunk)
+        chunk_files.append(
+            stack.enter_context(open(chunk_path, "r", encoding="utf-8"))
+        )
+
+        chunk = list(itertools.islice(quads, sort_chunk_size))
+        chunk.sort()
+
+    return heapq.merge(
+        *[(line.rstrip("\n") for line in chunk_file) for chunk_file in chunk_files]
+    )
+
+
+def _hash_leaf(quad_hash: bytes, index: int) -> bytes:
+    return keccak256(quad_hash + index.to_bytes(32, "big"))
+
+
+def _hash_pair(left_node: bytes, right_node: bytes, sort_pairs: bool) -> bytes:
+    if sort_pairs and right_node < left_node:
+        left_node, right_node = right_node, left_node
+
+    return keccak256(left_node + right_node)
@@ -15,11 +15,17 @@
 # specific language governing permissions and limitations
 # under the License.
 
+import threading
+import time
 from dataclasses import dataclass, field
 from enum import auto, Enum
 from typing import Any, Type
 
-from dkg.dataclasses import BidSuggestionRange, HTTPRequestMethod
+from dkg.dataclasses import (
+    BidSuggestionRange,
+    HTTPRequestMethod,
+    OperationStatusTransition,
+)
 from dkg.exceptions import OperationFailed, OperationNotFinished
 from dkg.types import  AutoStrEnumUpperCase, UAL, Address, DataHexStr, NQuads
 
@@ -192,3 +198,68 @@ def validate_operation_status(operation_result: dict[str, Any]) -> None:
             )
         case _:
             raise OperationNotFinished("Operation isn't finished")
+
+
+class OperationStatusTracker:
+    """
+    Records status transitions of node operations from their polled results.
+    Passed as `status_tracker` to get_operation_result, create, create_many or
+    update, one tracker collects the transitions of every operation polled with
+    it, so their per-status durations can be read once they finish.
+    """
+
+    def __init__(self):
+        self.transitions: list[OperationStatusTransition] = []
+
+        self._starts: dict[str, float] = {}
+        self._statuses: dict[str, str] = {}
+        self._lock = threading.Lock()
+
+    def start(self, operation_id: str) -> None:
+        with self._lock:
+            self._starts.setdefault(operation_id, time.monotonic())
+
+    def get_status(self, operation_id: str) -> str | None:
+        return self._statuses.get(operation_id)
+
+    def update(
+        self, operation_id: str, operation: str, operation_result: dict[str, Any]
+    ) -> OperationStatusTransition | None:
+        status = operation_result.get("status")
+
+        with self._lock:
+            previous_status = self._statuses.get(operation_id)
+            if status is None or status == previous_status:
+                return None
+
+            start = self._starts.setdefault(operation_id, time.monotonic())
+            transition = OperationStatusTransition(
+                operation_id=operation_id,
+                operation=operation,
+                status=status,
+                previous_status=previous_status,
+                timestamp=time.time(),
+                elapsed=time.monotonic() - start,
+            )
+            self._statuses[operation_id] = status
+            self.transitions.append(transition)
+
+        return transition
+
+    def get_transitions(self, operation_id: str) -> list[OperationStatusTransition]:
+        return [
+            transition
+            for transition in self.transitions
+            if transition.operation_id == operation_id
+        ]
+
+    def get_phase_durations(self, operation_id: str) -> dict[str, float]:
+        transitions = self.get_transitions(operation_id)
+
+        durations = {}
+        for transition, next_transition in zip(transitions, transitions[1:]):
+            durations[transition.status] = durations.get(transition.status, 0) + (
+                next_transition.elapsed - transition.elapsed
+            )
+
+        return durations
@@ -0,0 +1,396 @@
+# Licensed to the Apache Software Foundation (ASF) under one
+# or more contributor license agreements.  See the NOTICE file
+# distributed with this work for additional information
+# regarding copyright ownership.  The ASF licenses this file
+# to you under the Apache License, Version 2.0 (the
+# "License"); you may not use this file except in compliance
+# with the License.  You may obtain a copy of the License at
+
+#   http://www.apache.org/licenses/LICENSE-2.0
+
+# Unless required by applicable law or agreed to in writing,
+# software distributed under the License is distributed on an
+# "AS IS" BASIS, WITHOUT WARRANTIES OR CONDITIONS OF ANY
+# KIND, either express or implied.  See the License for the
+# specific language governing permissions and limitations
+# under the License.
+import asyncio
+import random
+import threading
+import time
+from concurrent.futures import Future, ThreadPoolExecutor
+from dataclasses import dataclass
+from typing import Any, Awaitable, Callable, Iterator, TypeVar
+
+from dkg.dataclasses import PollingProfile
+from dkg.exceptions import NodeRequestError, OperationNotFinished, OperationTimeout
+
+T = TypeVar("T")
+
+DEFAULT_POLLING_PROFILES: dict[str, PollingProfile] = {
+    "publish": PollingProfile(initial_interval=0.5, max_interval=5, timeout=300),
+    "update": PollingProfile(initial_interval=0.5, max_interval=5, timeout=300),
+    "local-store": PollingProfile(initial_interval=0.1, max_interval=2, timeout=120),
+    "get": PollingProfile(initial_interval=0.05, max_interval=2, timeout=60),
+    "query": PollingProfile(initial_interval=0.05, max_interval=2, timeout=60),
+}
+DEFAULT_POLLING_PROFILE = PollingProfile(
+    initial_interval=0.1, max_interval=5, timeout=120
+)
+
+
+class OperationPoller:
+    """
+    Polls results of node operations until they are finished. Intervals start
+    short and grow with jittered exponential backoff, while the first poll is
+    delayed by the latency observed for previous operations of the same type,
+    so quick operations return right away and slow ones don't flood the node.
+    """
+
+    def __init__(
+        self,
+        profiles: dict[str, PollingProfile] | None = None,
+        jitter: float = 0.2,
+        smoothing: float = 0.3,
+        first_poll_ratio: float = 0.8,
+    ):
+        self.profiles = {**DEFAULT_POLLING_PROFILES, **(profiles or {})}
+        self.jitter = jitter
+        self.smoothing = smoothing
+        self.first_poll_ratio = first_poll_ratio
+
+        self._latencies: dict[str, float] = {}
+        self._lock = threading.Lock()
+
+    def get_profile(self, operation: str) -> PollingProfile:
+        return self.profiles.get(operation, DEFAULT_POLLING_PROFILE)
+
+    def get_expected_latency(self, operation: str) -> float | None:
+        return self._latencies.get(operation)
+
+    def observe(self, operation: str, latency: float) -> None:
+        with self._lock:
+            previous_latency = self._latencies.get(operation)
+            self._latencies[operation] = (
+                latency
+                if previous_latency is None
+                else previous_latency + self.smoothing * (latency - previous_latency)
+            )
+
+    def delays(self, operation: str) -> Iterator[float]:
+        profile = self.get_profile(operation)
+        expected_latency = self.get_expected_latency(operation)
+
+        yield (
+            0 if expected_latency is None else expected_latency * self.first_poll_ratio
+        )
+
+        interval = profile.initial_interval
+        while True:
+            yield interval * random.uniform(1 - self.jitter, 1 + self.jitter)
+            interval = min(interval * profile.backoff, profile.max_interval)
+
+    def poll(
+        self, fetch: Callable[[], T], operation: str, timeout: float | None = None
+    ) -> T:
+        timeout = self.get_profile(operation).timeout if timeout is None else timeout
+        start = time.monotonic()
+        deadline = start + timeout
+
+        for delay in self.delays(operation):
+            time.sleep(max(min(delay, deadline - time.monotonic()), 0))
+
+            try:
+                result = fetch()
+            except OperationNotFinished:
+                if time.monotonic() >= deadline:
+                    raise OperationTimeout(
+                        f"Operation {operation} isn't finished after {timeout}s."
+                    )
+                continue
+
+            self.observe(operation, time.monotonic() - start)
+            return result
+
+    async def async_poll(
+        self,
+        fetch: Callable[[], Awaitable[T]],
+        operation: str,
+        timeout: float | None = None,
+    ) -> T:
+        timeout = self.get_profile(operation).timeout if timeout is None else timeout
+        start = time.monotonic()
+        deadline = start + timeout
+
+        for delay in self.delays(operation):
+            await asyncio.sleep(max(min(delay, deadline - time.monotonic()), 0))
+
+            try:
+                result = await fetch()
+            except OperationNotFinished:
+                if time.monotonic() >= deadline:
+                    raise OperationTimeout(
+                        f"Operation {operation} isn't finished after {timeout}s."
+                    )
+                continue
+
+            self.observe(operation, time.monotonic() - start)
+            return result
+
+
+@dataclass(eq=False)
+class PendingOperation:
+    fetch: Callable[[], Any]
+    operation: str
+    future: Future | asyncio.Future
+    timeout: float
+    start: float
+    deadline: float
+    delays: Iterator[float]
+    next_poll_time: float
+
+
+class BaseOperationMultiplexer:
+    """
+    Polls all pending operations of a node on a single schedule. Operations
+    due within the same tick are polled together, so many concurrent operations
+    share one wakeup instead of each sleeping and polling on its own.
+    """
+
+    def __init__(self, poller: OperationPoller, tick: float = 0.05):
+        self.poller = poller
+        self.tick = tick
+
+        self._pending: list[PendingOperation] = []
+        self._closed = False
+
+    def _add_pending_operation(
+        self,
+        fetch: Callable[[], Any],
+        operation: str,
+        timeout: float | None,
+        future: Future | asyncio.Future,
+    ) -> None:
+        if self._closed:
+            raise NodeRequestError("Operation multiplexer has been closed.")
+
+        timeout = (
+            self.poller.get_profile(operation).timeout if timeout is None else timeout
+        )
+        start = time.monotonic()
+        delays = self.poller.delays(operation)
+
+        self._pending.append(
+            PendingOperation(
+                fetch=fetch,
+                operation=operation,
+                future=future,
+                timeout=timeout,
+                start=start,
+                deadline=start + timeout,
+                delays=delays,
+                next_poll_time=start + next(delays),
+            )
+        )
+
+    def _get_wait_time(self) -> float | None:
+        if not self._pending:
+            return None
+
+        next_poll_time = min(pending.next_poll_time for pending in self._pending)
+
+        return max(next_poll_time - time.monotonic(), 0)
+
+    def _take_due_operations(self) -> list[PendingOperation]:
+        poll_time = time.monotonic() + self.tick
+
+        return [
+            pending for pending in self._pending if pending.next_poll_time <= poll_time
+        ]
+
+    def _set_result(self, pending: PendingOperation, result: Any) -> None:
+        self.poller.observe(pending.operation, time.monotonic() - pending.start)
+        if not pending.future.done():
+            pending.future.set_result(result)
+
+    def _set_exception(self, pending: PendingOperation, err: Exception) -> None:
+        if not pending.future.done():
+            pending.future.set_exception(err)
+
+    def _reschedule(self, due: list[PendingOperation]) -> None:
+        now = time.monotonic()
+
+        for pending in due:
+            if pending.future.done():
+                continue
+
+            if now >= pending.deadline:
+                self._set_exception(
+                    pending,
+                    OperationTimeout(
+                        f"Operation {pending.operation} isn't finished after "
+                        f"{pending.timeout}s."
+                    ),
+                )
+            else:
+                pending.next_poll_time = min(
+                    now + next(pending.delays), pending.deadline
+                )
+
+        self._pending = [
+            pending for pending in self._pending if not pending.future.done()
+        ]
+
+    def _fail_pending_operations(self) -> None:
+        for pending in self._pending:
+            self._set_exception(
+                pending, NodeRequestError("Operation multiplexer has been closed.")
+            )
+
+        self._pending = []
+
+
+class OperationMultiplexer(BaseOperationMultiplexer):
+    def __init__(
+        self, poller: OperationPoller, max_workers: int = 10, tick: float = 0.05
+    ):
+        super().__init__(poller, tick)
+        self.max_workers = max_workers
+
+        self._condition = threading.Condition()
+        self._executor: ThreadPoolExecutor | None = None
+        self._thread: threading.Thread | None = None
+
+    def submit(
+        self, fetch: Callable[[], T], operation: str, timeout: float | None = None
+    ) -> Future:
+        future = Future()
+        future.set_running_or_notify_cancel()
+
+        with self._condition:
+            self._add_pending_operation(fetch, operation, timeout, future)
+
+            if self._thread is None:
+                self._executor = ThreadPoolExecutor(max_workers=self.max_workers)
+                self._thread = threading.Thread(target=self._run, daemon=True)
+                self._thread.start()
+
+            self._condition.notify()
+
+        return future
+
+    def close(self) -> None:
+        with self._condition:
+            self._closed = True
+            self._condition.notify()
+
+        if self._thread is not None:
+            self._thread.join()
+            self._executor.shutdown()
+            self._thread = self._executor = None
+
+        with self._condition:
+            self._fail_pending_operations()
+
+    def _run(self) -> None:
+        while True:
+            with self._condition:
+                if self._closed:
+                    return
+
+                wait_time = self._get_wait_time()
+                if wait_time is None or wait_time > self.tick:
+                    self._condition.wait(wait_time)
+                    continue
+
+                due = self._take_due_operations()
+
+            list(self._executor.map(self._poll, due))
+
+            with self._condition:
+                self._reschedule(due)
+
+    def _poll(self, pending: PendingOperation) -> None:
+        try:
+            result = pending.fetch()
+        except OperationNotFinished:
+            return
+        except Exception as err:
+            self._set_exception(pending, err)
+            return
+
+        self._set_result(pending, result)
+
+
+class AsyncOperationMultiplexer(BaseOperationMultiplexer):
+    def __init__(self, poller: OperationPoller, tick: float = 0.05):
+        super().__init__(poller, tick)
+
+        self._wakeup: asyncio.Event | None = None
+        self._task: asyncio.Task | None = None
+
+    def submit(
+        self,
+        fetch: Callable[[], Awaitable[T]],
+        operation: str,
+        timeout: float | None = None,
+    ) -> asyncio.Future:
+        loop = asyncio.get_running_loop()
+        future = loop.create_future()
+
+        self._add_pending_operation(fetch, operation, timeout, future)
+
+        if self._task is None or self._task.done():
+            self._wakeup = asyncio.Event()
+            self._task = loop.create_task(self._run())
+
+        self._wakeup.set()
+
+        return future
+
+    async def close(self) -> None:
+        self._closed = True
+
+        if self._task is not None:
+            self._task.cancel()
+            try:
+                await self._task
+            except asyncio.CancelledError:
+                pass
+            self._task = None
+
+        self._fail_pending_operations()
+
+    async def _run(self) -> None:
+        while True:
+            wait_time = self._get_wait_time()
+            if wait_time is None:
+                return
+
+            if wait_time > self.tick:
+                try:
+                    await asyncio.wait_for(self._wakeup.wait(), wait_time)
+                except asyncio.TimeoutError:
+                    pass
+                self._wakeup.clear()
+                continue
+
+            due = self._take_due_operations()
+
+            await asyncio.gather(*(self._poll(pending) for pending in due))
+
+            self._reschedule(due)
+
+    async def _poll(self, pending: PendingOperation) -> None:
+        if pending.future.done():
+            return
+
+        try:
+            result = await pending.fetch()
+        except OperationNotFinished:
+            return
+        except Exception as err:
+            self._set_exception(pending, err)
+            return
+
+        self._set_result(pending, result)
@@ -15,19 +15,146 @@
 # specific language governing permissions and limitations
 # under the License.
 
-from typing import Literal
+import hashlib
+import json
+import os
+from pathlib import Path
+from typing import Any, Callable, Literal
 
 from dkg.constants import PRIVATE_ASSERTION_PREDICATE
-from dkg.exceptions import DatasetInputFormatNotSupported, InvalidDataset
+from dkg.dataclasses import PreparedAssertion
+from dkg.exceptions import (
+    CanonicalizationBackendNotSupported,
+    DatasetInputFormatNotSupported,
+    InvalidDataset,
+)
 from dkg.types import JSONLD, HexStr, NQuads
-from dkg.utils.merkle import MerkleTree, hash_assertion_with_indexes
-from pyld import jsonld
+from dkg.utils.cache import NQuadsCache, get_cache_dir
+from dkg.utils.merkle import calculate_merkle_root, hash_assertion_leaves
+from dkg.utils.metadata import generate_assertion_metadata
+
+CanonicalizationBackend = Callable[[JSONLD | str, dict[str, str]], NQuads]
+
+
+def canonicalize_with_urdna2015(
+    dataset: JSONLD | str, normalization_options: dict[str, str]
+) -> NQuads:
+    from dkg.utils import urdna2015
+
+    if "inputFormat" in normalization_options:
+        return urdna2015.canonicalize_nquads(dataset)
+    else:
+        from pyld import jsonld
+
+        # pyld is only used to expand JSON-LD and convert it to RDF
+        quads = urdna2015.from_rdf_dataset(
+            jsonld.to_rdf(dataset, {"produceGeneralizedRdf": False})
+        )
+
+    return urdna2015.canonicalize(quads)
+
+
+def canonicalize_with_pyld(
+    dataset: JSONLD | str, normalization_options: dict[str, str]
+) -> NQuads:
+    from pyld import jsonld
+
+    n_quads = jsonld.normalize(dataset, normalization_options)
+
+    return [quad for quad in n_quads.split("\n") if quad]
+
+
+canonicalization_backends: dict[str, CanonicalizationBackend] = {
+    "urdna2015": canonicalize_with_urdna2015,
+    "pyld": canonicalize_with_pyld,
+}
+# The in-tree implementation is opt-in until it's verified against the W3C
+# rdf-canon test suite, see tests/test_canonicalization.py
+default_canonicalization_backend = "pyld"
+
+
+def register_canonicalization_backend(
+    name: str, backend: CanonicalizationBackend
+) -> None:
+    canonicalization_backends[name] = backend
+
+
+def set_canonicalization_backend(name: str) -> None:
+    global default_canonicalization_backend
+
+    if name not in canonicalization_backends:
+        raise CanonicalizationBackendNotSupported(
+            f"Canonicalization backend isn't registered: {name}. "
+            f"Registered backends: {', '.join(canonicalization_backends)}."
+        )
+
+    default_canonicalization_backend = name
+
+
+class NormalizationCache(NQuadsCache):
+    """
+    Content-addressed cache of canonicalized datasets, keyed by the hash of
+    the input dataset and normalization options.
+    """
+
+    FORMAT_VERSION = 1
+
+    def get_key(self, dataset: Any, options: dict[str, str]) -> str | None:
+        try:
+            serialized_input = json.dumps(
+                [self.FORMAT_VERSION, options, dataset],
+                sort_keys=True,
+                separators=(",", ":"),
+                ensure_ascii=False,
+            )
+        except (TypeError, ValueError):
+            # Inputs that can't be serialized deterministically aren't cached
+            return None
+
+        return hashlib.sha256(serialized_input.encode("utf-8")).hexdigest()
+
+
+normalization_cache = NormalizationCache(
+    cache_dir=(
+        get_cache_dir() / "normalization"
+        if os.environ.get("DKG_NORMALIZATION_CACHE", "").lower() in ("1", "true")
+        else None
+    )
+)
+
+
+def configure_normalization_cache(
+    max_size: int = 256,
+    persist: bool = False,
+    cache_dir: Path | str | None = None,
+    max_disk_entries: int = 10_000,
+) -> NormalizationCache:
+    global normalization_cache
+
+    if persist and cache_dir is None:
+        cache_dir = get_cache_dir() / "normalization"
+
+    normalization_cache = NormalizationCache(
+        max_size=max_size,
+        cache_dir=cache_dir,
+        max_disk_entries=max_disk_entries,
+    )
+
+    return normalization_cache
 
 
 def normalize_dataset(
     dataset: JSONLD | NQuads,
     input_format: Literal["JSON-LD", "N-Quads"] = "JSON-LD",
+    backend: str | None = None,
 ) -> NQuads:
+    backend = backend or default_canonicalization_backend
+    if backend not in canonicalization_backends:
+        raise CanonicalizationBackendNotSupported(
+            f"Canonicalization backend isn't registered: {backend}. "
+            f"Registered backends: {', '.join(canonicalization_backends)}."
+        )
+
     normalization_options = {
         "algorithm": "URDNA2015",
         "format": "application/n-quads",
@@ -38,18 +165,40 @@ def normalize_dataset(
             pass
         case "n-quads" | "nquads":
             normalization_options["inputFormat"] = "application/n-quads"
+            if isinstance(dataset, list):
+                dataset = "\n".join(dataset)
+
+            from dkg.utils.urdna2015 import get_canonical_nquads
+
+            # N-Quads that are already canonical only have to be sorted and
+            # deduplicated, whichever backend is used
+            if (assertion := get_canonical_nquads(dataset)) is not None:
+                if not assertion:
+                    raise InvalidDataset("Invalid dataset, no quads were extracted.")
+
+                return assertion
         case _:
             raise DatasetInputFormatNotSupported(
                 f"Dataset input format isn't supported: {input_format}. "
                 "Supported formats: JSON-LD / N-Quads."
             )
 
-    n_quads = jsonld.normalize(dataset, normalization_options)
-    assertion = [quad for quad in n_quads.split("\n") if quad]
+    cache_key = normalization_cache.get_key(
+        dataset, {**normalization_options, "backend": backend}
+    )
+    if cache_key is not None and (
+        assertion := normalization_cache.get(cache_key)
+    ) is not None:
+        return assertion
+
+    assertion = canonicalization_backends[backend](dataset, normalization_options)
 
     if not assertion:
         raise InvalidDataset("Invalid dataset, no quads were extracted.")
 
+    if cache_key is not None:
+        normalization_cache.set(cache_key, assertion)
+
     return assertion
 
 
@@ -57,17 +206,30 @@ def format_content(
     content: dict[Literal["public", "private"], JSONLD],
     type: Literal["JSON-LD", "N-Quads"] = "JSON-LD",
 ) -> dict[str, dict[str, HexStr | NQuads | int]]:
+    public_assertion, private_assertion, _ = normalize_content(content, type)
+
+    return {
+        "public": public_assertion,
+        "private": private_assertion or {},
+    }
+
+
+def normalize_content(
+    content: dict[Literal["public", "private"], JSONLD],
+    type: Literal["JSON-LD", "N-Quads"] = "JSON-LD",
+) -> tuple[NQuads, NQuads | None, HexStr | None]:
     public_graph = {"@graph": []}
 
     if content.get("public", None):
         public_graph["@graph"].append(content["public"])
 
+    private_assertion = private_assertion_id = None
     if content.get("private", None):
         private_assertion = normalize_dataset(content["private"], type)
-        private_assertion_id = MerkleTree(
-            hash_assertion_with_indexes(private_assertion),
+        private_assertion_id = calculate_merkle_root(
+            hash_assertion_leaves(private_assertion),
             sort_pairs=True,
-        ).root
+        )
 
         public_graph["@graph"].append(
             {PRIVATE_ASSERTION_PREDICATE: private_assertion_id}
@@ -75,9 +237,43 @@ def format_content(
 
     public_assertion = normalize_dataset(public_graph, type)
 
-    return {
-        "public": public_assertion,
-        "private": private_assertion
-        if content.get("private", None)
-        else {},
-    }
+    return public_assertion, private_assertion, private_assertion_id
+
+
+def prepare_content(
+    content: dict[Literal["public", "private"], JSONLD],
+    type: Literal["JSON-LD", "N-Quads"] = "JSON-LD",
+) -> PreparedAssertion:
+    public_assertion, private_assertion, private_assertion_id = normalize_content(
+        content, type
+    )
+    public_assertion_id = calculate_merkle_root(
+        hash_assertion_leaves(public_assertion),
+        sort_pairs=True,
+    )
+
+    return to_prepared_assertion(
+        public_assertion,
+        public_assertion_id,
+        private_assertion,
+        private_assertion_id,
+    )
+
+
+def to_prepared_assertion(
+    public_assertion: NQuads,
+    public_assertion_id: HexStr,
+    private_assertion: NQuads | None = None,
+    private_assertion_id: HexStr | None = None,
+) -> PreparedAssertion:
+    public_assertion_metadata = generate_assertion_metadata(public_assertion)
+
+    return PreparedAssertion(
+        public=tuple(public_assertion),
+        public_assertion_id=public_assertion_id,
+        size=public_assertion_metadata["size"],
+        triples_number=public_assertion_metadata["triples_number"],
+        chunks_number=public_assertion_metadata["chunks_number"],
+        private=tuple(private_assertion or ()),
+        private_assertion_id=private_assertion_id,
+    )
@@ -0,0 +1,149 @@
+# Licensed to the Apache Software Foundation (ASF) under one
+# or more contributor license agreements.  See the NOTICE file
+# distributed with this work for additional information
+# regarding copyright ownership.  The ASF licenses this file
+# to you under the Apache License, Version 2.0 (the
+# "License"); you may not use this file except in compliance
+# with the License.  You may obtain a copy of the License at
+
+#   http://www.apache.org/licenses/LICENSE-2.0
+
+# Unless required by applicable law or agreed to in writing,
+# software distributed under the License is distributed on an
+# "AS IS" BASIS, WITHOUT WARRANTIES OR CONDITIONS OF ANY
+# KIND, either express or implied.  See the License for the
+# specific language governing permissions and limitations
+# under the License.
+import asyncio
+import inspect
+from concurrent.futures import FIRST_COMPLETED, Future, ThreadPoolExecutor, wait
+from functools import wraps
+from typing import Any, Awaitable, Callable, Generator, Iterable, TypeVar
+
+T = TypeVar("T")
+
+# Generator yielding the I/O calls of an operation and receiving their results.
+# Calls return values in sync code and awaitables in async code, so one
+# implementation is driven by either run_steps or async_run_steps.
+Steps = Generator[Any, Any, T]
+
+
+class Batch:
+    """
+    Blockchain calls yielded together. Sync modules send them in a single
+    JSON-RPC batch, async modules await them concurrently.
+    """
+
+    def __init__(self, *calls: Callable[[], Any]):
+        self.calls = calls
+
+
+class Gather:
+    """
+    Independent calls yielded together. Sync code runs them on a thread pool,
+    async code awaits them concurrently. Results of failed calls are replaced
+    by the raised exceptions.
+    """
+
+    def __init__(self, *calls: Callable[[], Any], max_workers: int = 10):
+        self.calls = calls
+        self.max_workers = max_workers
+
+
+class Wait:
+    """
+    Futures yielded to wait until at least one of them is done. Resolves to the
+    set of done futures.
+    """
+
+    def __init__(self, futures: Iterable[Future | asyncio.Future]):
+        self.futures = list(futures)
+
+
+def steps(func: Callable[..., Steps[T]]) -> Callable[..., T]:
+    """
+    Runs a generator method with the `_run` driver of its module or provider.
+    """
+
+    @wraps(func)
+    def wrapper(self, *args, **kwargs) -> T:
+        return self._run(func(self, *args, **kwargs))
+
+    return wrapper
+
+
+def run_steps(steps: Steps[T], resolve: Callable[[Any], Any] | None = None) -> T:
+    resolve = resolve or resolve_step
+    result, error = None, None
+
+    while True:
+        try:
+            step = steps.send(result) if error is None else steps.throw(error)
+        except StopIteration as stop:
+            return stop.value
+
+        try:
+            result, error = resolve(step), None
+        except Exception as err:
+            result, error = None, err
+
+
+async def async_run_steps(
+    steps: Steps[T], resolve: Callable[[Any], Awaitable[Any]] | None = None
+) -> T:
+    resolve = resolve or async_resolve_step
+    result, error = None, None
+
+    while True:
+        try:
+            step = steps.send(result) if error is None else steps.throw(error)
+        except StopIteration as stop:
+            return stop.value
+
+        try:
+            result, error = await resolve(step), None
+        except Exception as err:
+            result, error = None, err
+
+
+def resolve_step(step: Any) -> Any:
+    match step:
+        case Batch():
+            return [call() for call in step.calls]
+        case Gather():
+            with ThreadPoolExecutor(max_workers=step.max_workers) as executor:
+                futures = [executor.submit(call) for call in step.calls]
+
+            return [future.exception() or future.result() for future in futures]
+        case Wait():
+            done, _ = wait(step.futures, return_when=FIRST_COMPLETED)
+            return done
+        case _:
+            return step
+
+
+async def async_resolve_step(step: Any) -> Any:
+    match step:
+        case Batch():
+            return list(await asyncio.gather(*(call() for call in step.calls)))
+        case Gather():
+            semaphore = asyncio.Semaphore(step.max_workers)
+
+            async def run(call: Callable[[], Awaitable[Any]]) -> Any:
+                async with semaphore:
+                    return await call()
+
+            return list(
+                await asyncio.gather(
+                    *(run(call) for call in step.calls), return_exceptions=True
+                )
+            )
+        case Wait():
+            done, _ = await asyncio.wait(
+                step.futures, return_when=asyncio.FIRST_COMPLETED
+            )
+            return done
+        case _ if inspect.isawaitable(step):
+            return await step
+        case _:
+            return step
@@ -0,0 +1,543 @@
+# Licensed to the Apache Software Foundation (ASF) under one
+# or more contributor license agreements.  See the NOTICE file
+# distributed with this work for additional information
+# regarding copyright ownership.  The ASF licenses this file
+# to you under the Apache License, Version 2.0 (the
+# "License"); you may not use this file except in compliance
+# with the License.  You may obtain a copy of the License at
+
+#   http://www.apache.org/licenses/LICENSE-2.0
+
+# Unless required by applicable law or agreed to in writing,
+# software distributed under the License is distributed on an
+# "AS IS" BASIS, WITHOUT WARRANTIES OR CONDITIONS OF ANY
+# KIND, either express or implied.  See the License for the
+# specific language governing permissions and limitations
+# under the License.
+
+"""
+URDNA2015 RDF dataset canonicalization, producing the same output as pyld.
+
+Terms are kept as interned strings in their N-Quads form ("<iri>", "_:label"
+or a serialized literal) and quads as tuples of four terms, with None as the
+graph name of the default graph. This lets quads be serialized and hashed
+with plain string concatenation instead of rebuilding them from term dicts.
+"""
+
+import hashlib
+import re
+import sys
+from typing import Any, Iterable, Iterator
+
+from dkg.exceptions import InvalidDataset
+
+Quad = tuple[str, str, str, str | None]
+
+XSD_STRING = "http://www.w3.org/2001/XMLSchema#string"
+RDF_LANGSTRING = "http://www.w3.org/1999/02/22-rdf-syntax-ns#langString"
+
+CANONICAL_PREFIX = "_:c14n"
+TEMPORARY_PREFIX = "_:b"
+
+# Same grammar as the pyld N-Quads parser, so both accept the same inputs
+_IRI = "(?:<([^:]+:[^>]*)>)"
+_BNODE = "(_:(?:[A-Za-z][A-Za-z0-9]*))"
+_PLAIN = '"([^"\\\\]*(?:\\\\.[^"\\\\]*)*)"'
+_DATATYPE = "(?:\\^\\^" + _IRI + ")"
+_LANGUAGE = "(?:@([a-zA-Z]+(?:-[a-zA-Z0-9]+)*))"
+_LITERAL = "(?:" + _PLAIN + "(?:" + _DATATYPE + "|" + _LANGUAGE + ")?)"
+_WS = "[ \\t]+"
+_WSO = "[ \\t]*"
+
+QUAD_PATTERN = re.compile(
+    "^"
+    + _WSO
+    + "(?:"
+    + _IRI
+    + "|"
+    + _BNODE
+    + ")"
+    + _WS
+    + _IRI
+    + _WS
+    + "(?:"
+    + _IRI
+    + "|"
+    + _BNODE
+    + "|"
+    + _LITERAL
+    + ")"
+    + _WSO
+    + "(?:\\.|(?:(?:"
+    + _IRI
+    + "|"
+    + _BNODE
+    + ")"
+    + _WSO
+    + "\\.))"
+    + _WSO
+    + "$"
+)
+# Quads already in their canonical serialization: single spaces between terms,
+# no string datatype and IRIs without characters that make splitting ambiguous.
+# Each repeated character class excludes the delimiter that follows it, so the
+# patterns match without backtracking
+_CANONICAL_IRI = '<[^:<>" ]+:[^<>" ]*>'
+_CANONICAL_BNODE = "_:[A-Za-z][A-Za-z0-9]*"
+_CANONICAL_TERM = "(" + _CANONICAL_IRI + "|" + _CANONICAL_BNODE + ")"
+_CANONICAL_LITERAL = (
+    '"([^"\\\\]*(?:\\\\.[^"\\\\]*)*)"'
+    + '(?:\\^\\^<([^:<>" ]+:[^<>" ]*)>|@[a-zA-Z]+(?:-[a-zA-Z0-9]+)*)?'
+)
+
+CANONICAL_QUAD_PATTERN = re.compile(
+    _CANONICAL_TERM
+    + " ("
+    + _CANONICAL_IRI
+    + ") ("
+    + _CANONICAL_IRI
+    + "|"
+    + _CANONICAL_BNODE
+    + "|"
+    + _CANONICAL_LITERAL
+    + ") (?:"
+    + _CANONICAL_TERM
+    + " )?\\."
+)
+EMPTY_LINE_PATTERN = re.compile("^" + _WSO + "$")
+LINE_SEPARATOR_PATTERN = re.compile(r"(?:\r\n)|(?:\n)|(?:\r)")
+
+
+def canonicalize(quads: Iterable[Quad]) -> list[str]:
+    """
+    Returns the canonical N-Quads of the dataset, sorted and without line
+    terminators.
+    """
+    return URDNA2015(quads).canonicalize()
+
+
+def canonicalize_nquads(n_quads: str) -> list[str]:
+    """
+    Returns the canonical form of N-Quads, skipping the relabelling pass for
+    input that is already canonical, see `get_canonical_nquads`.
+    """
+    canonical_n_quads = get_canonical_nquads(n_quads)
+    if canonical_n_quads is not None:
+        return canonical_n_quads
+
+    return canonicalize(parse_nquads(n_quads))
+
+
+def get_canonical_nquads(n_quads: str) -> list[str] | None:
+    """
+    Returns N-Quads sorted and without duplicates if they are already
+    canonical, or None if they have to go through the full canonicalization.
+    Input is taken as is if every quad is in its canonical serialization and
+    there are either no blank nodes, or blank node labels match the ones issued
+    from their first degree hashes.
+    """
+    quads: dict[str, Quad] = {}
+    has_blank_nodes = False
+
+    for line in _split_lines(n_quads):
+        match = CANONICAL_QUAD_PATTERN.fullmatch(line)
+        if match is None:
+            if EMPTY_LINE_PATTERN.match(line):
+                continue
+            return None
+
+        subject, predicate, object_, literal, datatype, graph = match.groups()
+        if literal is not None and (
+            datatype == XSD_STRING
+            or datatype == RDF_LANGSTRING
+            or (
+                ("\\" in literal or "\t" in literal)
+                and _escape_literal(_unescape_literal(literal)) != literal
+            )
+        ):
+            return None
+
+        if line not in quads:
+            has_blank_nodes = has_blank_nodes or (
+                subject[0] == "_"
+                or object_[0] == "_"
+                or (graph is not None and graph[0] == "_")
+            )
+            quads[line] = (subject, predicate, object_, graph)
+
+    if has_blank_nodes and not URDNA2015(list(quads.values())).has_canonical_labels():
+        return None
+
+    # Quads are sorted with their terminators to match the pyld ordering
+    return [line[:-1] for line in sorted(line + "\n" for line in quads)]
+
+
+def parse_nquads(n_quads: str) -> list[Quad]:
+    dataset: dict[Quad, None] = {}
+
+    for line_number, line in enumerate(_split_lines(n_quads), 1):
+        if EMPTY_LINE_PATTERN.match(line):
+            continue
+
+        match = QUAD_PATTERN.match(line)
+        if match is None:
+            raise InvalidDataset(
+                f"Invalid dataset, couldn't parse N-Quad on line {line_number}."
+            )
+        (
+            subject_iri,
+            subject_bnode,
+            predicate,
+            object_iri,
+            object_bnode,
+            literal,
+            datatype,
+            language,
+            graph_iri,
+            graph_bnode,
+        ) = match.groups()
+
+        if object_iri is not None:
+            object_ = "<" + object_iri + ">"
+        elif object_bnode is not None:
+            object_ = sys.intern(object_bnode)
+        else:
+            if datatype is None:
+                datatype = RDF_LANGSTRING if language is not None else XSD_STRING
+            object_ = _serialize_literal(_unescape_literal(literal), datatype, language)
+
+        if graph_iri is not None:
+            graph = sys.intern("<" + graph_iri + ">")
+        else:
+            graph = graph_bnode and sys.intern(graph_bnode)
+
+        # Duplicate quads are dropped, same as in pyld
+        dataset[
+            (
+                (
+                    "<" + subject_iri + ">"
+                    if subject_iri is not None
+                    else sys.intern(subject_bnode)
+                ),
+                sys.intern("<" + predicate + ">"),
+                object_,
+                graph,
+            )
+        ] = None
+
+    return list(dataset)
+
+
+def from_rdf_dataset(dataset: dict[str, list[dict[str, Any]]]) -> list[Quad]:
+    """
+    Converts an RDF dataset in the pyld format, as returned by `jsonld.to_rdf`,
+    to quads.
+    """
+    quads = []
+    for graph_name, triples in dataset.items():
+        graph = None
+        if graph_name != "@default":
+            graph = sys.intern(
+                graph_name if graph_name.startswith("_:") else "<" + graph_name + ">"
+            )
+
+        for triple in triples:
+            quads.append(
+                (
+                    _serialize_term(triple["subject"]),
+                    _serialize_term(triple["predicate"]),
+                    _serialize_term(triple["object"]),
+                    graph,
+                )
+            )
+
+    return quads
+
+
+def serialize_quad(quad: Quad) -> str:
+    if quad[3] is None:
+        return f"{quad[0]} {quad[1]} {quad[2]} .\n"
+
+    return f"{quad[0]} {quad[1]} {quad[2]} {quad[3]} .\n"
+
+
+class URDNA2015:
+    def __init__(self, quads: Iterable[Quad]):
+        self.quads = quads if isinstance(quads, list) else list(quads)
+
+        self.canonical_issuer: dict[str, str] = {}
+        self.blank_node_quads: dict[str, list[Quad]] = {}
+        self.first_degree_hashes: dict[str, str] = {}
+
+        for quad in self.quads:
+            # Quads are referenced once per blank node occurrence, which affects
+            # the hashes when a blank node appears in a quad more than once
+            for position in (0, 2, 3):
+                term = quad[position]
+                if term is not None and term.startswith("_:"):
+                    self.blank_node_quads.setdefault(term, []).append(quad)
+
+    def has_canonical_labels(self) -> bool:
+        """
+        Checks whether blank nodes are already labelled canonically, which can
+        be confirmed from first degree hashes alone if they are all unique.
+        """
+        hash_to_blank_nodes = self._group_by_first_degree_hash()
+        if len(hash_to_blank_nodes) != len(self.blank_node_quads):
+            return False
+
+        return all(
+            blank_nodes[0] == CANONICAL_PREFIX + str(i)
+            for i, (_, blank_nodes) in enumerate(sorted(hash_to_blank_nodes.items()))
+        )
+
+    def canonicalize(self) -> list[str]:
+        shared_hashes = []
+        for _, blank_nodes in sorted(self._group_by_first_degree_hash().items()):
+            if len(blank_nodes) == 1:
+                self._issue_canonical_id(blank_nodes[0])
+            else:
+                shared_hashes.append(blank_nodes)
+
+        for blank_nodes in shared_hashes:
+            hash_paths = []
+            for blank_node in blank_nodes:
+                if blank_node in self.canonical_issuer:
+                    continue
+
+                issuer = {blank_node: TEMPORARY_PREFIX + "0"}
+                hash_paths.append(self.hash_n_degree_quads(blank_node, issuer))
+
+            for _, issuer in sorted(hash_paths, key=lambda hash_path: hash_path[0]):
+                for blank_node in issuer:
+                    self._issue_canonical_id(blank_node)
+
+        canonical_issuer = self.canonical_issuer
+        canonical_quads = []
+        for quad in self.quads:
+            subject, predicate, object_, graph = quad
+            if subject.startswith("_:"):
+                subject = canonical_issuer[subject]
+            if object_.startswith("_:"):
+                object_ = canonical_issuer[object_]
+            if graph is not None and graph.startswith("_:"):
+                graph = canonical_issuer[graph]
+
+            canonical_quads.append(serialize_quad((subject, predicate, object_, graph)))
+
+        # Quads are sorted with their terminators to match the pyld ordering
+        canonical_quads.sort()
+
+        return [quad[:-1] for quad in canonical_quads]
+
+    def hash_first_degree_quads(self, blank_node: str) -> str:
+        if (hash_ := self.first_degree_hashes.get(blank_node)) is not None:
+            return hash_
+
+        n_quads = []
+        for subject, predicate, object_, graph in self.blank_node_quads[blank_node]:
+            if subject.startswith("_:"):
+                subject = "_:a" if subject == blank_node else "_:z"
+            if object_.startswith("_:"):
+                object_ = "_:a" if object_ == blank_node else "_:z"
+            if graph is not None and graph.startswith("_:"):
+                graph = "_:a" if graph == blank_node else "_:z"
+
+            n_quads.append(serialize_quad((subject, predicate, object_, graph)))
+        n_quads.sort()
+
+        hash_ = hashlib.sha256("".join(n_quads).encode("utf-8")).hexdigest()
+        self.first_degree_hashes[blank_node] = hash_
+
+        return hash_
+
+    def hash_related_blank_node(
+        self,
+        related: str,
+        quad: Quad,
+        issuer: dict[str, str],
+        position: str,
+    ) -> str:
+        if (identifier := self.canonical_issuer.get(related)) is None:
+            if (identifier := issuer.get(related)) is None:
+                identifier = self.hash_first_degree_quads(related)
+
+        if position == "g":
+            data = "g" + identifier
+        else:
+            data = position + quad[1] + identifier
+
+        return hashlib.sha256(data.encode("utf-8")).hexdigest()
+
+    def hash_n_degree_quads(
+        self, blank_node: str, issuer: dict[str, str]
+    ) -> tuple[str, dict[str, str]]:
+        hash_to_related: dict[str, list[str]] = {}
+        for quad in self.blank_node_quads[blank_node]:
+            for position, term in (("s", quad[0]), ("o", quad[2]), ("g", quad[3])):
+                if term is not None and term.startswith("_:") and term != blank_node:
+                    hash_to_related.setdefault(
+                        self.hash_related_blank_node(term, quad, issuer, position),
+                        [],
+                    ).append(term)
+
+        canonical_issuer = self.canonical_issuer
+        data_to_hash = hashlib.sha256()
+        for related_hash, related_blank_nodes in sorted(hash_to_related.items()):
+            data_to_hash.update(related_hash.encode("utf-8"))
+
+            chosen_path = ""
+            chosen_issuer = None
+            for permutation in permutations(related_blank_nodes):
+                issuer_copy = issuer.copy()
+                path = ""
+                recursion_list = []
+
+                for related in permutation:
+                    if related in canonical_issuer:
+                        path += canonical_issuer[related]
+                    else:
+                        if related not in issuer_copy:
+                            recursion_list.append(related)
+                            issuer_copy[related] = TEMPORARY_PREFIX + str(
+                                len(issuer_copy)
+                            )
+                        path += issuer_copy[related]
+
+                    if (
+                        chosen_path
+                        and len(path) >= len(chosen_path)
+                        and path > chosen_path
+                    ):
+                        break
+                else:
+                    for related in recursion_list:
+                        result_hash, issuer_copy = self.hash_n_degree_quads(
+                            related, issuer_copy
+                        )
+                        path += issuer_copy[related] + "<" + result_hash + ">"
+
+                        if (
+                            chosen_path
+                            and len(path) >= len(chosen_path)
+                            and path > chosen_path
+                        ):
+                            break
+                    else:
+                        if not chosen_path or path < chosen_path:
+                            chosen_path = path
+                            chosen_issuer = issuer_copy
+
+            data_to_hash.update(chosen_path.encode("utf-8"))
+            issuer = chosen_issuer
+
+        return data_to_hash.hexdigest(), issuer
+
+    def _group_by_first_degree_hash(self) -> dict[str, list[str]]:
+        hash_to_blank_nodes: dict[str, list[str]] = {}
+        for blank_node in self.blank_node_quads:
+            hash_to_blank_nodes.setdefault(
+                self.hash_first_degree_quads(blank_node), []
+            ).append(blank_node)
+
+        return hash_to_blank_nodes
+
+    def _issue_canonical_id(self, blank_node: str) -> None:
+        if blank_node not in self.canonical_issuer:
+            self.canonical_issuer[blank_node] = CANONICAL_PREFIX + str(
+                len(self.canonical_issuer)
+            )
+
+
+def permutations(elements: list[str]) -> Iterator[tuple[str, ...]]:
+    """
+    Steinhaus-Johnson-Trotter permutations, generated in the same order as in
+    pyld. The order decides which issuer is chosen when several permutations
+    produce the same path.
+    """
+    elements = sorted(elements)
+    left = dict.fromkeys(elements, True)
+    last = len(elements) - 1
+
+    while True:
+        yield tuple(elements)
+
+        # Find the largest mobile element, the one greater than its neighbour
+        # in the direction it's looking at
+        mobile, mobile_index = None, 0
+        for i, element in enumerate(elements):
+            if (mobile is None or element > mobile) and (
+                (left[element] and i > 0 and element > elements[i - 1])
+                or (not left[element] and i < last and element > elements[i + 1])
+            ):
+                mobile, mobile_index = element, i
+
+        if mobile is None:
+            return
+
+        swap_index = mobile_index - 1 if left[mobile] else mobile_index + 1
+        elements[mobile_index], elements[swap_index] = elements[swap_index], mobile
+
+        for element in elements:
+            if element > mobile:
+                left[element] = not left[element]
+
+
+def _split_lines(n_quads: str) -> list[str]:
+    if "\r" not in n_quads:
+        return n_quads.split("\n")
+
+    return LINE_SEPARATOR_PATTERN.split(n_quads)
+
+
+def _serialize_term(term: dict[str, str]) -> str:
+    match term["type"]:
+        case "IRI":
+            return sys.intern("<" + term["value"] + ">")
+        case "blank node":
+            return sys.intern(term["value"])
+
+    return _serialize_literal(
+        term["value"],
+        term["datatype"],
+        term.get("language"),
+    )
+
+
+def _serialize_literal(value: str, datatype: str, language: str | None) -> str:
+    value = _escape_literal(value)
+
+    if datatype == RDF_LANGSTRING:
+        return f'"{value}"@{language}' if language else f'"{value}"'
+    elif datatype != XSD_STRING:
+        return f'"{value}"^^<{datatype}>'
+
+    return f'"{value}"'
+
+
+def _escape_literal(value: str) -> str:
+    if "\\" in value or "\t" in value or "\n" in value or "\r" in value:
+        value = (
+            value.replace("\\", "\\\\")
+            .replace("\t", "\\t")
+            .replace("\n", "\\n")
+            .replace("\r", "\\r")
+        )
+    if '"' in value:
+        value = value.replace('"', '\\"')
+
+    return value
+
+
+def _unescape_literal(value: str) -> str:
+    if "\\" not in value:
+        return value
+
+    # Escapes are replaced one kind at a time, same as in pyld
+    return (
+        value.replace('\\"', '"')
+        .replace("\\t", "\t")
+        .replace("\\n", "\n")
+        .replace("\\r", "\r")
+        .replace("\\\\", "\\")
+    )
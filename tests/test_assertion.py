@@ -0,0 +1,49 @@
+# Licensed to the Apache Software Foundation (ASF) under one
+# or more contributor license agreements.  See the NOTICE file
+# distributed with this work for additional information
+# regarding copyright ownership.  The ASF licenses this file
+# to you under the Apache License, Version 2.0 (the
+# "License"); you may not use this file except in compliance
+# with the License.  You may obtain a copy of the License at
+
+#   http://www.apache.org/licenses/LICENSE-2.0
+
+# Unless required by applicable law or agreed to in writing,
+# software distributed under the License is distributed on an
+# "AS IS" BASIS, WITHOUT WARRANTIES OR CONDITIONS OF ANY
+# KIND, either express or implied.  See the License for the
+# specific language governing permissions and limitations
+# under the License.
+
+import multiprocessing
+from concurrent.futures import ProcessPoolExecutor
+from functools import partial
+
+from dkg import assertion
+from dkg.assertion import Assertion
+from dkg.utils import rdf
+from dkg.utils.rdf import NormalizationCache, prepare_content
+
+BACKEND_QUAD = '<urn:dkg:backend> <http://schema.org/name> "stub" .'
+
+
+def canonicalize_with_stub(dataset, normalization_options):
+    return [BACKEND_QUAD]
+
+
+def test_prepare_many_uses_backend_set_at_runtime_in_spawned_workers(monkeypatch):
+    monkeypatch.setitem(rdf.canonicalization_backends, "stub", canonicalize_with_stub)
+    monkeypatch.setattr(rdf, "default_canonicalization_backend", "stub")
+    monkeypatch.setattr(rdf, "normalization_cache", NormalizationCache())
+    # Spawned workers start from a fresh interpreter, unlike forked ones
+    monkeypatch.setattr(
+        assertion,
+        "ProcessPoolExecutor",
+        partial(ProcessPoolExecutor, mp_context=multiprocessing.get_context("spawn")),
+    )
+    contents = [{"public": {"@id": f"urn:dkg:{i}", "name": str(i)}} for i in range(4)]
+
+    prepared = Assertion(None).prepare_many(contents, max_workers=2)
+
+    assert prepared == [prepare_content(content) for content in contents]
+    assert all(item.public == (BACKEND_QUAD,) for item in prepared)
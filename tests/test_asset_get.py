@@ -0,0 +1,149 @@
+# Licensed to the Apache Software Foundation (ASF) under one
+# or more contributor license agreements.  See the NOTICE file
+# distributed with this work for additional information
+# regarding copyright ownership.  The ASF licenses this file
+# to you under the Apache License, Version 2.0 (the
+# "License"); you may not use this file except in compliance
+# with the License.  You may obtain a copy of the License at
+
+#   http://www.apache.org/licenses/LICENSE-2.0
+
+# Unless required by applicable law or agreed to in writing,
+# software distributed under the License is distributed on an
+# "AS IS" BASIS, WITHOUT WARRANTIES OR CONDITIONS OF ANY
+# KIND, either express or implied.  See the License for the
+# specific language governing permissions and limitations
+# under the License.
+
+from contextlib import contextmanager
+
+import pytest
+from web3 import Web3
+
+from dkg.asset import KnowledgeAsset
+from dkg.exceptions import InvalidKnowledgeAsset
+from dkg.manager import DefaultRequestManager
+from dkg.utils import cache
+from dkg.utils.polling import OperationPoller
+from dkg.utils.rdf import prepare_content
+
+UAL = "did:dkg:base:8453/0x" + "11" * 20 + "/1"
+ASSERTION = prepare_content(
+    {
+        "public": {
+            "@context": {"@vocab": "http://schema.org/"},
+            "@id": "urn:a",
+            "name": "a",
+        }
+    }
+)
+OTHER_ASSERTION = prepare_content(
+    {
+        "public": {
+            "@context": {"@vocab": "http://schema.org/"},
+            "@id": "urn:b",
+            "name": "b",
+        }
+    }
+)
+
+
+class StubChain:
+    @contextmanager
+    def batch(self):
+        yield
+
+    @contextmanager
+    def deferred(self, defer: bool = True, multicall: bool = True):
+        yield
+
+    def make_json_rpc_request(self, endpoint, args={}):
+        assert endpoint == "get_block_number"
+        return 100
+
+    def call_function(self, contract, function, args={}, **kwargs):
+        assert function == "getAssertionIds"
+        return [Web3.to_bytes(hexstr=ASSERTION.public_assertion_id)]
+
+
+class StubNode:
+    def __init__(self, assertion):
+        self.assertion = assertion
+        self.gets = 0
+        self.poller = OperationPoller()
+
+    def make_request(self, method, path, params={}, data={}):
+        if path == "get":
+            self.gets += 1
+            return {"operationId": f"get-{self.gets}"}
+
+        return {"status": "COMPLETED", "data": {"assertion": list(self.assertion)}}
+
+
+@pytest.fixture
+def assertion_cache(monkeypatch):
+    monkeypatch.setattr(cache, "assertion_cache", None)
+
+    return cache.configure_assertion_cache()
+
+
+def get(node: StubNode, **kwargs) -> dict:
+    asset = KnowledgeAsset(DefaultRequestManager(node, StubChain()))
+
+    return asset.get(
+        UAL,
+        state=ASSERTION.public_assertion_id,
+        content_visibility="public",
+        **kwargs,
+    )
+
+
+def test_assertions_arent_cached_by_default(monkeypatch):
+    monkeypatch.setattr(cache, "assertion_cache", None)
+    node = StubNode(ASSERTION.public)
+
+    for i in range(1, 3):
+        assert get(node)["operation"]["publicGet"]["operationId"] == f"get-{i}"
+
+    assert node.gets == 2
+
+
+def test_cache_hit_is_reported_as_public_get(assertion_cache):
+    node = StubNode(ASSERTION.public)
+
+    miss = get(node)
+    assert miss["operation"]["publicGet"] == {
+        "operationId": "get-1",
+        "status": "COMPLETED",
+    }
+    assert assertion_cache.get(ASSERTION.public_assertion_id) == list(ASSERTION.public)
+
+    hit = get(node)
+    assert hit["operation"]["publicGet"] == {
+        "cached": True,
+        "assertionId": ASSERTION.public_assertion_id,
+    }
+    assert hit["asertion"] == miss["asertion"]
+    assert node.gets == 1
+
+    get(node, use_cache=False)
+    assert node.gets == 2
+
+
+def test_unvalidated_assertions_arent_cached(assertion_cache):
+    node = StubNode(ASSERTION.public)
+
+    get(node, validate=False)
+    get(node, validate=False)
+
+    assert assertion_cache.get(ASSERTION.public_assertion_id) is None
+    assert node.gets == 2
+
+
+def test_invalid_assertions_arent_cached(assertion_cache):
+    node = StubNode(OTHER_ASSERTION.public)
+
+    with pytest.raises(InvalidKnowledgeAsset):
+        get(node)
+
+    assert assertion_cache.get(ASSERTION.public_assertion_id) is None
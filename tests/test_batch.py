@@ -0,0 +1,231 @@
+# Licensed to the Apache Software Foundation (ASF) under one
+# or more contributor license agreements.  See the NOTICE file
+# distributed with this work for additional information
+# regarding copyright ownership.  The ASF licenses this file
+# to you under the Apache License, Version 2.0 (the
+# "License"); you may not use this file except in compliance
+# with the License.  You may obtain a copy of the License at
+
+#   http://www.apache.org/licenses/LICENSE-2.0
+
+# Unless required by applicable law or agreed to in writing,
+# software distributed under the License is distributed on an
+# "AS IS" BASIS, WITHOUT WARRANTIES OR CONDITIONS OF ANY
+# KIND, either express or implied.  See the License for the
+# specific language governing permissions and limitations
+# under the License.
+
+import pytest
+from eth_abi import encode
+from web3 import Web3
+from web3.exceptions import ContractLogicError
+from web3.providers import BaseProvider
+
+from dkg.constants import BLOCKCHAINS
+from dkg.providers import BlockchainProvider
+from dkg.providers.batch import BatchedCall, BatchedRequest
+from dkg.providers.multicall import MULTICALL3_ABI
+
+BLOCKCHAIN_ID = "base:84532"
+CHAIN_ID = 84532
+MULTICALL_ADDRESS = BLOCKCHAINS["testnet"][BLOCKCHAIN_ID]["multicall"]
+ASSET_STORAGE = {
+    "name": "ContentAssetStorage",
+    "address": Web3.to_checksum_address("0x" + "11" * 20),
+}
+# Token IDs whose owner lookup reverts
+MISSING_TOKEN_IDS = {13}
+
+
+def owner_of(token_id: int) -> str:
+    return Web3.to_checksum_address(f"0x{token_id:040x}")
+
+
+class StubChain:
+    """
+    Answers JSON-RPC requests for a chain with Multicall3 and a content asset
+    storage, both sent on their own and in batches. Batch responses are
+    returned in reverse order, and responses for `dropped_ids` are left out.
+    """
+
+    def __init__(self, abi: dict):
+        w3 = Web3()
+        self.asset_storage = w3.eth.contract(abi=abi["ContentAssetStorage"])
+        self.multicall = w3.eth.contract(abi=MULTICALL3_ABI)
+
+        self.batch_sizes: list[int] = []
+        self.single_requests: list[str] = []
+        self.dropped_ids: set[int] = set()
+
+    def post(self, url, json, timeout=None):
+        self.batch_sizes.append(len(json))
+        responses = [
+            {"jsonrpc": "2.0", "id": request["id"], **self.respond(request)}
+            for request in json
+            if request["id"] not in self.dropped_ids
+        ]
+
+        return StubResponse(list(reversed(responses)))
+
+    def make_request(self, method, params):
+        self.single_requests.append(method)
+
+        return {"jsonrpc": "2.0", "id": 0, **self.respond(request_of(method, params))}
+
+    def respond(self, request: dict) -> dict:
+        match request["method"]:
+            case "eth_chainId":
+                return {"result": hex(CHAIN_ID)}
+            case "eth_getBlockByNumber":
+                return {"error": {"code": -32000, "message": "header not found"}}
+            case "eth_call":
+                transaction = request["params"][0]
+                if transaction["to"].lower() == MULTICALL_ADDRESS.lower():
+                    return {"result": self.aggregate(transaction["data"])}
+
+                success, return_data = self.call(transaction["data"])
+                if not success:
+                    return {"error": {"code": 3, "message": "execution reverted"}}
+
+                return {"result": Web3.to_hex(return_data)}
+
+        raise AssertionError(f"Unexpected RPC request: {request['method']}")
+
+    def aggregate(self, data: str) -> str:
+        _, args = self.multicall.decode_function_input(data)
+
+        return Web3.to_hex(
+            encode(
+                ["(bool,bytes)[]"],
+                [[self.call(call["callData"]) for call in args["calls"]]],
+            )
+        )
+
+    def call(self, data: str | bytes) -> tuple[bool, bytes]:
+        function, args = self.asset_storage.decode_function_input(data)
+        assert function.fn_name == "ownerOf"
+
+        if args["tokenId"] in MISSING_TOKEN_IDS:
+            return False, b""
+
+        return True, encode(["address"], [owner_of(args["tokenId"])])
+
+
+class StubResponse:
+    def __init__(self, data):
+        self.data = data
+
+    def raise_for_status(self):
+        pass
+
+    def json(self):
+        return self.data
+
+
+class StubRPC(BaseProvider):
+    def __init__(self, chain: StubChain):
+        self.chain = chain
+
+    def make_request(self, method, params):
+        return self.chain.make_request(method, params)
+
+    def is_connected(self, show_traceback: bool = False) -> bool:
+        return True
+
+
+def request_of(method: str, params: list) -> dict:
+    return {"method": method, "params": params}
+
+
+@pytest.fixture
+def provider():
+    provider = BlockchainProvider(
+        "testnet", BLOCKCHAIN_ID, rpc_uri="http://127.0.0.1:1", cache_contracts=False
+    )
+    provider.chain = StubChain(provider.abi)
+    provider.w3 = Web3(StubRPC(provider.chain), middlewares=[])
+    provider.rpc_session = provider.chain
+
+    return provider
+
+
+def get_owners(provider: BlockchainProvider, token_ids: list[int]) -> list:
+    with provider.batch(), provider.deferred():
+        owners = [
+            provider.call_function(ASSET_STORAGE, "ownerOf", {"tokenId": token_id})
+            for token_id in token_ids
+        ]
+        chain_id = provider.make_json_rpc_request("chain_id")
+        block = provider.make_json_rpc_request(
+            "get_block", {"block_identifier": "latest"}
+        )
+
+    assert all(isinstance(owner, BatchedCall) for owner in owners)
+    assert isinstance(chain_id, BatchedRequest)
+
+    assert chain_id.result() == CHAIN_ID
+    with pytest.raises(ValueError, match="header not found"):
+        block.result()
+
+    return owners
+
+
+def assert_owners(owners: list, token_ids: list[int]) -> None:
+    for token_id, owner in zip(token_ids, owners):
+        if token_id in MISSING_TOKEN_IDS:
+            with pytest.raises(ContractLogicError):
+                owner.result()
+        else:
+            assert owner.result() == owner_of(token_id)
+
+
+def test_multicall_results_are_matched_to_calls(provider):
+    token_ids = list(range(1, 21))
+
+    owners = get_owners(provider, token_ids)
+
+    assert_owners(owners, token_ids)
+    # One aggregated call and two requests, the reverted call is retried on its
+    # own to surface the revert reason
+    assert provider.chain.batch_sizes == [3]
+    assert provider.chain.single_requests == ["eth_call"]
+
+
+def test_batches_are_chunked_and_matched_by_id(provider):
+    provider.multicall = None
+    token_ids = list(range(1, 202))
+
+    owners = get_owners(provider, token_ids)
+
+    assert_owners(owners, token_ids)
+    assert provider.chain.batch_sizes == [100, 100, 3]
+    assert provider.chain.single_requests == ["eth_call"]
+
+
+def test_missing_responses_are_requested_on_their_own(provider):
+    provider.multicall = None
+    provider.chain.dropped_ids = {0, 2}
+    token_ids = [1, 2, 3]
+
+    owners = get_owners(provider, token_ids)
+
+    assert_owners(owners, token_ids)
+    assert provider.chain.single_requests == ["eth_call", "eth_call"]
+
+
+def test_unsupported_batches_fall_back_to_single_requests(provider):
+    def post(url, json, timeout=None):
+        raise ValueError("Batch requests aren't supported")
+
+    provider.rpc_session = type("Session", (), {"post": staticmethod(post)})
+    token_ids = [1, 13]
+
+    owners = get_owners(provider, token_ids)
+
+    assert_owners(owners, token_ids)
+    assert provider.chain.single_requests == [
+        "eth_call",
+        "eth_call",
+        "eth_chainId",
+        "eth_getBlockByNumber",
+    ]
@@ -0,0 +1,122 @@
+# Licensed to the Apache Software Foundation (ASF) under one
+# or more contributor license agreements.  See the NOTICE file
+# distributed with this work for additional information
+# regarding copyright ownership.  The ASF licenses this file
+# to you under the Apache License, Version 2.0 (the
+# "License"); you may not use this file except in compliance
+# with the License.  You may obtain a copy of the License at
+
+#   http://www.apache.org/licenses/LICENSE-2.0
+
+# Unless required by applicable law or agreed to in writing,
+# software distributed under the License is distributed on an
+# "AS IS" BASIS, WITHOUT WARRANTIES OR CONDITIONS OF ANY
+# KIND, either express or implied.  See the License for the
+# specific language governing permissions and limitations
+# under the License.
+
+import threading
+
+import pytest
+from web3 import Web3
+from web3.providers import BaseProvider
+
+from dkg.constants import BLOCKCHAINS
+from dkg.exceptions import NetworkNotSupported
+from dkg.providers import BlockchainProvider
+
+BLOCK_NUMBER = 200
+
+
+class StubRPC(BaseProvider):
+    def __init__(self, chain_id: int):
+        self.chain_id = chain_id
+        self.requests = []
+
+    def make_request(self, method, params):
+        self.requests.append(method)
+        if method == "eth_chainId":
+            return {"jsonrpc": "2.0", "id": 1, "result": hex(self.chain_id)}
+        if method == "eth_blockNumber":
+            return {"jsonrpc": "2.0", "id": 1, "result": hex(BLOCK_NUMBER)}
+
+        raise AssertionError(f"Unexpected RPC request: {method}")
+
+    def is_connected(self, show_traceback: bool = False) -> bool:
+        return True
+
+
+def create_provider(blockchain_id: str, chain_id: int) -> BlockchainProvider:
+    provider = BlockchainProvider(
+        "testnet",
+        blockchain_id,
+        rpc_uri="http://127.0.0.1:1",
+        cache_contracts=False,
+    )
+    provider.w3 = Web3(StubRPC(chain_id))
+
+    return provider
+
+
+def test_chain_id_is_resolved_on_first_use():
+    provider = create_provider("base", 84532)
+    assert provider.w3.provider.requests == []
+
+    assert provider.blockchain_id == "base:84532"
+    assert provider.contracts["Hub"].address == (
+        BLOCKCHAINS["testnet"]["base:84532"]["hub"]
+    )
+    assert provider.multicall is not None
+    assert provider.w3.provider.requests == ["eth_chainId"]
+
+
+def test_unsupported_chain_id_is_reported_on_every_use():
+    provider = create_provider("base", 1)
+
+    for _ in range(2):
+        with pytest.raises(NetworkNotSupported):
+            provider.blockchain_id
+
+    assert provider.w3.provider.requests == ["eth_chainId", "eth_chainId"]
+
+
+def is_locked(lock: threading.RLock) -> bool:
+    # Lock is checked from another thread, as the RLock is reentrant
+    results = []
+
+    def try_acquire():
+        is_acquired = lock.acquire(blocking=False)
+        if is_acquired:
+            lock.release()
+        results.append(not is_acquired)
+
+    thread = threading.Thread(target=try_acquire)
+    thread.start()
+    thread.join()
+
+    return results[0]
+
+
+def test_contract_addresses_are_resolved_outside_lock(monkeypatch):
+    provider = create_provider("base", 84532)
+    address = Web3.to_checksum_address("0x" + "11" * 20)
+    locked = []
+
+    def resolve_contract_addresses(contracts):
+        locked.append(is_locked(provider.contracts._lock))
+        return {contract: address for contract in contracts}, 100
+
+    def get_hub_logs(from_block, to_block):
+        locked.append(is_locked(provider.contracts._lock))
+        return []
+
+    monkeypatch.setattr(
+        provider, "_resolve_contract_addresses", resolve_contract_addresses
+    )
+    monkeypatch.setattr(provider, "_get_hub_logs", get_hub_logs)
+
+    assert provider.contracts["ContentAssetStorage"].address == address
+    provider.sync_contract_addresses()
+
+    assert locked == [False, False]
+    assert provider._contracts_cache["ContentAssetStorage"]["block"] == BLOCK_NUMBER
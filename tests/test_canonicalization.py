@@ -0,0 +1,292 @@
+# Licensed to the Apache Software Foundation (ASF) under one
+# or more contributor license agreements.  See the NOTICE file
+# distributed with this work for additional information
+# regarding copyright ownership.  The ASF licenses this file
+# to you under the Apache License, Version 2.0 (the
+# "License"); you may not use this file except in compliance
+# with the License.  You may obtain a copy of the License at
+
+#   http://www.apache.org/licenses/LICENSE-2.0
+
+# Unless required by applicable law or agreed to in writing,
+# software distributed under the License is distributed on an
+# "AS IS" BASIS, WITHOUT WARRANTIES OR CONDITIONS OF ANY
+# KIND, either express or implied.  See the License for the
+# specific language governing permissions and limitations
+# under the License.
+
+import json
+import os
+import random
+import re
+from pathlib import Path
+
+import pytest
+
+from dkg.utils import rdf, urdna2015
+from dkg.utils.rdf import (
+    NormalizationCache,
+    canonicalize_with_pyld,
+    canonicalize_with_urdna2015,
+    normalize_dataset,
+)
+
+NQUADS_OPTIONS = {
+    "algorithm": "URDNA2015",
+    "format": "application/n-quads",
+    "inputFormat": "application/n-quads",
+}
+JSONLD_OPTIONS = {"algorithm": "URDNA2015", "format": "application/n-quads"}
+
+# Checkout of https://github.com/w3c/rdf-canon/tree/main/tests, the URDNA2015
+# conformance tests are skipped if it isn't available
+RDF_CANON_TESTS_DIR = os.environ.get("RDF_CANON_TESTS_DIR")
+
+LITERALS = [
+    '"x"',
+    '"a\\"b"',
+    '"tab\\there"',
+    '"line\\nbreak"',
+    '"back\\\\slash"',
+    '"v"@en',
+    '"v"@en-US',
+    '"1"^^<http://www.w3.org/2001/XMLSchema#integer>',
+    '"s"^^<http://www.w3.org/2001/XMLSchema#string>',
+    '"  spaces "',
+]
+
+
+def ring(prefix: str, size: int) -> str:
+    return "\n".join(
+        f"_:{prefix}{i} <http://ex/p> _:{prefix}{(i + 1) % size} ." for i in range(size)
+    )
+
+
+def random_dataset(seed: int) -> str:
+    rng = random.Random(seed)
+    blank_nodes = [f"_:n{i}" for i in range(rng.randint(1, 8))]
+    predicates = [f"<http://ex/p{i}>" for i in range(rng.randint(1, 3))]
+
+    quads = []
+    for _ in range(rng.randint(1, 20)):
+        subject = rng.choice(blank_nodes + ["<http://ex/s>"])
+        obj = rng.choice(blank_nodes * 2 + LITERALS + ["<http://ex/o>"])
+        graph = ""
+        if rng.random() < 0.2:
+            graph = " " + rng.choice(blank_nodes[:2] + ["<http://ex/g>"])
+        quads.append(f"{subject} {rng.choice(predicates)} {obj}{graph} .")
+
+    return "\n".join(quads)
+
+
+NQUADS_DATASETS = {
+    "no-blank-nodes": "<http://ex/s> <http://ex/p> <http://ex/o> .",
+    "literals": "\n".join(
+        f"<http://ex/s> <http://ex/p> {literal} ." for literal in LITERALS
+    ),
+    "duplicate-quads": "_:x <http://ex/p> _:x .\n_:x <http://ex/p> _:x .",
+    "blank-node-graph": "_:x <http://ex/p> _:y _:g .\n_:y <http://ex/p> _:x _:g .",
+    "already-canonical": (
+        '_:c14n0 <http://ex/q> "a" .\n_:c14n1 <http://ex/p> _:c14n0 .'
+    ),
+    "mislabelled-canonical": (
+        '_:c14n1 <http://ex/p> _:c14n0 .\n_:c14n0 <http://ex/q> "a" .'
+    ),
+    "whitespace": '\r\n  <http://ex/a:b> <http://ex/p> "x"\t.  \r\n\n',
+    **{f"ring-{size}": ring("r", size) for size in range(2, 7)},
+    **{
+        f"two-rings-{size}": ring("a", size) + "\n" + ring("b", size) for size in (3, 5)
+    },
+    **{
+        f"clique-{size}": "\n".join(
+            f"_:c{i} <http://ex/p> _:c{j} ."
+            for i in range(size)
+            for j in range(size)
+            if i != j
+        )
+        for size in range(2, 6)
+    },
+    **{f"random-{seed}": random_dataset(seed) for seed in range(50)},
+}
+
+JSONLD_DATASETS = {
+    "nested": {
+        "@context": {"s": "http://schema.org/"},
+        "@id": "urn:a",
+        "s:knows": [{"s:name": "x", "s:knows": {"s:name": "y"}} for _ in range(4)],
+    },
+    "named-graph-list": {
+        "@context": {"s": "http://schema.org/"},
+        "@graph": [
+            {
+                "@id": "_:g",
+                "@graph": {
+                    "s:v": {
+                        "@list": [
+                            1,
+                            2.5,
+                            True,
+                            "a\nb",
+                            {"@value": "c", "@language": "en"},
+                        ]
+                    }
+                },
+            }
+        ],
+    },
+    "shared-blank-node": {
+        "@context": {"@vocab": "http://ex/"},
+        "a": {"b": {"c": {"@id": "_:x", "d": {"@id": "_:x"}}}},
+    },
+}
+
+
+def has_unique_first_degree_hashes(dataset: str) -> bool:
+    canonicalization = urdna2015.URDNA2015(urdna2015.parse_nquads(dataset))
+
+    return len(
+        {
+            canonicalization.hash_first_degree_quads(blank_node)
+            for blank_node in canonicalization.blank_node_quads
+        }
+    ) == len(canonicalization.blank_node_quads)
+
+
+CANONICAL_NQUADS_DATASETS = {
+    "no-blank-nodes": NQUADS_DATASETS["no-blank-nodes"],
+    "duplicate-quads": "<http://ex/s> <http://ex/p> _:c14n0 .\n" * 2,
+    "already-canonical": NQUADS_DATASETS["already-canonical"],
+    "unsorted-canonical": NQUADS_DATASETS["mislabelled-canonical"],
+}
+NON_CANONICAL_NQUADS_DATASETS = {
+    name: NQUADS_DATASETS[name]
+    for name in ("literals", "duplicate-quads", "whitespace")
+}
+for name, dataset in NQUADS_DATASETS.items():
+    if name.startswith(("ring-", "clique-", "random-")):
+        canonical_dataset = "\n".join(
+            canonicalize_with_urdna2015(dataset, NQUADS_OPTIONS)
+        )
+        # Labels can only be confirmed without the full canonicalization if
+        # blank nodes are told apart by their first degree hashes
+        if has_unique_first_degree_hashes(canonical_dataset):
+            CANONICAL_NQUADS_DATASETS[f"canonical-{name}"] = canonical_dataset
+        else:
+            NON_CANONICAL_NQUADS_DATASETS[f"canonical-{name}"] = canonical_dataset
+
+
+def relabel(dataset: str) -> str:
+    blank_nodes = sorted(set(re.findall(r"_:\w+", dataset)), reverse=True)
+    labels = {blank_node: f"_:c14n{i}" for i, blank_node in enumerate(blank_nodes)}
+
+    return re.sub(r"_:\w+", lambda match: labels[match.group(0)], dataset)
+
+
+@pytest.fixture
+def count_backend_calls(monkeypatch):
+    monkeypatch.setattr(rdf, "normalization_cache", NormalizationCache())
+
+    calls = []
+    for name, backend in list(rdf.canonicalization_backends.items()):
+
+        def counting_backend(dataset, options, name=name, backend=backend):
+            calls.append(name)
+            return backend(dataset, options)
+
+        monkeypatch.setitem(rdf.canonicalization_backends, name, counting_backend)
+
+    return calls
+
+
+def load_rdf_canon_tests() -> list:
+    if RDF_CANON_TESTS_DIR is None:
+        return []
+
+    tests_dir = Path(RDF_CANON_TESTS_DIR)
+    with open(tests_dir / "manifest.jsonld") as manifest_file:
+        manifest = json.load(manifest_file)
+
+    return [
+        pytest.param(
+            tests_dir / entry["action"],
+            tests_dir / entry["result"],
+            id=entry["id"].lstrip("#"),
+        )
+        for entry in manifest["entries"]
+        if entry["type"].endswith("RDFC10EvalTest")
+        and entry.get("hashAlgorithm", "SHA256") == "SHA256"
+    ]
+
+
+@pytest.mark.parametrize(
+    "dataset", NQUADS_DATASETS.values(), ids=NQUADS_DATASETS.keys()
+)
+def test_nquads_match_pyld(dataset):
+    assert canonicalize_with_urdna2015(
+        dataset, NQUADS_OPTIONS
+    ) == canonicalize_with_pyld(dataset, NQUADS_OPTIONS)
+
+
+@pytest.mark.parametrize(
+    "dataset", JSONLD_DATASETS.values(), ids=JSONLD_DATASETS.keys()
+)
+def test_jsonld_matches_pyld(dataset):
+    assert canonicalize_with_urdna2015(
+        dataset, JSONLD_OPTIONS
+    ) == canonicalize_with_pyld(dataset, JSONLD_OPTIONS)
+
+
+@pytest.mark.parametrize(
+    "dataset",
+    CANONICAL_NQUADS_DATASETS.values(),
+    ids=CANONICAL_NQUADS_DATASETS.keys(),
+)
+def test_normalize_dataset_skips_backend_for_canonical_nquads(
+    dataset, count_backend_calls
+):
+    expected = canonicalize_with_pyld(dataset, NQUADS_OPTIONS)
+
+    assert normalize_dataset(dataset.split("\n"), "N-Quads") == expected
+    assert count_backend_calls == []
+
+
+@pytest.mark.parametrize("name", ["already-canonical", "ring-4", "random-3"])
+def test_normalize_dataset_relabels_c14n_with_backend(name, count_backend_calls):
+    dataset = relabel(NQUADS_DATASETS[name])
+
+    # pyld keeps `_:c14n` labels from the input, so unlike the in-tree
+    # implementation it doesn't relabel them to their canonical order
+    pyld_result = canonicalize_with_pyld(dataset, NQUADS_OPTIONS)
+    urdna2015_result = canonicalize_with_urdna2015(dataset, NQUADS_OPTIONS)
+    assert pyld_result != urdna2015_result
+
+    assert normalize_dataset(dataset, "N-Quads") == pyld_result
+    assert normalize_dataset(dataset, "N-Quads", "urdna2015") == urdna2015_result
+    assert count_backend_calls == ["pyld", "urdna2015"]
+
+
+@pytest.mark.parametrize(
+    "dataset",
+    NON_CANONICAL_NQUADS_DATASETS.values(),
+    ids=NON_CANONICAL_NQUADS_DATASETS.keys(),
+)
+def test_normalize_dataset_canonicalizes_non_canonical_nquads(
+    dataset, count_backend_calls
+):
+    expected = canonicalize_with_pyld(dataset, NQUADS_OPTIONS)
+
+    assert normalize_dataset(dataset, "N-Quads") == expected
+    assert count_backend_calls == ["pyld"]
+
+
+@pytest.mark.skipif(RDF_CANON_TESTS_DIR is None, reason="RDF_CANON_TESTS_DIR isn't set")
+@pytest.mark.parametrize("input_path,expected_path", load_rdf_canon_tests())
+def test_rdf_canon_conformance(input_path, expected_path):
+    dataset = input_path.read_text(encoding="utf-8")
+    expected = expected_path.read_text(encoding="utf-8")
+
+    for backend in (canonicalize_with_urdna2015, canonicalize_with_pyld):
+        assert (
+            "".join(quad + "\n" for quad in backend(dataset, NQUADS_OPTIONS))
+            == expected
+        )
@@ -0,0 +1,41 @@
+# Licensed to the Apache Software Foundation (ASF) under one
+# or more contributor license agreements.  See the NOTICE file
+# distributed with this work for additional information
+# regarding copyright ownership.  The ASF licenses this file
+# to you under the Apache License, Version 2.0 (the
+# "License"); you may not use this file except in compliance
+# with the License.  You may obtain a copy of the License at
+
+#   http://www.apache.org/licenses/LICENSE-2.0
+
+# Unless required by applicable law or agreed to in writing,
+# software distributed under the License is distributed on an
+# "AS IS" BASIS, WITHOUT WARRANTIES OR CONDITIONS OF ANY
+# KIND, either express or implied.  See the License for the
+# specific language governing permissions and limitations
+# under the License.
+
+import json
+import subprocess
+import sys
+from pathlib import Path
+
+# Heavy dependencies are imported when they're first used, not by `import dkg`
+LAZY_MODULES = ["pandas", "rdflib", "rdflib.plugins.sparql", "pyld"]
+
+
+def test_import_dkg_doesnt_load_lazy_modules():
+    output = subprocess.run(
+        [
+            sys.executable,
+            "-c",
+            "import json, sys, dkg; "
+            f"print(json.dumps([m for m in {LAZY_MODULES!r} if m in sys.modules]))",
+        ],
+        cwd=Path(__file__).parent.parent,
+        capture_output=True,
+        text=True,
+        check=True,
+    )
+
+    assert json.loads(output.stdout) == []
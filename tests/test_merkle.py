@@ -0,0 +1,264 @@
+# Licensed to the Apache Software Foundation (ASF) under one
+# or more contributor license agreements.  See the NOTICE file
+# distributed with this work for additional information
+# regarding copyright ownership.  The ASF licenses this file
+# to you under the Apache License, Version 2.0 (the
+# "License"); you may not use this file except in compliance
+# with the License.  You may obtain a copy of the License at
+
+#   http://www.apache.org/licenses/LICENSE-2.0
+
+# Unless required by applicable law or agreed to in writing,
+# software distributed under the License is distributed on an
+# "AS IS" BASIS, WITHOUT WARRANTIES OR CONDITIONS OF ANY
+# KIND, either express or implied.  See the License for the
+# specific language governing permissions and limitations
+# under the License.
+
+import itertools
+
+import pytest
+from hexbytes import HexBytes
+
+from dkg.utils.merkle import (
+    AssertionMerkleTree,
+    MerkleTree,
+    build_merkle_levels,
+    calculate_merkle_root,
+    hash_assertion_leaves,
+    hash_assertion_with_indexes,
+    solidity_keccak256,
+    stream_assertion_root,
+)
+
+
+def quad(i: int) -> str:
+    return f'<urn:dkg:s{i}> <http://schema.org/name> "Name {i}" .'
+
+
+ASSERTIONS = {
+    "single": [quad(0)],
+    "even": [quad(i) for i in range(8)],
+    "odd": [quad(i) for i in range(5)],
+    "duplicate-quads": [quad(0), quad(1), quad(0), quad(2), quad(1), quad(0)],
+}
+ODD_LEAVES = [
+    "0xc1f642d5582edc1517e7bab006a227450e49cbb9ca6ff3497a1deed26d70b078",
+    "0x708e1733c3cdd3b20160bdc3fb9babd665fa853fbf9c25929c586a1930d9a116",
+    "0xda2499057d338d08e09c8b4f93d776b4059803e11b0c9613e1ce12195f647eed",
+    "0xaf702ad678c3c1956ecbb15e1c652042544547a982ff35f71dd1e6ca3c66ca4f",
+    "0x90da79bb10070731ca9a129bce96b54659917b61c4f0b3a07dd1811ed5d75bf4",
+]
+DUPLICATE_LEAVES = [ODD_LEAVES[i] for i in (0, 1, 0, 2, 0)]
+
+# Roots of the assertions and proofs of their last leaves, as computed by the
+# hex string implementation of the Merkle Tree
+KNOWN_TREES = [
+    pytest.param(
+        "single",
+        True,
+        "0xc1f642d5582edc1517e7bab006a227450e49cbb9ca6ff3497a1deed26d70b078",
+        [],
+        id="single",
+    ),
+    pytest.param(
+        "even",
+        True,
+        "0xacf015d47f6ae3d45846e4bb5075ad4d87423458143f75760fc86ac64003efe8",
+        [
+            "0x0611a7e68b88c1ffa0c950bf32d2fd66a5d61f1b9e7ac58fcb961213d444fe40",
+            "0x4d2d9c934f99a04146d8107780035ffad51fff34500101079b11510104aec280",
+            "0x928b3e268e56599db13c92118cf1260a5d902c86d5a4158225be98aef675e30a",
+        ],
+        id="even-sorted-pairs",
+    ),
+    pytest.param(
+        "even",
+        False,
+        "0x2d65479db4a96dff2a9a3601aff61aec9ec5d57f26ea12f1278fb43542138208",
+        [
+            "0x0611a7e68b88c1ffa0c950bf32d2fd66a5d61f1b9e7ac58fcb961213d444fe40",
+            "0x446512707878d455c0818d9e792726426160199c5b95a514bf99db2c557bc32f",
+            "0xe8a977fa72d9d01161cd0f4afe492892804f33d4424a8cb837ec463781888278",
+        ],
+        id="even",
+    ),
+    pytest.param(
+        "odd",
+        True,
+        "0x2cd7d11c1659e1d11ad262b35299f4487d634f5e53bdbd8ee60a0d2938578171",
+        [
+            "0x90da79bb10070731ca9a129bce96b54659917b61c4f0b3a07dd1811ed5d75bf4",
+            "0x90da79bb10070731ca9a129bce96b54659917b61c4f0b3a07dd1811ed5d75bf4",
+            "0x928b3e268e56599db13c92118cf1260a5d902c86d5a4158225be98aef675e30a",
+        ],
+        id="odd-sorted-pairs",
+    ),
+    pytest.param(
+        "odd",
+        False,
+        "0xa9b77feb74dfb3b915ce87df20f41c87b5554dabae076a0a89bcbb7d5b7006a0",
+        [
+            "0x90da79bb10070731ca9a129bce96b54659917b61c4f0b3a07dd1811ed5d75bf4",
+            "0x90da79bb10070731ca9a129bce96b54659917b61c4f0b3a07dd1811ed5d75bf4",
+            "0xe8a977fa72d9d01161cd0f4afe492892804f33d4424a8cb837ec463781888278",
+        ],
+        id="odd",
+    ),
+    pytest.param(
+        "duplicate-quads",
+        True,
+        "0x6c96f91aed2efbb285da8aa3c1929a910b04452a77523edff7abcd57ff3b0830",
+        [
+            "0xb42364741535e9174fc15fb373c1397ecd190a5c2bb7dd5ad68fb15222dfff10",
+            "0x8dc45b6c898e9967ee19e936b03a406c27700a974f6e2110c40d6df435d21bd7",
+            "0xd6d1817743cc9c9ad7ca5b7c2b9bb336112de638f30773c15c59b8e64604fd8b",
+        ],
+        id="duplicate-quads-sorted-pairs",
+    ),
+    pytest.param(
+        "duplicate-quads",
+        False,
+        "0x963cf2bdc5bec114b9deba84c5631a0a2ddc64ec7f6223b86630b4df7fcc3d53",
+        [
+            "0xb42364741535e9174fc15fb373c1397ecd190a5c2bb7dd5ad68fb15222dfff10",
+            "0x8dc45b6c898e9967ee19e936b03a406c27700a974f6e2110c40d6df435d21bd7",
+            "0x402ccb3cadefa35deb50fcd29be1b67453b3c01815bb3b7003d7708b283d5607",
+        ],
+        id="duplicate-quads",
+    ),
+]
+ASSERTION_ROOTS = {
+    name: root
+    for name, sort_pairs, root, _ in (p.values for p in KNOWN_TREES)
+    if sort_pairs
+}
+# Duplicate leaves are proven by their first occurrence
+KNOWN_DUPLICATE_LEAVES_TREES = [
+    pytest.param(
+        True,
+        "0x31e0b2eb420a560dacf20b0767b026e011f1550a8325936b023b0bdf1bdaf9a3",
+        [
+            "0x708e1733c3cdd3b20160bdc3fb9babd665fa853fbf9c25929c586a1930d9a116",
+            "0xc0f9b09b377a507cd0c536877b25ebacd04b1db2eaa721c839a566912bdaae9e",
+            "0xc1f642d5582edc1517e7bab006a227450e49cbb9ca6ff3497a1deed26d70b078",
+        ],
+        id="sorted-pairs",
+    ),
+    pytest.param(
+        False,
+        "0xbe20524dd3e6a52286e82abe61fe1a6383eb70862a0ee0152abe5483115ad354",
+        [
+            "0x708e1733c3cdd3b20160bdc3fb9babd665fa853fbf9c25929c586a1930d9a116",
+            "0xc0f9b09b377a507cd0c536877b25ebacd04b1db2eaa721c839a566912bdaae9e",
+            "0xc1f642d5582edc1517e7bab006a227450e49cbb9ca6ff3497a1deed26d70b078",
+        ],
+        id="unsorted-pairs",
+    ),
+]
+
+
+def hex_keccak256(data: str) -> str:
+    # Any hash function other than the default one builds the hex string tree
+    return solidity_keccak256(data)
+
+
+def create_trees(leaves: list[str], sort_pairs: bool) -> list[MerkleTree]:
+    trees = [
+        MerkleTree(list(leaves), sort_pairs=sort_pairs),
+        MerkleTree(list(leaves), hash_function=hex_keccak256, sort_pairs=sort_pairs),
+    ]
+    assert trees[0].levels is not None
+    assert trees[1].levels is None
+
+    return trees
+
+
+def test_leaf_hashes_match_known_hashes():
+    quads = ASSERTIONS["odd"]
+
+    assert hash_assertion_with_indexes(list(quads)) == ODD_LEAVES
+    assert hash_assertion_with_indexes(list(quads), hex_keccak256) == ODD_LEAVES
+    assert hash_assertion_leaves(list(quads)) == b"".join(
+        HexBytes(leaf) for leaf in ODD_LEAVES
+    )
+
+
+@pytest.mark.parametrize("assertion, sort_pairs, root, proof", KNOWN_TREES)
+def test_merkle_tree_matches_known_root_and_proof(assertion, sort_pairs, root, proof):
+    leaves = hash_assertion_with_indexes(list(ASSERTIONS[assertion]))
+
+    for tree in create_trees(leaves, sort_pairs):
+        assert tree.root == root
+        assert tree.proof(leaves[-1]) == proof
+        assert tree.proofs()[-1] == proof
+        assert tree.verify(proof, leaves[-1])
+
+
+@pytest.mark.parametrize("sort_pairs, root, proof", KNOWN_DUPLICATE_LEAVES_TREES)
+def test_merkle_tree_with_duplicate_leaves_matches_known_root_and_proof(
+    sort_pairs, root, proof
+):
+    for tree in create_trees(DUPLICATE_LEAVES, sort_pairs):
+        assert tree.root == root
+        assert tree.proof(ODD_LEAVES[0]) == proof
+        assert tree.verify(proof, ODD_LEAVES[0])
+
+
+@pytest.mark.parametrize("assertion, sort_pairs, root, proof", KNOWN_TREES)
+def test_merkle_levels_match_known_root(assertion, sort_pairs, root, proof):
+    leaves = hash_assertion_with_indexes(list(ASSERTIONS[assertion]))
+    levels = build_merkle_levels(
+        b"".join(HexBytes(leaf) for leaf in leaves), sort_pairs
+    )
+
+    assert levels[-1] == HexBytes(root)
+    assert calculate_merkle_root(leaves, sort_pairs) == root
+
+
+@pytest.mark.parametrize("assertion", ASSERTIONS)
+@pytest.mark.parametrize("sort_chunk_size", [1, 2, 1_000])
+def test_streamed_assertion_root_matches_known_root(assertion, sort_chunk_size):
+    quads = ASSERTIONS[assertion]
+    lines = [f"{quad}\n" for quad in reversed(quads)]
+
+    root = stream_assertion_root(lines, sort_chunk_size=sort_chunk_size)
+
+    assert root == ASSERTION_ROOTS[assertion]
+    assert root == calculate_merkle_root(
+        hash_assertion_with_indexes(list(quads)), sort_pairs=True
+    )
+
+
+@pytest.mark.parametrize(
+    "previous_assertion, assertion", list(itertools.permutations(ASSERTIONS, 2))
+)
+def test_replaced_assertion_tree_matches_known_root(previous_assertion, assertion):
+    tree = AssertionMerkleTree(ASSERTIONS[previous_assertion])
+    assert tree.root == ASSERTION_ROOTS[previous_assertion]
+
+    update = tree.replace(ASSERTIONS[assertion])
+
+    assert update["previousRoot"] == ASSERTION_ROOTS[previous_assertion]
+    assert update["root"] == ASSERTION_ROOTS[assertion]
+    assert tree.levels == AssertionMerkleTree(ASSERTIONS[assertion]).levels
+
+
+@pytest.mark.parametrize(
+    "leaves",
+    [
+        hash_assertion_with_indexes(list(ASSERTIONS["even"])),
+        ODD_LEAVES,
+        DUPLICATE_LEAVES,
+    ],
+    ids=["even", "odd", "duplicate-leaves"],
+)
+@pytest.mark.parametrize("sort_pairs", [True, False])
+def test_multiproof_is_verified(leaves, sort_pairs):
+    for tree in create_trees(leaves, sort_pairs):
+        multiproof = tree.multiproof([leaves[-1], leaves[1]])
+
+        assert tree.verify_multiproof(multiproof)
+
+        multiproof["proof"] = multiproof["proof"][:-1]
+        assert not tree.verify_multiproof(multiproof)
@@ -0,0 +1,191 @@
+# Licensed to the Apache Software Foundation (ASF) under one
+# or more contributor license agreements.  See the NOTICE file
+# distributed with this work for additional information
+# regarding copyright ownership.  The ASF licenses this file
+# to you under the Apache License, Version 2.0 (the
+# "License"); you may not use this file except in compliance
+# with the License.  You may obtain a copy of the License at
+
+#   http://www.apache.org/licenses/LICENSE-2.0
+
+# Unless required by applicable law or agreed to in writing,
+# software distributed under the License is distributed on an
+# "AS IS" BASIS, WITHOUT WARRANTIES OR CONDITIONS OF ANY
+# KIND, either express or implied.  See the License for the
+# specific language governing permissions and limitations
+# under the License.
+
+import asyncio
+import time
+
+import pytest
+
+from dkg.dataclasses import PollingProfile
+from dkg.exceptions import NodeRequestError, OperationNotFinished, OperationTimeout
+from dkg.utils.polling import (
+    AsyncOperationMultiplexer,
+    OperationMultiplexer,
+    OperationPoller,
+)
+
+PROFILE = PollingProfile(initial_interval=0.01, max_interval=0.02, timeout=5)
+
+
+class FakeFetch:
+    """
+    Operation result fetch that isn't finished for the first `pending_polls`
+    polls, or never if it's None.
+    """
+
+    def __init__(self, pending_polls: int | None, result: str = "result"):
+        self.pending_polls = pending_polls
+        self.result = result
+        self.polls = 0
+
+    def __call__(self) -> str:
+        self.polls += 1
+        if self.pending_polls is None or self.polls <= self.pending_polls:
+            raise OperationNotFinished("Operation isn't finished.")
+
+        return self.result
+
+    async def async_call(self) -> str:
+        return self()
+
+
+def create_poller() -> OperationPoller:
+    return OperationPoller({"test": PROFILE})
+
+
+def test_poll_returns_result_once_finished():
+    fetch = FakeFetch(pending_polls=3)
+
+    assert create_poller().poll(fetch, "test") == "result"
+    assert fetch.polls == 4
+
+
+def test_poll_times_out_at_deadline():
+    start = time.monotonic()
+
+    with pytest.raises(OperationTimeout):
+        create_poller().poll(FakeFetch(pending_polls=None), "test", timeout=0.1)
+
+    assert 0.1 <= time.monotonic() - start < 0.5
+
+
+def test_async_poll_returns_result_once_finished():
+    fetch = FakeFetch(pending_polls=3)
+
+    assert asyncio.run(create_poller().async_poll(fetch.async_call, "test")) == (
+        "result"
+    )
+    assert fetch.polls == 4
+
+
+def test_observed_latency_delays_first_poll():
+    poller = create_poller()
+    assert next(poller.delays("test")) == 0
+
+    poller.observe("test", 1.0)
+    assert next(poller.delays("test")) == pytest.approx(0.8)
+
+    # Latencies are smoothed with an exponential moving average
+    poller.observe("test", 2.0)
+    assert poller.get_expected_latency("test") == pytest.approx(1.3)
+    assert next(poller.delays("test")) == pytest.approx(1.04)
+    assert poller.get_expected_latency("other") is None
+
+
+def test_poll_observes_latency():
+    poller = create_poller()
+    poller.poll(FakeFetch(pending_polls=1), "test")
+
+    assert poller.get_expected_latency("test") > 0
+
+
+def test_multiplexer_delivers_results():
+    multiplexer = OperationMultiplexer(create_poller())
+    fetches = [FakeFetch(pending_polls=i, result=str(i)) for i in range(5)]
+
+    futures = [multiplexer.submit(fetch, "test") for fetch in fetches]
+
+    assert [future.result(timeout=5) for future in futures] == [
+        str(i) for i in range(5)
+    ]
+    multiplexer.close()
+
+
+def test_multiplexer_times_out_at_deadline():
+    multiplexer = OperationMultiplexer(
+        OperationPoller(
+            {"test": PollingProfile(initial_interval=1, max_interval=1, timeout=5)}
+        )
+    )
+    start = time.monotonic()
+
+    # Next poll is clamped to the deadline instead of waiting a whole interval
+    future = multiplexer.submit(FakeFetch(pending_polls=None), "test", timeout=0.2)
+
+    assert isinstance(future.exception(timeout=5), OperationTimeout)
+    assert time.monotonic() - start < 0.9
+    multiplexer.close()
+
+
+def test_multiplexer_close_fails_pending_operations():
+    multiplexer = OperationMultiplexer(create_poller())
+    future = multiplexer.submit(FakeFetch(pending_polls=None), "test")
+
+    multiplexer.close()
+
+    assert isinstance(future.exception(timeout=5), NodeRequestError)
+    with pytest.raises(NodeRequestError):
+        multiplexer.submit(FakeFetch(pending_polls=0), "test")
+
+
+def test_async_multiplexer_delivers_results():
+    async def main():
+        multiplexer = AsyncOperationMultiplexer(create_poller())
+        fetches = [FakeFetch(pending_polls=i, result=str(i)) for i in range(5)]
+
+        results = await asyncio.gather(
+            *(multiplexer.submit(fetch.async_call, "test") for fetch in fetches)
+        )
+        await multiplexer.close()
+
+        return results
+
+    assert asyncio.run(main()) == [str(i) for i in range(5)]
+
+
+def test_async_multiplexer_restarts_after_going_idle():
+    async def main():
+        multiplexer = AsyncOperationMultiplexer(create_poller())
+
+        first = await multiplexer.submit(FakeFetch(pending_polls=1).async_call, "test")
+        # Polling task exits once there are no pending operations
+        await asyncio.sleep(0.05)
+        assert multiplexer._task.done()
+
+        second = await asyncio.wait_for(
+            multiplexer.submit(FakeFetch(pending_polls=1).async_call, "test"), 5
+        )
+        await multiplexer.close()
+
+        return first, second
+
+    assert asyncio.run(main()) == ("result", "result")
+
+
+def test_async_multiplexer_close_fails_pending_operations():
+    async def main():
+        multiplexer = AsyncOperationMultiplexer(create_poller())
+        future = multiplexer.submit(FakeFetch(pending_polls=None).async_call, "test")
+        await asyncio.sleep(0.05)
+
+        await multiplexer.close()
+
+        assert isinstance(future.exception(), NodeRequestError)
+        with pytest.raises(NodeRequestError):
+            multiplexer.submit(FakeFetch(pending_polls=0).async_call, "test")
+
+    asyncio.run(main())
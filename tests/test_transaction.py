@@ -0,0 +1,242 @@
+# Licensed to the Apache Software Foundation (ASF) under one
+# or more contributor license agreements.  See the NOTICE file
+# distributed with this work for additional information
+# regarding copyright ownership.  The ASF licenses this file
+# to you under the Apache License, Version 2.0 (the
+# "License"); you may not use this file except in compliance
+# with the License.  You may obtain a copy of the License at
+
+#   http://www.apache.org/licenses/LICENSE-2.0
+
+# Unless required by applicable law or agreed to in writing,
+# software distributed under the License is distributed on an
+# "AS IS" BASIS, WITHOUT WARRANTIES OR CONDITIONS OF ANY
+# KIND, either express or implied.  See the License for the
+# specific language governing permissions and limitations
+# under the License.
+
+from types import SimpleNamespace
+
+import pytest
+from hexbytes import HexBytes
+from web3.exceptions import TimeExhausted, TransactionNotFound
+
+from dkg.exceptions import TransactionDropped, TransactionReplaced
+from dkg.providers import transaction
+from dkg.providers.blockchain import BlockchainProvider
+from dkg.providers.transaction import NonceManager, PendingTransaction
+from dkg.utils.steps import run_steps
+
+SENDER = "0x" + "22" * 20
+TX_HASH = HexBytes("0x01")
+RAW_TRANSACTION = HexBytes("0x02")
+RECEIPT = {"status": 1}
+
+
+class StubEth:
+    """
+    Answers every call with the next scripted response of its method, raising
+    it if it's an exception, and records the arguments the calls were made with.
+    """
+
+    def __init__(self, **responses):
+        self.responses = {method: list(values) for method, values in responses.items()}
+        self.calls = []
+
+    def __getattr__(self, method):
+        def call(*args, **kwargs):
+            self.calls.append((method, args, kwargs))
+
+            response = self.responses[method].pop(0)
+            if isinstance(response, Exception):
+                raise response
+
+            return response
+
+        return call
+
+    def count(self, method: str) -> int:
+        return sum(1 for name, _, _ in self.calls if name == method)
+
+
+class FakeClock:
+    def __init__(self):
+        self.now = 0.0
+
+    def monotonic(self) -> float:
+        return self.now
+
+
+@pytest.fixture
+def clock(monkeypatch):
+    clock = FakeClock()
+    monkeypatch.setattr(transaction.time, "monotonic", clock.monotonic)
+
+    return clock
+
+
+def pending_transaction(eth: StubEth, nonce: int = 5) -> PendingTransaction:
+    return PendingTransaction(
+        SimpleNamespace(eth=eth), SENDER, TX_HASH, nonce, RAW_TRANSACTION
+    )
+
+
+def test_receipt_is_returned(clock):
+    eth = StubEth(wait_for_transaction_receipt=[RECEIPT])
+
+    assert pending_transaction(eth).result() == RECEIPT
+    assert eth.count("get_transaction") == 0
+
+
+def test_replaced_transaction_is_reported(clock):
+    eth = StubEth(
+        wait_for_transaction_receipt=[TimeExhausted()],
+        get_transaction=[TransactionNotFound("")],
+        get_transaction_count=[6],
+        get_transaction_receipt=[TransactionNotFound("")],
+    )
+
+    with pytest.raises(TransactionReplaced):
+        pending_transaction(eth, nonce=5).result()
+
+    assert eth.count("send_raw_transaction") == 0
+
+
+def test_transaction_mined_while_waiting_isnt_replaced(clock):
+    eth = StubEth(
+        wait_for_transaction_receipt=[TimeExhausted()],
+        get_transaction=[TransactionNotFound("")],
+        get_transaction_count=[6],
+        get_transaction_receipt=[RECEIPT],
+    )
+
+    assert pending_transaction(eth, nonce=5).result() == RECEIPT
+
+
+def test_dropped_transaction_is_rebroadcast(clock):
+    eth = StubEth(
+        wait_for_transaction_receipt=[TimeExhausted(), RECEIPT],
+        get_transaction=[TransactionNotFound("")],
+        get_transaction_count=[5],
+        send_raw_transaction=[TX_HASH],
+    )
+
+    assert pending_transaction(eth, nonce=5).result() == RECEIPT
+    assert [
+        args for method, args, _ in eth.calls if method == "send_raw_transaction"
+    ] == [(RAW_TRANSACTION,)]
+
+
+def test_rebroadcast_rejected_as_already_known_keeps_waiting(clock):
+    eth = StubEth(
+        wait_for_transaction_receipt=[TimeExhausted(), RECEIPT],
+        get_transaction=[TransactionNotFound("")],
+        get_transaction_count=[5],
+        send_raw_transaction=[ValueError({"message": "already known"})],
+    )
+
+    assert pending_transaction(eth, nonce=5).result() == RECEIPT
+
+
+def test_failed_rebroadcast_is_reported(clock):
+    eth = StubEth(
+        wait_for_transaction_receipt=[TimeExhausted()],
+        get_transaction=[TransactionNotFound("")],
+        get_transaction_count=[5],
+        send_raw_transaction=[ValueError({"message": "insufficient funds"})],
+    )
+
+    with pytest.raises(TransactionDropped):
+        pending_transaction(eth, nonce=5).result()
+
+
+def test_deadline_is_kept_across_recovery_intervals(clock):
+    def wait_for_transaction_receipt(tx_hash, timeout):
+        waits.append(timeout)
+        clock.now += timeout
+        raise TimeExhausted()
+
+    waits = []
+    eth = StubEth(get_transaction=[{"nonce": 5}] * 3)
+    eth.wait_for_transaction_receipt = wait_for_transaction_receipt
+
+    with pytest.raises(TimeExhausted):
+        pending_transaction(eth).result(timeout=100)
+
+    interval = PendingTransaction.RECOVERY_INTERVAL
+    assert waits == [interval, interval, interval, 100 - 3 * interval]
+    assert clock.now == 100
+    assert eth.count("get_transaction") == 3
+
+
+def test_nonce_lock_is_released_when_transaction_count_fails():
+    eth = StubEth(get_transaction_count=[ConnectionError(), 7])
+    nonce_manager = NonceManager(SimpleNamespace(eth=eth), SENDER)
+
+    with pytest.raises(ConnectionError):
+        nonce_manager.acquire()
+    assert not nonce_manager._lock.locked()
+
+    assert nonce_manager.acquire() == 7
+    nonce_manager.release(7)
+    assert not nonce_manager._lock.locked()
+
+
+class StubContractFunction:
+    def build_transaction(self, options):
+        return options
+
+
+def stub_provider(eth: StubEth) -> SimpleNamespace:
+    return SimpleNamespace(
+        w3=SimpleNamespace(eth=eth),
+        account=SimpleNamespace(
+            address=SENDER,
+            sign_transaction=lambda tx: SimpleNamespace(rawTransaction=tx["nonce"]),
+        ),
+        nonce_manager=NonceManager(SimpleNamespace(eth=eth), SENDER),
+        pending_transaction_class=PendingTransaction,
+    )
+
+
+def send_transaction(provider: SimpleNamespace) -> PendingTransaction:
+    return run_steps(
+        BlockchainProvider._send_transaction(
+            provider, StubContractFunction(), {"from": SENDER}
+        )
+    )
+
+
+def test_stale_nonce_is_resynchronized_and_retried_once():
+    eth = StubEth(
+        get_transaction_count=[3, 8],
+        send_raw_transaction=[ValueError("nonce too low"), TX_HASH],
+    )
+    provider = stub_provider(eth)
+
+    assert send_transaction(provider).nonce == 8
+    assert not provider.nonce_manager._lock.locked()
+
+    sent_nonces = [
+        args[0] for method, args, _ in eth.calls if method == "send_raw_transaction"
+    ]
+    assert sent_nonces == [3, 8]
+
+
+@pytest.mark.parametrize(
+    "errors",
+    [
+        [ValueError("insufficient funds")],
+        [ValueError("nonce too low"), ValueError("nonce too low")],
+    ],
+    ids=["other-error", "repeated-nonce-error"],
+)
+def test_failed_send_releases_nonce(errors):
+    eth = StubEth(get_transaction_count=[3, 3], send_raw_transaction=errors)
+    provider = stub_provider(eth)
+
+    with pytest.raises(ValueError):
+        send_transaction(provider)
+
+    assert eth.count("send_raw_transaction") == len(errors)
+    assert not provider.nonce_manager._lock.locked()